@@ -0,0 +1,14 @@
+"""Start the MCP RPC server in FreeCADCmd: ``FreeCADCmd headless_server.py``."""
+
+import os
+import sys
+
+try:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+except NameError:
+    # Not run as a file; the addon's Mod directory is already on sys.path
+    pass
+
+from rpc_server.headless import main
+
+main()
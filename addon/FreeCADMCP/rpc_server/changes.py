@@ -0,0 +1,214 @@
+"""Per-document change tracking for incremental reads.
+
+``ChangeTracker`` is a FreeCAD document observer. Every object creation,
+property change or deletion bumps its document's revision and stamps the
+object with it. A change token is ``"<epoch>-<revision>"``. Given a token,
+``diff`` names the objects added, changed and removed since then, so
+``get_objects(doc, since=token)`` serializes only those.
+
+The epoch is drawn at random whenever a document starts being tracked
+(document created, tracker installed) or its history becomes unreliable
+(undo, redo, aborted transaction). A token from another epoch, or older than
+the oldest remembered deletion, cannot be diffed: the caller gets a full
+listing instead, flagged as a reset.
+
+Each object also has a fingerprint, a 64-bit hash of its name, the revision
+it last changed at and its recompute state (``obj.State``: touched, invalid,
+error). A document's fingerprint is the XOR of its objects' fingerprints,
+updated as they change, prefixed with the epoch. Equal fingerprints mean the
+same objects, none changed or recomputed into another state in between; an
+object created and deleted again leaves no trace.
+"""
+
+import secrets
+import threading
+
+import FreeCAD
+
+# Deleted object names remembered per document before the oldest are dropped
+_MAX_TOMBSTONES = 10000
+
+_MASK64 = (1 << 64) - 1
+
+
+def _recompute_state(obj):
+    try:
+        return tuple(obj.State)
+    except Exception:
+        return ()
+
+
+class _DocumentChanges:
+    __slots__ = (
+        "epoch", "revision", "floor", "created", "modified", "removed",
+        "fingerprints", "digest", "seeded",
+    )
+
+    def __init__(self):
+        self.epoch = secrets.token_hex(4)
+        self.revision = 0
+        # Tokens older than this can no longer be diffed
+        self.floor = 0
+        # Object name -> revision it was created / last modified / deleted at
+        self.created = {}
+        self.modified = {}
+        self.removed = {}
+        # Object name -> fingerprint; digest is their XOR. Objects untouched
+        # since tracking began are added on the first fingerprint request
+        self.fingerprints = {}
+        self.digest = 0
+        self.seeded = False
+
+    def bump(self):
+        self.revision += 1
+        return self.revision
+
+    def stamp(self, name, recompute_state):
+        self.unstamp(name)
+        fingerprint = hash((name, self.modified.get(name, 0), recompute_state)) & _MASK64
+        self.fingerprints[name] = fingerprint
+        self.digest ^= fingerprint
+
+    def unstamp(self, name):
+        self.digest ^= self.fingerprints.pop(name, 0)
+
+    @property
+    def token(self):
+        return f"{self.epoch}-{self.revision}"
+
+
+class ChangeTracker:
+    """Document observer keeping a revision per document and object."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs = {}
+        self._installed = False
+
+    def install(self):
+        if not self._installed:
+            with self._lock:
+                # Changes made while unregistered were missed
+                self._docs.clear()
+            FreeCAD.addDocumentObserver(self)
+            self._installed = True
+
+    def uninstall(self):
+        if self._installed:
+            FreeCAD.removeDocumentObserver(self)
+            self._installed = False
+
+    def _state(self, doc_name):
+        state = self._docs.get(doc_name)
+        if state is None:
+            state = self._docs[doc_name] = _DocumentChanges()
+        return state
+
+    def token(self, doc_name):
+        with self._lock:
+            return self._state(doc_name).token
+
+    def diff(self, doc_name, token):
+        """Changes since *token* as ``(added, changed, removed, new_token)``.
+
+        added and changed are sets of object names, removed a sorted list.
+        Returns None when *token* cannot be diffed (other epoch, too old,
+        malformed); the caller should then send everything.
+        """
+        with self._lock:
+            state = self._state(doc_name)
+            epoch, _, revision = str(token).rpartition("-")
+            try:
+                revision = int(revision)
+            except ValueError:
+                return None
+            if epoch != state.epoch or revision < state.floor or revision > state.revision:
+                return None
+            added = {name for name, rev in state.created.items() if rev > revision}
+            changed = {
+                name for name, rev in state.modified.items()
+                if rev > revision and name not in added
+            }
+            removed = sorted(name for name, rev in state.removed.items() if rev > revision)
+            return added, changed, removed, state.token
+
+    def fingerprint(self, doc, names=None):
+        """``(fingerprint, token, objects)`` of document *doc*.
+
+        objects maps each of *names* found in the document (every object
+        when *names* is True) to its fingerprint, or is None when *names*
+        is None. Must run on the thread owning the document the first time,
+        when objects not changed since tracking began are fingerprinted.
+        """
+        with self._lock:
+            state = self._state(doc.Name)
+            if not state.seeded:
+                for obj in doc.Objects:
+                    if obj.Name not in state.fingerprints:
+                        state.stamp(obj.Name, _recompute_state(obj))
+                state.seeded = True
+            if names is True:
+                names = state.fingerprints
+            objects = None
+            if names is not None:
+                objects = {
+                    name: f"{state.fingerprints[name]:016x}" for name in names if name in state.fingerprints
+                }
+            return f"{state.epoch}-{state.digest:016x}", state.token, objects
+
+    def _reset(self, doc):
+        with self._lock:
+            self._docs[doc.Name] = _DocumentChanges()
+
+    # --- FreeCAD observer slots (called on the thread making the change) ---
+
+    def slotCreatedDocument(self, doc):
+        self._reset(doc)
+
+    def slotDeletedDocument(self, doc):
+        with self._lock:
+            self._docs.pop(doc.Name, None)
+
+    def slotUndoDocument(self, doc):
+        self._reset(doc)
+
+    def slotRedoDocument(self, doc):
+        self._reset(doc)
+
+    def slotAbortTransaction(self, doc):
+        self._reset(doc)
+
+    def slotCreatedObject(self, obj):
+        with self._lock:
+            state = self._state(obj.Document.Name)
+            rev = state.bump()
+            state.created[obj.Name] = rev
+            state.modified[obj.Name] = rev
+            state.removed.pop(obj.Name, None)
+            state.stamp(obj.Name, _recompute_state(obj))
+
+    def slotChangedObject(self, obj, prop):
+        with self._lock:
+            state = self._state(obj.Document.Name)
+            state.modified[obj.Name] = state.bump()
+            state.stamp(obj.Name, _recompute_state(obj))
+
+    def slotRecomputedObject(self, obj):
+        # No new revision: the summary of an object does not include its state
+        with self._lock:
+            state = self._state(obj.Document.Name)
+            state.stamp(obj.Name, _recompute_state(obj))
+
+    def slotDeletedObject(self, obj):
+        with self._lock:
+            state = self._state(obj.Document.Name)
+            state.removed[obj.Name] = state.bump()
+            state.created.pop(obj.Name, None)
+            state.modified.pop(obj.Name, None)
+            state.unstamp(obj.Name)
+            if len(state.removed) > _MAX_TOMBSTONES:
+                # Insertion order is deletion order
+                state.floor = state.removed.pop(next(iter(state.removed)))
+
+
+changes = ChangeTracker()
@@ -0,0 +1,141 @@
+"""Negotiated compression of RPC bodies.
+
+gzip is always available; zstd is used when Python 3.14's
+``compression.zstd`` or the ``zstandard`` package can be imported.
+``CODECS`` lists what this side can decode, best first. Each side tells the
+other what it accepts (``Accept-Encoding`` on XML-RPC, accept bits in the
+framed header) and a sender only compresses bodies above the configured
+threshold, with the first codec both sides support.
+
+The MCP server's copy of this module is ``freecad_mcp.compression``.
+"""
+
+import zlib
+
+try:
+    from compression import zstd as _zstd  # Python 3.14+
+except ImportError:
+    _zstd = None
+    try:
+        import zstandard as _zstandard
+    except ImportError:
+        _zstandard = None
+
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+if _zstd is not None:
+
+    def _zstd_compress(data):
+        return _zstd.compress(data, ZSTD_LEVEL)
+
+    def _zstd_decompress(data, max_size):
+        return _zstd.ZstdDecompressor().decompress(data, max_length=max_size + 1)
+
+elif _zstandard is not None:
+
+    def _zstd_compress(data):
+        return _zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+    def _zstd_decompress(data, max_size):
+        with _zstandard.ZstdDecompressor().stream_reader(data) as reader:
+            return reader.read(max_size + 1)
+
+else:
+    _zstd_compress = _zstd_decompress = None
+
+
+def _gzip_compress(data):
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_decompress(data, max_size):
+    return zlib.decompressobj(31).decompress(data, max_size + 1)
+
+
+_COMPRESSORS = {"gzip": _gzip_compress}
+_DECOMPRESSORS = {"gzip": _gzip_decompress}
+if _zstd_compress is not None:
+    _COMPRESSORS["zstd"] = _zstd_compress
+    _DECOMPRESSORS["zstd"] = _zstd_decompress
+
+CODECS = tuple(c for c in ("zstd", "gzip") if c in _COMPRESSORS)
+
+# Framed header flags: bits 0-1 name the codec of the frame's JSON section,
+# bits 4-5 say which codecs the sender accepts in the reply
+FLAG_CODEC_MASK = 0x03
+_CODEC_IDS = {"gzip": 1, "zstd": 2}
+_CODEC_NAMES = {v: k for k, v in _CODEC_IDS.items()}
+_ACCEPT_SHIFT = 4
+KNOWN_FLAGS = FLAG_CODEC_MASK | (FLAG_CODEC_MASK << _ACCEPT_SHIFT)
+
+
+def choose(accepted):
+    """The best local codec among *accepted*, or None."""
+    for codec in CODECS:
+        if codec in accepted:
+            return codec
+    return None
+
+
+def compress(codec, data):
+    return _COMPRESSORS[codec](data)
+
+
+def decompress(codec, data, max_size):
+    """Decompress *data*, refusing output larger than *max_size* bytes."""
+    decoder = _DECOMPRESSORS.get(codec)
+    if decoder is None:
+        raise ValueError(f"Unsupported content encoding: {codec}")
+    try:
+        out = decoder(data, max_size)
+    except Exception as e:
+        raise ValueError(f"Corrupt {codec} body: {e}") from e
+    if len(out) > max_size:
+        raise ValueError(f"Decompressed body exceeds {max_size} bytes")
+    return out
+
+
+def parse_accept_encoding(header):
+    """Codec names from an ``Accept-Encoding`` header, ignoring q=0 entries."""
+    accepted = set()
+    for item in (header or "").split(","):
+        name, *params = item.split(";")
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name.strip() and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def codec_flags(codec):
+    return _CODEC_IDS[codec] if codec else 0
+
+
+def accept_flags(codecs):
+    flags = 0
+    for codec in codecs:
+        flags |= _CODEC_IDS[codec]
+    return flags << _ACCEPT_SHIFT
+
+
+def codec_from_flags(flags):
+    codec_id = flags & FLAG_CODEC_MASK
+    if not codec_id:
+        return None
+    try:
+        return _CODEC_NAMES[codec_id]
+    except KeyError:
+        raise ValueError(f"Unsupported frame codec: {codec_id}") from None
+
+
+def accepted_from_flags(flags):
+    bits = (flags >> _ACCEPT_SHIFT) & FLAG_CODEC_MASK
+    return {name for codec_id, name in _CODEC_NAMES.items() if bits & codec_id}
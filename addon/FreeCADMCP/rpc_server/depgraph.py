@@ -0,0 +1,191 @@
+"""Document dependency graphs, kept current from observer events.
+
+``DependencyGraph`` holds, per document, each object's ``OutList`` (the
+objects it depends on) and the reverse edges. It is read in full the first
+time a document is queried; after that, as a document observer, it only
+re-reads the links of objects created, deleted or changed since the last
+query.
+
+Graphs are exported in compressed sparse row form: ``names`` lists the
+objects, and the dependencies of ``names[i]`` are
+``names[j] for j in targets[offsets[i]:offsets[i + 1]]``.
+"""
+
+import threading
+from collections import deque
+
+import FreeCAD
+
+# Property changes that never add or remove links, so need no re-read.
+# Shape alone changes on every recompute.
+_NON_LINK_PROPERTIES = frozenset({"Shape", "Placement", "Label", "Label2", "Visibility"})
+
+
+def _links(obj):
+    """Names in *obj*'s OutList, in order, without repeats."""
+    return tuple(dict.fromkeys(dep.Name for dep in obj.OutList))
+
+
+class _DocumentGraph:
+    def __init__(self, doc):
+        self.out = {}  # object name -> names it depends on
+        self.inn = {}  # object name -> names depending on it
+        for obj in doc.Objects:
+            self.set_links(obj.Name, _links(obj))
+
+    def set_links(self, name, targets):
+        old = self.out.get(name, ())
+        for target in old:
+            if target not in targets:
+                self.inn[target].discard(name)
+        for target in targets:
+            self.inn.setdefault(target, set()).add(name)
+        self.out[name] = targets
+
+    def remove(self, name):
+        for target in self.out.pop(name, ()):
+            self.inn[target].discard(name)
+        for source in self.inn.pop(name, ()):
+            self.out[source] = tuple(t for t in self.out[source] if t != name)
+
+    def _walk(self, edges, starts, depth):
+        """Names reachable from *starts* along *edges* within *depth* steps, with their distance."""
+        distance = {name: 0 for name in starts}
+        pending = deque(starts)
+        while pending:
+            name = pending.popleft()
+            if depth is not None and distance[name] >= depth:
+                continue
+            for nxt in edges.get(name, ()):
+                if nxt not in distance and nxt in self.out:
+                    distance[nxt] = distance[name] + 1
+                    pending.append(nxt)
+        return distance
+
+    def export(self, root=None, depth=None):
+        """The whole graph, or what *root* depends on within *depth* steps, as CSR arrays."""
+        names = list(self.out) if root is None else list(self._walk(self.out, [root], depth))
+        index = {name: i for i, name in enumerate(names)}
+        offsets, targets = [0], []
+        for name in names:
+            targets.extend(index[t] for t in self.out[name] if t in index)
+            offsets.append(len(targets))
+        return {"names": names, "offsets": offsets, "targets": targets}
+
+    def downstream(self, names, depth=None):
+        """Objects depending on *names*, directly or not, in recompute order.
+
+        Returns ``{"names", "distance"}``: each affected object (the given
+        ones included, at distance 0) ordered so that every object comes
+        after everything it depends on, and its shortest link distance
+        from the given objects.
+        """
+        distance = self._walk(self.inn, names, depth)
+        # Kahn's algorithm over the affected subgraph
+        remaining = {name: sum(1 for t in self.out[name] if t in distance) for name in distance}
+        ready = deque(name for name in distance if not remaining[name])
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for source in self.inn.get(name, ()):
+                if source in remaining:
+                    remaining[source] -= 1
+                    if not remaining[source]:
+                        ready.append(source)
+        if len(order) < len(distance):
+            # A dependency cycle; FreeCAD refuses to recompute these anyway
+            placed = set(order)
+            order.extend(name for name in distance if name not in placed)
+        return {"names": order, "distance": [distance[name] for name in order]}
+
+
+class DependencyGraph:
+    """Per-document dependency graphs, kept current by document observer events.
+
+    Queries must run on the thread owning the documents (the GUI thread).
+    Without :meth:`install`, every query re-reads the whole document.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._graphs = {}  # document name -> _DocumentGraph
+        self._dirty = {}  # document name -> object names to re-read
+        self._installed = False
+
+    def install(self):
+        if not self._installed:
+            self.clear()
+            FreeCAD.addDocumentObserver(self)
+            self._installed = True
+
+    def uninstall(self):
+        if self._installed:
+            FreeCAD.removeDocumentObserver(self)
+            self._installed = False
+            self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._graphs.clear()
+            self._dirty.clear()
+
+    def graph(self, doc):
+        """The up-to-date graph of *doc*."""
+        with self._lock:
+            graph = self._graphs.get(doc.Name)
+            dirty = self._dirty.pop(doc.Name, ())
+        if graph is None or not self._installed:
+            graph = _DocumentGraph(doc)
+        else:
+            for name in dirty:
+                obj = doc.getObject(name)
+                if obj is None:
+                    graph.remove(name)
+                else:
+                    graph.set_links(name, _links(obj))
+        if self._installed:
+            with self._lock:
+                self._graphs[doc.Name] = graph
+        return graph
+
+    def _mark(self, obj):
+        with self._lock:
+            doc_name = obj.Document.Name
+            if doc_name in self._graphs:
+                self._dirty.setdefault(doc_name, set()).add(obj.Name)
+
+    def _drop(self, doc):
+        with self._lock:
+            self._graphs.pop(doc.Name, None)
+            self._dirty.pop(doc.Name, None)
+
+    # --- FreeCAD observer slots (called on the thread making the change) ---
+
+    def slotCreatedObject(self, obj):
+        self._mark(obj)
+
+    def slotChangedObject(self, obj, prop):
+        if prop not in _NON_LINK_PROPERTIES:
+            self._mark(obj)
+
+    def slotDeletedObject(self, obj):
+        self._mark(obj)
+
+    def slotCreatedDocument(self, doc):
+        self._drop(doc)
+
+    def slotDeletedDocument(self, doc):
+        self._drop(doc)
+
+    def slotUndoDocument(self, doc):
+        self._drop(doc)
+
+    def slotRedoDocument(self, doc):
+        self._drop(doc)
+
+    def slotAbortTransaction(self, doc):
+        self._drop(doc)
+
+
+dependency_graph = DependencyGraph()
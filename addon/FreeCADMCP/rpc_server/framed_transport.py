@@ -0,0 +1,194 @@
+"""Length-prefixed framed transport for FreeCADRPC.
+
+A persistent-connection alternative to XML-RPC. Every message is one frame:
+
+    flags: u8 | json_len: u32 | blob_len: u32 | json bytes | blob bytes
+
+(network byte order). The JSON part carries the request
+``{"id", "method", "params"}`` (plus an optional W3C ``traceparent``) or
+the response ``{"id", "result"}`` / ``{"id", "error"}``. ``bytes`` values anywhere in params or result are moved
+into the blob and replaced by ``{"__bytes__": [offset, length]}``, so images
+and buffers cross the wire raw instead of base64-in-XML.
+
+``flags`` bits 0-1 name the codec the JSON part is compressed with (0 none,
+1 gzip, 2 zstd; ``json_len`` is then the compressed length) and bits 4-5
+list the codecs the sender accepts in the reply. Blobs are never compressed:
+they are images and buffers that are already dense. A client only sets flags
+after ``get_transport_info`` listed the codecs under ``compression``, so
+peers that predate compression keep exchanging flag-free frames.
+
+The MCP server side of this protocol lives in ``freecad_mcp.framed_client``.
+"""
+
+import json
+import socketserver
+import struct
+import time
+
+from . import compression, tracing
+
+PROTOCOL_VERSION = 1
+
+_HEADER = struct.Struct("!BII")
+_MAX_FRAME_BYTES = 512 * 1024 * 1024
+_BYTES_KEY = "__bytes__"
+
+
+def _extract_blobs(value, blobs, offset):
+    """Replace bytes in *value* with blob references. Returns (value, offset)."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        blobs.append(value)
+        ref = {_BYTES_KEY: [offset, len(value)]}
+        return ref, offset + len(value)
+    if isinstance(value, dict):
+        out = {}
+        for k, v in value.items():
+            out[k], offset = _extract_blobs(v, blobs, offset)
+        return out, offset
+    if isinstance(value, (list, tuple)):
+        out = []
+        for v in value:
+            item, offset = _extract_blobs(v, blobs, offset)
+            out.append(item)
+        return out, offset
+    return value, offset
+
+
+def _restore_blobs(value, blob):
+    if isinstance(value, dict):
+        ref = value.get(_BYTES_KEY)
+        if ref is not None and len(value) == 1:
+            start, length = ref
+            return bytes(blob[start:start + length])
+        return {k: _restore_blobs(v, blob) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_restore_blobs(v, blob) for v in value]
+    return value
+
+
+def write_frame(wfile, message, codec=None, threshold=0):
+    """Write *message*, compressing its JSON part with *codec* above *threshold* bytes.
+
+    Returns the seconds spent compressing.
+    """
+    blobs = []
+    payload, blob_len = _extract_blobs(message, blobs, 0)
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    flags = 0
+    elapsed = 0.0
+    if codec is not None and threshold and len(data) > threshold:
+        start = time.perf_counter()
+        data = compression.compress(codec, data)
+        elapsed = time.perf_counter() - start
+        flags = compression.codec_flags(codec)
+    wfile.write(b"".join([_HEADER.pack(flags, len(data), blob_len), data, *blobs]))
+    wfile.flush()
+    return elapsed
+
+
+def _read_exact(rfile, size):
+    data = rfile.read(size)
+    if len(data) != size:
+        raise ConnectionError("Connection closed mid-frame")
+    return data
+
+
+def read_frame(rfile):
+    """Read one frame.
+
+    Returns ``(message, flags)``, or ``(None, 0)`` on clean EOF.
+    """
+    header = rfile.read(_HEADER.size)
+    if not header:
+        return None, 0
+    if len(header) != _HEADER.size:
+        raise ConnectionError("Connection closed mid-frame")
+    flags, json_len, blob_len = _HEADER.unpack(header)
+    if flags & ~compression.KNOWN_FLAGS:
+        raise ValueError(f"Unsupported frame flags: {flags:#x}")
+    if json_len + blob_len > _MAX_FRAME_BYTES:
+        raise ValueError(f"Frame too large: {json_len + blob_len} bytes")
+    data = _read_exact(rfile, json_len)
+    codec = compression.codec_from_flags(flags)
+    if codec is not None:
+        data = compression.decompress(codec, data, _MAX_FRAME_BYTES - blob_len)
+    message = json.loads(data)
+    if blob_len:
+        message = _restore_blobs(message, _read_exact(rfile, blob_len))
+    return message, flags
+
+
+class FramedRequestHandler(socketserver.StreamRequestHandler):
+    """Serves framed requests on one persistent connection until EOF."""
+
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        observe = self.server.observe
+        while True:
+            try:
+                # Block until the next request starts so idle time on the
+                # persistent connection is not counted as decode time
+                if not self.rfile.peek(1):
+                    return
+                start = time.perf_counter()
+                request, flags = read_frame(self.rfile)
+            except (ConnectionError, ValueError, OSError):
+                return
+            if request is None:
+                return
+            decoded = time.perf_counter()
+            method = request.get("method")
+            response = {"id": request.get("id")}
+            try:
+                if not isinstance(method, str) or method.startswith("_"):
+                    raise AttributeError(f"Method '{method}' is not supported")
+                with tracing.activate(tracing.parse_traceparent(request.get("traceparent"))):
+                    response["result"] = self.server.dispatch(method, tuple(request.get("params", ())))
+            except Exception as e:
+                response["error"] = f"{type(e).__name__}: {e}"
+            codec = compression.choose(compression.accepted_from_flags(flags))
+            try:
+                encode_start = time.perf_counter()
+                try:
+                    compress_time = write_frame(self.wfile, response, codec, self.server.compression_threshold)
+                except (TypeError, ValueError) as e:
+                    # The result is not JSON-encodable; nothing was written yet,
+                    # so report it rather than dropping the connection
+                    response = {"id": request.get("id"), "error": f"{type(e).__name__}: cannot encode result: {e}"}
+                    compress_time = write_frame(self.wfile, response, codec, self.server.compression_threshold)
+            except OSError:
+                return
+            if observe is not None:
+                observe("decode", decoded - start, method)
+                observe("encode", time.perf_counter() - encode_start, method)
+                if compress_time:
+                    observe("compress", compress_time, method)
+
+
+class FramedRPCServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Framed transport listener sharing dispatch and IP filtering with XML-RPC.
+
+    *dispatch* is ``(method, params) -> result``, normally the XML-RPC
+    server's ``_dispatch`` so worker-safe routing and GUI-call limits apply
+    identically on both transports. *verify_request* filters clients.
+    *observe* is ``(phase, seconds, method)``, called with the decode and
+    encode time of each request. Responses whose JSON part exceeds
+    *compression_threshold* bytes are compressed when the client accepts a
+    codec; 0 disables compression.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, addr, dispatch, verify_request=None, observe=None, compression_threshold=0):
+        self.dispatch = dispatch
+        self._verify = verify_request
+        self.observe = observe
+        self.compression_threshold = compression_threshold
+        super().__init__(addr, FramedRequestHandler)
+
+    def verify_request(self, request, client_address):
+        if self._verify is None:
+            return True
+        return self._verify(request, client_address)
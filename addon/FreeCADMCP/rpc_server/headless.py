@@ -0,0 +1,50 @@
+"""Run the RPC server inside FreeCADCmd, without a GUI.
+
+    FreeCADCmd /path/to/FreeCADMCP/headless_server.py
+
+Document work runs on a dedicated executor thread instead of the Qt main
+loop (see ``HeadlessTaskExecutor``); every RPC except screenshots behaves as
+in the GUI, and screenshot calls return None. Ports come from the
+``FREECAD_MCP_PORT`` (default 9875) and ``FREECAD_MCP_FRAMED_PORT``
+(default: the ``framed_port`` setting) environment variables; remote access
+and allowed IPs come from the usual settings file.
+"""
+
+import os
+import signal
+import threading
+
+import FreeCAD
+
+from . import rpc_server
+
+
+def serve(port=9875, framed_port=None):
+    """Start the server and block until SIGINT or SIGTERM."""
+    if FreeCAD.GuiUp:
+        raise RuntimeError("FreeCAD GUI is running; use the MCP workbench to start the server")
+
+    stop = threading.Event()
+    previous = {}
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        previous[sig] = signal.signal(sig, lambda signum, frame: stop.set())
+
+    FreeCAD.Console.PrintMessage(rpc_server.start_rpc_server(port=port, framed_port=framed_port) + "\n")
+    FreeCAD.Console.PrintMessage("Headless MCP RPC server running; send SIGINT or SIGTERM to stop.\n")
+    try:
+        # Wake periodically: a bare wait() would defer signal handling on some platforms
+        while not stop.wait(1.0):
+            pass
+    finally:
+        FreeCAD.Console.PrintMessage(rpc_server.stop_rpc_server() + "\n")
+        if isinstance(rpc_server._gui_dispatcher, rpc_server.HeadlessTaskExecutor):
+            rpc_server._gui_dispatcher.stop()
+            rpc_server._gui_dispatcher = None
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+
+def main():
+    port = int(os.environ.get("FREECAD_MCP_PORT", 9875))
+    framed_port = os.environ.get("FREECAD_MCP_FRAMED_PORT")
+    serve(port=port, framed_port=int(framed_port) if framed_port is not None else None)
@@ -0,0 +1,174 @@
+"""Background jobs for long-running FreeCAD operations.
+
+A job is a function ``fn(job)`` run on a job worker thread. It hands work
+that must touch documents to the GUI thread with :meth:`Job.run_in_gui`
+and runs everything else (external mesher processes, file I/O) directly,
+so the GUI only ever sees short slices. Callers get a job id immediately
+and poll ``status``/``result``; nothing ever waits on a hard timeout.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from . import tracing
+from .metrics import method_context
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+_FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+# How often a job waiting on the GUI thread re-checks for cancellation
+_CANCEL_POLL_INTERVAL = 0.2
+
+
+class JobCancelled(Exception):
+    """Raised inside a job once it has been cancelled."""
+
+
+class Job:
+    def __init__(self, kind, submit_gui_task):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.state = QUEUED
+        self.progress = 0.0
+        self.message = "Queued"
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self._submit_gui_task = submit_gui_task
+        self._trace_parent = tracing.current_span()
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def done(self):
+        return self.state in _FINISHED_STATES
+
+    def report(self, progress, message=None):
+        """Record progress in [0, 1] and an optional human-readable step."""
+        with self._lock:
+            self.progress = max(0.0, min(1.0, float(progress)))
+            if message is not None:
+                self.message = message
+
+    def check_cancelled(self):
+        if self._cancelled.is_set():
+            raise JobCancelled()
+
+    def run_in_gui(self, task):
+        """Run *task* on the GUI thread, waiting without a deadline.
+
+        Raises :class:`JobCancelled` if the job is cancelled while the task
+        is still queued; a task that already started runs to completion.
+        """
+        self.check_cancelled()
+        future = self._submit_gui_task(task)
+        while True:
+            try:
+                return future.result(timeout=_CANCEL_POLL_INTERVAL)
+            except FutureTimeoutError:
+                if self._cancelled.is_set() and future.cancel():
+                    raise JobCancelled()
+
+    def status(self):
+        with self._lock:
+            return {
+                "job_id": self.id,
+                "kind": self.kind,
+                "state": self.state,
+                "progress": self.progress,
+                "message": self.message,
+                "created": self.created,
+                "started": self.started,
+                "finished": self.finished,
+            }
+
+
+class JobManager:
+    """Runs jobs on a small worker pool and keeps recent ones for polling."""
+
+    def __init__(self, submit_gui_task, max_workers=2, max_finished=100):
+        self._submit_gui_task = submit_gui_task
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-job")
+        self._jobs = {}
+        self._futures = {}
+        self._max_finished = max_finished
+        self._lock = threading.Lock()
+
+    def submit(self, kind, fn):
+        job = Job(kind, self._submit_gui_task)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+            self._futures[job.id] = self._executor.submit(self._run, job, fn)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Request cancellation. Returns False for unknown or finished jobs."""
+        job = self.get(job_id)
+        if job is None or job.done:
+            return False
+        job._cancelled.set()
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None and future.cancel():
+            self._finish(job, CANCELLED, message="Cancelled before start")
+        return True
+
+    def _run(self, job, fn):
+        with job._lock:
+            job.state = RUNNING
+            job.started = time.time()
+            job.message = "Running"
+        try:
+            job.check_cancelled()
+            with (
+                method_context(f"job:{job.kind}"),
+                tracing.activate(job._trace_parent),
+                tracing.span(f"job {job.kind}", **{"job.id": job.id}),
+            ):
+                result = fn(job)
+        except JobCancelled:
+            self._finish(job, CANCELLED, message="Cancelled")
+        except Exception as e:
+            self._finish(job, FAILED, error=str(e), message="Failed")
+        else:
+            self._finish(job, SUCCEEDED, result=result, message="Done")
+
+    def _finish(self, job, state, result=None, error=None, message=None):
+        with job._lock:
+            job.state = state
+            job.result = result
+            job.error = error
+            job.finished = time.time()
+            if state == SUCCEEDED:
+                job.progress = 1.0
+            if message is not None:
+                job.message = message
+        with self._lock:
+            self._futures.pop(job.id, None)
+
+    def _prune(self):
+        finished = [j for j in self._jobs.values() if j.done]
+        excess = len(finished) - self._max_finished
+        if excess > 0:
+            for job in sorted(finished, key=lambda j: j.finished)[:excess]:
+                del self._jobs[job.id]
+
+    def shutdown(self):
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+        self._executor.shutdown(wait=False, cancel_futures=True)
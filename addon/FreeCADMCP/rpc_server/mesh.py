@@ -0,0 +1,165 @@
+"""Tessellated shapes as packed vertex and index buffers.
+
+``tessellate_object`` returns an object's shape as two little-endian
+buffers: ``vertices`` (float32 x, y, z per vertex, document coordinates)
+and ``triangles`` (uint32 vertex indices, three per triangle). Both are
+``bytes``, so the framed transport sends them as raw blobs and XML-RPC as
+base64 Binary, and a client can wrap them with ``numpy.frombuffer`` without
+building a Python object per vertex.
+
+The tolerance is the maximum linear deflection in document units, or one
+of the named levels of detail in ``LOD_TOLERANCES``, which scale with the
+shape's bounding-box diagonal. Results are kept in ``mesh_cache`` by shape
+hash and tolerance.
+"""
+
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import chain
+
+# Named levels of detail: deflection as a fraction of the bounding-box diagonal
+LOD_TOLERANCES = {"coarse": 0.01, "medium": 0.002, "fine": 0.0005}
+DEFAULT_LOD = "medium"
+
+# Deflection used for named levels when a shape has no usable bounding box
+_FALLBACK_TOLERANCE = 0.1
+
+
+def check_tolerance(tolerance):
+    """Validate *tolerance*, returning a ``LOD_TOLERANCES`` name or a positive float."""
+    if isinstance(tolerance, str):
+        if tolerance not in LOD_TOLERANCES:
+            raise ValueError(
+                f"Unknown level of detail '{tolerance}', expected a number or one of {', '.join(LOD_TOLERANCES)}"
+            )
+        return tolerance
+    tolerance = float(tolerance)
+    if not tolerance > 0:
+        raise ValueError(f"Tolerance must be positive, got {tolerance}")
+    return tolerance
+
+
+def resolve_tolerance(shape, tolerance):
+    """Absolute deflection for a checked *tolerance* on *shape*."""
+    if not isinstance(tolerance, str):
+        return tolerance
+    try:
+        diagonal = shape.BoundBox.DiagonalLength
+    except Exception:
+        diagonal = 0.0
+    if not diagonal > 0:
+        return _FALLBACK_TOLERANCE
+    return diagonal * LOD_TOLERANCES[tolerance]
+
+
+def _pack(typecode, values):
+    buffer = array(typecode, values)
+    if sys.byteorder == "big":
+        buffer.byteswap()
+    return buffer.tobytes()
+
+
+def tessellate_shape(shape, deflection):
+    """Tessellate *shape* into ``{"vertices", "triangles", "vertex_count", "triangle_count"}``."""
+    points, facets = shape.tessellate(deflection)
+    # Vectors and facet tuples are sequences, so they flatten straight into the arrays
+    vertices = _pack("f", chain.from_iterable(points))
+    triangles = _pack("I", chain.from_iterable(facets))
+    return {
+        "vertices": vertices,
+        "triangles": triangles,
+        "vertex_count": len(points),
+        "triangle_count": len(facets),
+    }
+
+
+class MeshCache:
+    """Bounded LRU of tessellations keyed by shape hash and deflection.
+
+    Entries hold the shape, which keeps its hash from being reused by a new
+    shape, and are only served to a shape that ``isSame`` as the cached one.
+    Least recently used entries are evicted beyond *max_bytes* of buffers.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (shape, mesh, size)
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def configure(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def reset_counters(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, shape, deflection):
+        """Tessellate *shape*, or return the cached result for it."""
+        try:
+            key = (shape.hashCode(), deflection)
+        except Exception:
+            key = None
+        if key is not None and self.max_bytes > 0:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0].isSame(shape):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self.misses += 1
+        mesh = tessellate_shape(shape, deflection)
+        size = len(mesh["vertices"]) + len(mesh["triangles"])
+        if key is not None and 0 < size <= self.max_bytes:
+            with self._lock:
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._bytes -= old[2]
+                self._entries[key] = (shape, mesh, size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    self._bytes -= self._entries.popitem(last=False)[1][2]
+                    self.evictions += 1
+        return mesh
+
+
+mesh_cache = MeshCache()
+
+
+def tessellate_object(obj, tolerance=DEFAULT_LOD):
+    """Mesh of *obj*'s shape, with its name, deflection and bounding box.
+
+    *tolerance* must have passed :func:`check_tolerance`. Objects without a
+    shape get an "error" entry instead.
+    """
+    shape = getattr(obj, "Shape", None)
+    if shape is None:
+        return {"name": obj.Name, "error": f"Object '{obj.Name}' has no shape"}
+    if getattr(shape, "isNull", None) is not None and shape.isNull():
+        return {"name": obj.Name, "error": f"Object '{obj.Name}' has an empty shape"}
+    deflection = resolve_tolerance(shape, tolerance)
+    result = {"name": obj.Name, "tolerance": deflection}
+    result.update(mesh_cache.get(shape, deflection))
+    box = shape.BoundBox
+    result["bound_box"] = [box.XMin, box.YMin, box.ZMin, box.XMax, box.YMax, box.ZMax]
+    return result
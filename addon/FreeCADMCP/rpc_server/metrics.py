@@ -0,0 +1,252 @@
+"""Latency histograms and Prometheus export for the RPC server.
+
+Every RPC is broken into phases, each recorded per method in a fixed-bucket
+histogram:
+
+    admission   waiting for a GUI-call slot on the threaded server
+    decode      parsing the request (XML-RPC or framed)
+    call        the RPC method itself, end to end
+    queue_wait  time a GUI task spent in ``rpc_request_queue``
+    gui         GUI-thread execution of a task
+    recompute   ``doc.recompute()`` inside GUI tasks
+    serialize   ``serialize_object`` inside reads
+    tessellate  meshing shapes (or reading cached meshes) in ``get_mesh``
+    screenshot  rendering and encoding the view image
+    encode      marshalling the response (framed: including the socket write)
+    compress    compressing the response body, when negotiated
+
+The method a phase belongs to is carried in a thread-local context, set by
+the server's dispatch and handed to the GUI thread with each queued task.
+"""
+
+import bisect
+import contextlib
+import http.server
+import math
+import os
+import threading
+import time
+
+# Upper bounds in seconds: 100 us .. ~105 s, doubling
+_BUCKETS = tuple(0.0001 * 2 ** i for i in range(21))
+
+UNKNOWN_METHOD = "unknown"
+
+_context = threading.local()
+
+
+def current_method():
+    return getattr(_context, "method", UNKNOWN_METHOD)
+
+
+@contextlib.contextmanager
+def method_context(method):
+    """Attribute phases recorded on this thread to *method*."""
+    previous = getattr(_context, "method", UNKNOWN_METHOD)
+    _context.method = method
+    try:
+        yield
+    finally:
+        _context.method = previous
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """Estimate the *q* quantile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = _BUCKETS[i - 1] if i > 0 else 0.0
+                upper = _BUCKETS[i] if i < len(_BUCKETS) else self.max
+                return min(self.max, lower + (upper - lower) * (rank - seen) / n)
+            seen += n
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "sum_ms": 1000.0 * self.sum,
+            "mean_ms": 1000.0 * self.sum / self.count if self.count else 0.0,
+            "p50_ms": 1000.0 * self.quantile(0.5),
+            "p90_ms": 1000.0 * self.quantile(0.9),
+            "p99_ms": 1000.0 * self.quantile(0.99),
+            "max_ms": 1000.0 * self.max,
+        }
+
+
+class Metrics:
+    """Per-(method, phase) histograms plus GUI-thread busy time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+            self._started = time.monotonic()
+            self._gui_busy = 0.0
+
+    def observe(self, phase, seconds, method=None):
+        key = (method or current_method(), phase)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram()
+            hist.observe(seconds)
+            if phase == "gui":
+                self._gui_busy += seconds
+
+    @contextlib.contextmanager
+    def timed(self, phase, method=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start, method)
+
+    def snapshot(self):
+        with self._lock:
+            methods = {}
+            for (method, phase), hist in sorted(self._histograms.items()):
+                methods.setdefault(method, {})[phase] = hist.summary()
+            uptime = time.monotonic() - self._started
+            return {
+                "methods": methods,
+                "gui": {
+                    "uptime_s": uptime,
+                    "busy_s": self._gui_busy,
+                    "utilization": self._gui_busy / uptime if uptime > 0 else 0.0,
+                },
+            }
+
+    def prometheus_lines(self):
+        """Histogram families in Prometheus text exposition format."""
+        lines = [
+            "# HELP freecad_mcp_phase_seconds Time spent per RPC method and phase.",
+            "# TYPE freecad_mcp_phase_seconds histogram",
+        ]
+        with self._lock:
+            for (method, phase), hist in sorted(self._histograms.items()):
+                labels = f'method="{_escape(method)}",phase="{phase}"'
+                cumulative = 0
+                for bound, n in zip(_BUCKETS, hist.counts):
+                    cumulative += n
+                    lines.append(f'freecad_mcp_phase_seconds_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+                lines.append(f'freecad_mcp_phase_seconds_bucket{{{labels},le="+Inf"}} {hist.count}')
+                lines.append(f"freecad_mcp_phase_seconds_sum{{{labels}}} {hist.sum:.9g}")
+                lines.append(f"freecad_mcp_phase_seconds_count{{{labels}}} {hist.count}")
+            lines += [
+                "# HELP freecad_mcp_gui_busy_seconds_total GUI-thread time spent running RPC tasks.",
+                "# TYPE freecad_mcp_gui_busy_seconds_total counter",
+                f"freecad_mcp_gui_busy_seconds_total {self._gui_busy:.9g}",
+            ]
+        return lines
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_gauge(name, help_text, value, labels=None):
+    label_str = ""
+    if labels:
+        label_str = "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+    if isinstance(value, float) and not math.isfinite(value):
+        value = 0.0
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name}{label_str} {value}"]
+
+
+class PrometheusExporter:
+    """Serves ``render()`` on ``/metrics`` and/or rewrites it into a file.
+
+    *render* returns the full exposition text. The file is written
+    atomically every *interval* seconds so node_exporter's textfile
+    collector never reads a partial file.
+    """
+
+    def __init__(self, render, host="localhost", port=0, path="", interval=15.0):
+        self._render = render
+        self._path = path
+        self._interval = interval
+        self._stop = threading.Event()
+        self._threads = []
+        self._httpd = None
+        if port:
+            self._httpd = http.server.ThreadingHTTPServer((host, port), self._handler_class())
+            self._httpd.daemon_threads = True
+            self._threads.append(threading.Thread(target=self._httpd.serve_forever, daemon=True))
+        if path:
+            self._threads.append(threading.Thread(target=self._write_loop, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def _handler_class(self):
+        render = self._render
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def write_file(self):
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self._render())
+        os.replace(tmp_path, self._path)
+
+    def _write_loop(self):
+        while True:
+            try:
+                self.write_file()
+            except OSError:
+                pass
+            if self._stop.wait(self._interval):
+                return
+
+    def stop(self):
+        self._stop.set()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        if self._path:
+            # Leave the final counters behind rather than the last periodic write
+            try:
+                self.write_file()
+            except OSError:
+                pass
+
+
+metrics = Metrics()
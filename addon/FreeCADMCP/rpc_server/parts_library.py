@@ -2,7 +2,9 @@ import os
 from functools import cache
 
 import FreeCAD
-import FreeCADGui
+
+if FreeCAD.GuiUp:
+    import FreeCADGui
 
 
 def insert_part_from_library(relative_path):
@@ -12,9 +14,11 @@ def insert_part_from_library(relative_path):
     if not os.path.exists(part_path):
         raise FileNotFoundError(f"Not found: {part_path}")
 
-    if FreeCADGui.ActiveDocument is None:
+    # Headless (FreeCADCmd) has no Gui documents; the App document merges the same way
+    doc = FreeCADGui.ActiveDocument if FreeCAD.GuiUp else FreeCAD.ActiveDocument
+    if doc is None:
         raise RuntimeError("No active document. Please open or create a document first.")
-    FreeCADGui.ActiveDocument.mergeProject(part_path)
+    doc.mergeProject(part_path)
 
 
 @cache
@@ -1,33 +1,57 @@
 import FreeCAD
-import FreeCADGui
 import ObjectsFem
 
 import contextlib
 import ipaddress
+import itertools
 import json
 import queue
 import re
+import socketserver
 import base64
 import io
 import os
 import tempfile
 import threading
+import time
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import Any
-from xmlrpc.server import SimpleXMLRPCServer
-
-from PySide import QtCore, QtWidgets
-
+from xmlrpc.client import Fault, dumps, loads
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+# FreeCADCmd has no GUI and no Qt event loop; see HeadlessTaskExecutor
+if FreeCAD.GuiUp:
+    import FreeCADGui
+    from PySide import QtCore, QtGui, QtWidgets
+
+from . import compression, serialize, tracing
+from .changes import changes
+from .depgraph import dependency_graph
+from .jobs import CANCELLED, JobManager
+from .mesh import DEFAULT_LOD, check_tolerance, mesh_cache, tessellate_object
+from .metrics import PrometheusExporter, current_method, format_gauge, method_context, metrics
+from .framed_transport import PROTOCOL_VERSION as FRAMED_PROTOCOL_VERSION, FramedRPCServer
 from .parts_library import get_parts_list, insert_part_from_library
-from .serialize import serialize_object
+from .serialize import serialization_cache, serialize_columns, serialize_fields, serialize_object, sort_key
+from .spatial import make_box, spatial_index
 
 rpc_server_thread = None
 rpc_server_instance = None
+framed_server_thread = None
+framed_server_instance = None
+metrics_exporter = None
 
 # Screenshot defaults and limits
 _SCREENSHOT_DEFAULT_WIDTH = 400
 _SCREENSHOT_DEFAULT_HEIGHT = 300
 _SCREENSHOT_MAX_DIM = 1600
+# saveImage backgrounds the in-memory renderer cannot reproduce; these still
+# go through saveImage and a temp file
+_SAVE_IMAGE_BACKGROUNDS = frozenset({"current", "transparent"})
+
+# Largest request body accepted after decompression
+_MAX_REQUEST_BYTES = 512 * 1024 * 1024
 
 
 # --- Settings persistence ---
@@ -37,6 +61,28 @@ _SETTINGS_FILENAME = "freecad_mcp_settings.json"
 _DEFAULT_SETTINGS = {
     "remote_enabled": False,
     "allowed_ips": "127.0.0.1",
+    # Max concurrent GUI-bound calls; 0 selects the single-threaded server
+    "rpc_workers": 4,
+    # Port of the persistent framed transport; 0 disables it
+    "framed_port": 9876,
+    # GUI time spent on queued RPC tasks per event-loop tick before yielding to Qt
+    "gui_tick_budget_ms": 50,
+    # Prometheus export of get_metrics: HTTP port (0 disables) and/or a file
+    # for node_exporter's textfile collector ("" disables)
+    "metrics_port": 0,
+    "metrics_file": "",
+    # JSON-lines file for OTLP-shaped trace spans ("" disables tracing)
+    "trace_file": "",
+    # Compress responses larger than this many bytes when the client accepts
+    # gzip or zstd; 0 disables compression
+    "compression_threshold": 1024,
+    # Memory cap of the serialize_object cache in MiB; 0 disables it
+    "serialization_cache_mb": 64,
+    # Time per shape for Volume/Area in listings; metrics estimated not to fit
+    # are reported as omitted; 0 measures every shape
+    "shape_budget_ms": 50,
+    # Memory cap of the get_mesh tessellation cache in MiB; 0 disables it
+    "mesh_cache_mb": 64,
 }
 
 
@@ -71,6 +117,67 @@ def save_settings(settings):
 
 # --- IP-filtered XML-RPC server ---
 
+class TracingRequestHandler(SimpleXMLRPCRequestHandler):
+    """Continues the caller's trace from its ``traceparent`` HTTP header.
+
+    Also negotiates body compression: requests may arrive gzip- or
+    zstd-encoded, and responses above the server's ``compression_threshold``
+    are compressed with the best codec in the client's ``Accept-Encoding``.
+    """
+
+    rpc_method = None
+
+    def do_POST(self):
+        # SimpleXMLRPCRequestHandler.do_POST, with zstd alongside gzip and a
+        # configurable threshold
+        if not self.is_rpc_path_valid():
+            self.report_404()
+            return
+        with tracing.activate(tracing.parse_traceparent(self.headers.get("traceparent"))):
+            try:
+                data = self.decode_request_content(self.rfile.read(int(self.headers["content-length"])))
+                if data is None:
+                    return  # error response already sent
+                response = self.server._marshaled_dispatch(data, self._dispatch, self.path)
+            except Exception:
+                # Only reached if the server itself is broken
+                self.send_response(500)
+                self.send_header("Content-length", "0")
+                self.end_headers()
+                return
+        self.send_response(200)
+        self.send_header("Content-type", "text/xml")
+        threshold = getattr(self.server, "compression_threshold", 0)
+        if threshold and len(response) > threshold:
+            codec = compression.choose(compression.parse_accept_encoding(self.headers.get("accept-encoding")))
+            if codec is not None:
+                start = time.perf_counter()
+                response = compression.compress(codec, response)
+                metrics.observe("compress", time.perf_counter() - start, self.rpc_method)
+                self.send_header("Content-Encoding", codec)
+        self.send_header("Content-length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def decode_request_content(self, data):
+        encoding = self.headers.get("content-encoding", "identity").lower()
+        if encoding == "identity":
+            return data
+        try:
+            return compression.decompress(encoding, data, _MAX_REQUEST_BYTES)
+        except ValueError as e:
+            code = 400 if encoding in compression.CODECS else 501
+            self.send_response(code, str(e))
+            self.send_header("Content-length", "0")
+            self.end_headers()
+            return None
+
+    def _dispatch(self, method, params):
+        # Remember the method so compression time is attributed to it
+        self.rpc_method = method
+        return self.server._dispatch(method, params)
+
+
 class FilteredXMLRPCServer(SimpleXMLRPCServer):
     """XML-RPC server that filters connections by allowed IP addresses/subnets."""
 
@@ -92,6 +199,64 @@ class FilteredXMLRPCServer(SimpleXMLRPCServer):
         )
         return False
 
+    def _marshaled_dispatch(self, data, dispatch_method=None, path=None):
+        # SimpleXMLRPCDispatcher._marshaled_dispatch with decode/encode timed
+        method = None
+        try:
+            start = time.perf_counter()
+            params, method = loads(data, use_builtin_types=self.use_builtin_types)
+            metrics.observe("decode", time.perf_counter() - start, method)
+            if dispatch_method is not None:
+                response = dispatch_method(method, params)
+            else:
+                response = self._dispatch(method, params)
+            start = time.perf_counter()
+            response = dumps((response,), methodresponse=1, allow_none=self.allow_none, encoding=self.encoding)
+            metrics.observe("encode", time.perf_counter() - start, method)
+        except Fault as fault:
+            response = dumps(fault, allow_none=self.allow_none, encoding=self.encoding)
+        except BaseException as exc:
+            response = dumps(
+                Fault(1, "%s:%s" % (type(exc), exc)),
+                encoding=self.encoding, allow_none=self.allow_none,
+            )
+        return response.encode(self.encoding, "xmlcharrefreplace")
+
+    def _dispatch(self, method, params):
+        with (
+            method_context(method),
+            tracing.span(f"server {method}", tracing.SPAN_KIND_SERVER, **{"rpc.method": method}),
+            metrics.timed("call", method),
+        ):
+            return super()._dispatch(method, params)
+
+
+class ThreadedXMLRPCServer(socketserver.ThreadingMixIn, FilteredXMLRPCServer):
+    """FilteredXMLRPCServer that serves each request on its own thread.
+
+    Methods marked with :func:`worker_safe` run directly on the request
+    thread. Everything else may touch the GUI queue and is admitted at most
+    *workers* at a time, so a slow ``execute_code`` or mesh never delays
+    ``ping`` or ``list_documents``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, addr, workers=4, **kwargs):
+        self._gui_call_slots = threading.BoundedSemaphore(max(1, workers))
+        super().__init__(addr, **kwargs)
+
+    def _dispatch(self, method, params):
+        func = getattr(self.instance, method, None)
+        if getattr(func, "worker_safe", False):
+            return super()._dispatch(method, params)
+        with metrics.timed("admission", method):
+            self._gui_call_slots.acquire()
+        try:
+            return super()._dispatch(method, params)
+        finally:
+            self._gui_call_slots.release()
+
 
 _COMMA_SEP_RE = re.compile(r"^\s*[^,\s]+(\s*,\s*[^,\s]+)*\s*$")
 
@@ -138,18 +303,392 @@ def _parse_allowed_ips(allowed_ips_str):
         FreeCAD.Console.PrintWarning(f"MCP RPC: {msg}, skipping\n")
     return [ipaddress.ip_network(entry, strict=False) for entry in valid]
 
-# GUI task queue
-rpc_request_queue = queue.Queue()
-rpc_response_queue = queue.Queue()
+# GUI task priorities, lowest value runs first: cheap reads and pings never
+# wait behind screenshots, and screenshots never wait behind mutations
+PRIORITY_READ = 0
+PRIORITY_SCREENSHOT = 1
+PRIORITY_MUTATION = 2
+
+_PRIORITY_NAMES = {
+    PRIORITY_READ: "read",
+    PRIORITY_SCREENSHOT: "screenshot",
+    PRIORITY_MUTATION: "mutation",
+}
+
+# GUI task queue: (priority, seq, enqueued_at, method, trace_parent, future,
+# callable); each result goes to its own future, seq keeps FIFO order within a
+# priority
+rpc_request_queue = queue.PriorityQueue()
+_task_seq = itertools.count()
+
+_GUI_TASK_TIMEOUT = 30
+_GUI_TIMEOUT_ERROR = "GUI task timed out. FreeCAD may be unresponsive."
 
+# Seconds of GUI time per drain before yielding back to the Qt event loop
+_gui_tick_budget = 0.05
 
-def process_gui_tasks():
-    while not rpc_request_queue.empty():
-        task = rpc_request_queue.get()
-        res = task()
-        if res is not None:
-            rpc_response_queue.put(res)
-    QtCore.QTimer.singleShot(500, process_gui_tasks)
+
+class GuiQueueStats:
+    """Queue depth and wait-time counters for the GUI task queue."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.max_depth = 0
+            self.ticks = 0
+            self.yields = 0
+            self._classes = {
+                name: {"submitted": 0, "run": 0, "cancelled": 0, "wait_total": 0.0, "wait_max": 0.0}
+                for name in _PRIORITY_NAMES.values()
+            }
+
+    def submitted(self, priority):
+        depth = rpc_request_queue.qsize()
+        with self._lock:
+            self._classes[_PRIORITY_NAMES[priority]]["submitted"] += 1
+            self.max_depth = max(self.max_depth, depth)
+
+    def started(self, priority, waited):
+        with self._lock:
+            counters = self._classes[_PRIORITY_NAMES[priority]]
+            counters["run"] += 1
+            counters["wait_total"] += waited
+            counters["wait_max"] = max(counters["wait_max"], waited)
+
+    def cancelled(self, priority):
+        with self._lock:
+            self._classes[_PRIORITY_NAMES[priority]]["cancelled"] += 1
+
+    def tick(self, yielded):
+        with self._lock:
+            self.ticks += 1
+            if yielded:
+                self.yields += 1
+
+    def snapshot(self):
+        with self._lock:
+            classes = {}
+            for name, c in self._classes.items():
+                classes[name] = {
+                    "submitted": c["submitted"],
+                    "run": c["run"],
+                    "cancelled": c["cancelled"],
+                    "wait_ms_mean": 1000.0 * c["wait_total"] / c["run"] if c["run"] else 0.0,
+                    "wait_ms_max": 1000.0 * c["wait_max"],
+                }
+            return {
+                "depth": rpc_request_queue.qsize(),
+                "max_depth": self.max_depth,
+                "ticks": self.ticks,
+                "yields": self.yields,
+                "tick_budget_ms": 1000.0 * _gui_tick_budget,
+                "classes": classes,
+            }
+
+
+gui_queue_stats = GuiQueueStats()
+
+
+def process_gui_tasks(budget=None):
+    """Run queued GUI tasks in priority order for at most *budget* seconds.
+
+    At least one task runs per call. If work remains when the budget is
+    spent, the dispatcher is re-signalled so Qt can repaint and handle input
+    before the next slice. Without a dispatcher the queue is drained fully.
+    """
+    if budget is None:
+        budget = _gui_tick_budget
+    deadline = time.perf_counter() + budget
+    yielded = False
+    while True:
+        try:
+            priority, _, enqueued_at, method, trace_parent, future, task = rpc_request_queue.get_nowait()
+        except queue.Empty:
+            break
+        # The caller timed out and cancelled before the task started
+        if not future.set_running_or_notify_cancel():
+            gui_queue_stats.cancelled(priority)
+            continue
+        started = time.perf_counter()
+        gui_queue_stats.started(priority, started - enqueued_at)
+        metrics.observe("queue_wait", started - enqueued_at, method)
+        try:
+            with (
+                method_context(method),
+                tracing.activate(trace_parent),
+                tracing.span(
+                    f"gui {method}",
+                    priority=_PRIORITY_NAMES[priority],
+                    queue_wait_ms=1000.0 * (started - enqueued_at),
+                ),
+            ):
+                future.set_result(task())
+        except Exception as e:
+            future.set_exception(e)
+        metrics.observe("gui", time.perf_counter() - started, method)
+        if (
+            _gui_dispatcher is not None
+            and time.perf_counter() >= deadline
+            and not rpc_request_queue.empty()
+        ):
+            yielded = True
+            _gui_dispatcher.wake()
+            break
+    gui_queue_stats.tick(yielded)
+
+
+if FreeCAD.GuiUp:
+    class GuiTaskDispatcher(QtCore.QObject):
+        """Wakes the GUI thread as soon as an RPC thread queues work.
+
+        Must be created on the GUI thread. ``tasks_pending`` is emitted from the
+        XML-RPC thread; the queued connection makes Qt deliver it to the GUI
+        thread's event loop on its next iteration instead of waiting for a poll.
+        """
+
+        tasks_pending = QtCore.Signal()
+
+        def __init__(self):
+            super().__init__()
+            self.tasks_pending.connect(self._drain, QtCore.Qt.QueuedConnection)
+
+        def wake(self):
+            self.tasks_pending.emit()
+
+        @QtCore.Slot()
+        def _drain(self):
+            process_gui_tasks()
+
+
+class HeadlessTaskExecutor:
+    """Runs queued tasks on one dedicated thread when there is no GUI.
+
+    In FreeCADCmd there is no Qt event loop to drain the queue, so this
+    thread plays the GUI thread's part: it owns all document access and runs
+    tasks in the same priority order, with the same metrics and tracing.
+    """
+
+    def __init__(self):
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="mcp-headless-executor", daemon=True)
+        self._thread.start()
+
+    def wake(self):
+        self._wakeup.set()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopped:
+                return
+            process_gui_tasks()
+
+    def stop(self):
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+
+
+_gui_dispatcher = None
+
+
+def submit_gui_task(task, priority=PRIORITY_MUTATION) -> Future:
+    """Queue *task* for the GUI thread and wake the dispatcher.
+
+    Returns a future that receives the task's return value (or exception)
+    and nothing else, so concurrent callers never see each other's results.
+    *priority* is one of the ``PRIORITY_*`` classes.
+    """
+    future = Future()
+    rpc_request_queue.put((
+        priority, next(_task_seq), time.perf_counter(), current_method(), tracing.current_span(), future, task,
+    ))
+    gui_queue_stats.submitted(priority)
+    if _gui_dispatcher is not None:
+        _gui_dispatcher.wake()
+    return future
+
+
+def run_in_gui(task, timeout=_GUI_TASK_TIMEOUT, priority=PRIORITY_MUTATION):
+    """Run *task* on the GUI thread and wait for its result.
+
+    Raises ``TimeoutError`` after *timeout* seconds. A task that has not
+    started by then is cancelled; one that is already running finishes, but
+    its result is discarded with the future.
+    """
+    future = submit_gui_task(task, priority)
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def _recompute(doc):
+    with metrics.timed("recompute"):
+        doc.recompute()
+
+
+def _render_webp(view, width, height, background_color):
+    """Render *view* offscreen and encode it as webp, without touching the disk.
+
+    Renders the viewer's scene graph (camera and headlight included) with
+    Coin's offscreen renderer, as saveImage does, then encodes through a
+    QBuffer. Returns None when that is not possible here (no pivy, no
+    offscreen context, no webp image plugin, or a background only saveImage
+    understands); the caller then falls back to saveImage.
+    """
+    if background_color.lower() in _SAVE_IMAGE_BACKGROUNDS:
+        return None
+    color = QtGui.QColor(background_color)
+    if not color.isValid():
+        return None
+    try:
+        from pivy import coin
+
+        root = view.getViewer().getSoRenderManager().getSceneGraph()
+        renderer = coin.SoOffscreenRenderer(coin.SbViewportRegion(width, height))
+        renderer.setComponents(coin.SoOffscreenRenderer.RGB)
+        renderer.setBackgroundColor(coin.SbColor(color.redF(), color.greenF(), color.blueF()))
+        if not renderer.render(root):
+            return None
+        pixels = renderer.getBuffer()
+        # Coin's rows run bottom to top; mirrored() also copies out of pixels
+        image = QtGui.QImage(pixels, width, height, 3 * width, QtGui.QImage.Format_RGB888).mirrored()
+        data = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(data)
+        buffer.open(QtCore.QIODevice.WriteOnly)
+        if not image.save(buffer, "WEBP"):
+            return None
+        return bytes(data)
+    except Exception as e:
+        FreeCAD.Console.PrintLog(f"In-memory screenshot unavailable, using saveImage: {e}\n")
+        return None
+
+
+def _save_image(view, width, height, background_color):
+    """Webp bytes of *view* through saveImage and a temp file."""
+    fd, tmp_path = tempfile.mkstemp(suffix=".webp")
+    os.close(fd)
+    try:
+        view.saveImage(tmp_path, width, height, background_color)
+        with open(tmp_path, "rb") as image_file:
+            return image_file.read()
+    finally:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+def _render_prometheus():
+    stats = gui_queue_stats.snapshot()
+    lines = metrics.prometheus_lines()
+    lines += format_gauge("freecad_mcp_gui_queue_depth", "Tasks waiting in the GUI queue.", stats["depth"])
+    lines += format_gauge("freecad_mcp_gui_queue_max_depth", "Deepest the GUI queue has been.", stats["max_depth"])
+    lines += [
+        "# HELP freecad_mcp_gui_tasks_total GUI tasks by priority class and outcome.",
+        "# TYPE freecad_mcp_gui_tasks_total counter",
+    ]
+    for name, counters in stats["classes"].items():
+        for outcome in ("submitted", "run", "cancelled"):
+            lines.append(f'freecad_mcp_gui_tasks_total{{class="{name}",outcome="{outcome}"}} {counters[outcome]}')
+    cache = serialization_cache.stats()
+    lines += [
+        "# HELP freecad_mcp_serialization_cache_total serialize_object cache lookups and removals by outcome.",
+        "# TYPE freecad_mcp_serialization_cache_total counter",
+    ]
+    for outcome in ("hits", "misses", "evictions", "invalidations"):
+        lines.append(f'freecad_mcp_serialization_cache_total{{outcome="{outcome}"}} {cache[outcome]}')
+    lines += format_gauge(
+        "freecad_mcp_serialization_cache_bytes", "Estimated size of cached serializations.", cache["bytes"]
+    )
+    cache = mesh_cache.stats()
+    lines += [
+        "# HELP freecad_mcp_mesh_cache_total get_mesh tessellation cache lookups and evictions by outcome.",
+        "# TYPE freecad_mcp_mesh_cache_total counter",
+    ]
+    for outcome in ("hits", "misses", "evictions"):
+        lines.append(f'freecad_mcp_mesh_cache_total{{outcome="{outcome}"}} {cache[outcome]}')
+    lines += format_gauge("freecad_mcp_mesh_cache_bytes", "Size of cached tessellations.", cache["bytes"])
+    return "\n".join(lines) + "\n"
+
+
+# Background jobs for work that outlives a single RPC call
+job_manager = JobManager(submit_gui_task)
+
+
+class _ObjectQuery:
+    """Projection, type filter, ordering and paging for get_objects."""
+
+    def __init__(
+        self, summary_only=True, fields=None, type_filter=None, offset=0, limit=None, order_by=None, columnar=False,
+    ):
+        self.summary_only = summary_only
+        self.fields = list(fields) if fields else None
+        if isinstance(type_filter, str):
+            type_filter = [type_filter]
+        self.type_filter = list(type_filter) if type_filter else None
+        self.offset = max(0, int(offset or 0))
+        self.limit = None if limit is None else max(0, int(limit))
+        self.descending = bool(order_by) and order_by.startswith("-")
+        self.order_by = order_by.lstrip("-") if order_by else None
+        self.columnar = bool(columnar)
+
+    def _matches(self, obj):
+        for type_id in self.type_filter:
+            if obj.TypeId == type_id:
+                return True
+            is_derived = getattr(obj, "isDerivedFrom", None)
+            if is_derived is not None and is_derived(type_id):
+                return True
+        return False
+
+    def filter(self, objects):
+        if self.type_filter is None:
+            return objects
+        return [obj for obj in objects if self._matches(obj)]
+
+    def select(self, objects):
+        """Objects matching the type filter, in the requested order."""
+        objects = self.filter(objects)
+        if self.order_by:
+            keyed = [(sort_key(obj, self.order_by), obj) for obj in objects]
+            present = [item for item in keyed if item[0][0] != 2]
+            present.sort(key=lambda item: item[0], reverse=self.descending)
+            # Objects without the property go last in either direction
+            objects = [obj for _, obj in present] + [obj for key, obj in keyed if key[0] == 2]
+        return objects
+
+    def page(self, objects):
+        end = None if self.limit is None else self.offset + self.limit
+        return objects[self.offset:end]
+
+    def serialize(self, obj):
+        if self.fields is not None:
+            return serialize_fields(obj, self.fields)
+        return serialize_object(obj, summary_only=self.summary_only)
+
+    def serialize_all(self, objects):
+        """A list of serialized objects, or one columnar table of them."""
+        if self.columnar:
+            return serialize_columns(objects, self.summary_only, self.fields)
+        return [self.serialize(obj) for obj in objects]
+
+
+def worker_safe(func):
+    """Mark an RPC method as safe to run on an XML-RPC worker thread.
+
+    Worker-safe methods must not touch documents or the GUI; they bypass the
+    GUI queue and the threaded server's GUI-bound call limit.
+    """
+    func.worker_safe = True
+    return func
 
 
 @dataclass
@@ -256,15 +795,15 @@ def set_object_property(
 class FreeCADRPC:
     """RPC server for FreeCAD"""
 
+    @worker_safe
     def ping(self):
         return True
 
     def create_document(self, name="New_Document"):
-        rpc_request_queue.put(lambda: self._create_document_gui(name))
         try:
-            res = rpc_response_queue.get(timeout=30)
-        except queue.Empty:
-            return {"success": False, "error": "GUI task timed out. FreeCAD may be unresponsive."}
+            res = run_in_gui(lambda: self._create_document_gui(name))
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
         if res is True:
             return {"success": True, "document_name": name}
         else:
@@ -277,11 +816,10 @@ class FreeCADRPC:
             analysis=obj_data.get("Analysis", None),
             properties=obj_data.get("Properties", {}),
         )
-        rpc_request_queue.put(lambda: self._create_object_gui(doc_name, obj))
         try:
-            res = rpc_response_queue.get(timeout=30)
-        except queue.Empty:
-            return {"success": False, "error": "GUI task timed out. FreeCAD may be unresponsive."}
+            res = run_in_gui(lambda: self._create_object_gui(doc_name, obj))
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
         if res is True:
             return {"success": True, "object_name": obj.name}
         else:
@@ -292,46 +830,50 @@ class FreeCADRPC:
             name=obj_name,
             properties=properties.get("Properties", {}),
         )
-        rpc_request_queue.put(lambda: self._edit_object_gui(doc_name, obj))
         try:
-            res = rpc_response_queue.get(timeout=30)
-        except queue.Empty:
-            return {"success": False, "error": "GUI task timed out. FreeCAD may be unresponsive."}
+            res = run_in_gui(lambda: self._edit_object_gui(doc_name, obj))
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
         if res is True:
             return {"success": True, "object_name": obj.name}
         else:
             return {"success": False, "error": res}
 
     def delete_object(self, doc_name: str, obj_name: str):
-        rpc_request_queue.put(lambda: self._delete_object_gui(doc_name, obj_name))
         try:
-            res = rpc_response_queue.get(timeout=30)
-        except queue.Empty:
-            return {"success": False, "error": "GUI task timed out. FreeCAD may be unresponsive."}
+            res = run_in_gui(lambda: self._delete_object_gui(doc_name, obj_name))
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
         if res is True:
             return {"success": True, "object_name": obj_name}
         else:
             return {"success": False, "error": res}
 
+    def batch(self, doc_name: str, ops: list[dict[str, Any]], on_error: str = "rollback") -> dict[str, Any]:
+        """Apply create/edit/delete operations in one GUI task and one transaction.
+
+        Each op is a dict with ``Op`` ("create", "edit" or "delete") and ``Name``;
+        create ops also take ``Type``, ``Properties`` and ``Analysis`` as in
+        ``create_object``, edit ops take ``Properties``. The document is
+        recomputed once at the end.
+
+        on_error: "rollback" stops at the first failure and aborts the
+            transaction (requires undo to be enabled for the document);
+            "continue" applies every op and reports failures per op.
+        """
+        if on_error not in ("rollback", "continue"):
+            return {"success": False, "error": f"Invalid on_error '{on_error}', expected 'rollback' or 'continue'"}
+        try:
+            return run_in_gui(lambda: self._batch_gui(doc_name, ops, on_error))
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
+
     def execute_code(self, code: str) -> dict[str, Any]:
         output_buffer = io.StringIO()
-        def task():
-            try:
-                with contextlib.redirect_stdout(output_buffer):
-                    exec(code, globals())
-                FreeCAD.Console.PrintMessage("Python code executed successfully.\n")
-                return True
-            except Exception as e:
-                FreeCAD.Console.PrintError(
-                    f"Error executing Python code: {e}\n"
-                )
-                return f"Error executing Python code: {e}\n"
-
-        rpc_request_queue.put(task)
         try:
-            res = rpc_response_queue.get(timeout=30)
-        except queue.Empty:
-            return {"success": False, "error": "GUI task timed out. FreeCAD may be unresponsive."}
+            res = run_in_gui(lambda: self._execute_code_gui(code, output_buffer))
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
         if res is True:
             return {
                 "success": True,
@@ -340,52 +882,287 @@ class FreeCADRPC:
         else:
             return {"success": False, "error": res}
 
-    def get_objects(self, doc_name, summary_only=True):
-        doc = FreeCAD.getDocument(doc_name)
-        if doc:
-            try:
-                return {"success": True, "objects": [serialize_object(obj, summary_only=summary_only) for obj in doc.Objects]}
-            except Exception as e:
-                return {"success": False, "error": str(e)}
-        else:
-            return {"success": False, "error": f"Document '{doc_name}' not found"}
+    def submit_job(self, kind: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Start a long-running operation in the background and return its id at once.
 
-    def get_object(self, doc_name, obj_name):
-        doc = FreeCAD.getDocument(doc_name)
-        if doc:
-            obj = doc.getObject(obj_name)
-            if obj is None:
-                return {"success": False, "error": f"Object '{obj_name}' not found in '{doc_name}'"}
-            try:
-                return {"success": True, "object": serialize_object(obj)}
-            except Exception as e:
-                return {"success": False, "error": str(e)}
-        else:
-            return {"success": False, "error": f"Document '{doc_name}' not found"}
+        kind: "execute_code" (params: ``code``) or "create_object" (params:
+            ``doc_name`` and ``obj_data`` as for create_object). Gmsh meshes run
+            the mesher process off the GUI thread.
+
+        Poll with job_status/job_result; stop with cancel_job.
+        """
+        try:
+            if kind == "execute_code":
+                code = params["code"]
+                job = job_manager.submit(kind, lambda job: self._execute_code_job(job, code))
+            elif kind == "create_object":
+                doc_name = params["doc_name"]
+                obj_data = params["obj_data"]
+                obj = Object(
+                    name=obj_data.get("Name", "New_Object"),
+                    type=obj_data["Type"],
+                    analysis=obj_data.get("Analysis", None),
+                    properties=obj_data.get("Properties", {}),
+                )
+                job = job_manager.submit(kind, lambda job: self._create_object_job(job, doc_name, obj))
+            else:
+                return {"success": False, "error": f"Unknown job kind '{kind}', expected 'execute_code' or 'create_object'"}
+        except KeyError as e:
+            return {"success": False, "error": f"Missing job parameter {e}"}
+        return {"success": True, "job_id": job.id}
+
+    @worker_safe
+    def job_status(self, job_id: str) -> dict[str, Any]:
+        job = job_manager.get(job_id)
+        if job is None:
+            return {"success": False, "error": f"Job '{job_id}' not found"}
+        return {"success": True, **job.status()}
+
+    @worker_safe
+    def job_result(self, job_id: str) -> dict[str, Any]:
+        """Return the job's status plus its result (or error) once finished.
+
+        A cancelled job has no result and is reported as a failure.
+        """
+        job = job_manager.get(job_id)
+        if job is None:
+            return {"success": False, "error": f"Job '{job_id}' not found"}
+        status = job.status()
+        status["done"] = job.done
+        if job.error is not None:
+            return {"success": False, "error": job.error, **status}
+        if status["state"] == CANCELLED:
+            return {"success": False, "error": f"Job '{job_id}' was cancelled", **status}
+        return {"success": True, "result": job.result, **status}
+
+    @worker_safe
+    def cancel_job(self, job_id: str) -> dict[str, Any]:
+        if job_manager.get(job_id) is None:
+            return {"success": False, "error": f"Job '{job_id}' not found"}
+        if not job_manager.cancel(job_id):
+            return {"success": False, "error": f"Job '{job_id}' already finished"}
+        return {"success": True, "job_id": job_id}
+
+    def get_objects(
+        self, doc_name, summary_only=True, since=None, fields=None,
+        type_filter=None, offset=0, limit=None, order_by=None, columnar=False,
+    ):
+        """Serialize the document's objects, with a change token.
+
+        With since set to a token from an earlier call, only objects added or
+        changed after it are serialized ("added", "changed") and deleted ones
+        are named ("removed"). If the token can no longer be diffed (server
+        restart, undo, document re-created), every object comes back under
+        "added" with "reset": True.
+
+        fields lists the properties to return per object (plus Name) instead
+        of the summary or full dump; only those are evaluated. type_filter is
+        a TypeId or list of TypeIds, matched by derivation. order_by is a
+        property or dotted path ("Shape.Volume"), prefixed with "-" for
+        descending order. offset and limit page through the matching objects;
+        the result carries "total" and, if more remain, "next_offset".
+        Ordering and paging apply to listings, not to since= deltas.
+
+        With columnar set, "objects" (or "added" and "changed") is a single
+        table of columns, as built by serialize.serialize_columns, instead of
+        a list of dicts: smaller and faster to produce for long listings.
+
+        Listings also carry "fingerprint", the document's fingerprint (see
+        get_document_fingerprint) taken with them, so a client can tell
+        later whether they are still current.
+        """
+        query = _ObjectQuery(summary_only, fields, type_filter, offset, limit, order_by, columnar)
+        try:
+            return run_in_gui(lambda: self._get_objects_gui(doc_name, query, since), priority=PRIORITY_READ)
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
+
+    def get_object(self, doc_name, obj_name, fields=None):
+        """Serialize one object in full, or only *fields* of it (plus Name)."""
+        try:
+            return run_in_gui(lambda: self._get_object_gui(doc_name, obj_name, fields), priority=PRIORITY_READ)
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
+
+    def get_mesh(self, doc_name, objects=None, tolerance=DEFAULT_LOD):
+        """Tessellate shapes into packed vertex and index buffers.
+
+        objects lists object names; None meshes every visible object with a
+        shape. tolerance is the maximum deflection in document units, or
+        "coarse", "medium" or "fine" relative to each shape's size. Each mesh
+        carries "vertices" (little-endian float32 x, y, z) and "triangles"
+        (little-endian uint32 indices) as bytes, their counts, the deflection
+        used and the bounding box; objects that cannot be meshed carry
+        "error" instead. "fingerprint" is the document's fingerprint taken
+        with the meshes.
+        """
+        try:
+            tolerance = check_tolerance(tolerance)
+        except (TypeError, ValueError) as e:
+            return {"success": False, "error": str(e)}
+        try:
+            return run_in_gui(lambda: self._get_mesh_gui(doc_name, objects, tolerance), priority=PRIORITY_READ)
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
+
+    def query_region(self, doc_name, low, high, contained=False):
+        """Objects whose bounding box intersects the box from *low* to *high*.
+
+        low and high are [x, y, z] corners; None leaves that side unbounded,
+        so low=[None, None, 100], high=[None, None, None] finds everything
+        reaching above z=100. contained=True only returns boxes lying fully
+        inside. Answered from the spatial index.
+        """
+        try:
+            region = make_box(low, high)
+        except (TypeError, ValueError) as e:
+            return {"success": False, "error": str(e)}
+        try:
+            return run_in_gui(lambda: self._query_region_gui(doc_name, region, contained), priority=PRIORITY_READ)
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
+
+    def query_nearby(self, doc_name, target, radius=None, k=None):
+        """Objects nearest to *target*, closest first, with bounding-box distances.
+
+        target is an object name or an [x, y, z] point. radius keeps objects
+        within that distance, k the k nearest; with neither, k is 10. The
+        target object itself is left out.
+        """
+        if radius is not None and radius < 0:
+            return {"success": False, "error": f"Radius must not be negative, got {radius}"}
+        if k is not None and (isinstance(k, bool) or not isinstance(k, int) or k < 1):
+            return {"success": False, "error": f"k must be a positive integer, got {k!r}"}
+        if radius is None and k is None:
+            k = 10
+        try:
+            return run_in_gui(lambda: self._query_nearby_gui(doc_name, target, radius, k), priority=PRIORITY_READ)
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
+
+    def get_dependency_graph(self, doc_name, root=None, depth=None):
+        """The document's dependency graph as a name table and CSR arrays.
+
+        Returns "names" and, for each names[i], its dependencies (OutList)
+        as indices targets[offsets[i]:offsets[i + 1]]. With root, only root
+        and what it depends on within depth links are included.
+        """
+        try:
+            return run_in_gui(lambda: self._get_dependency_graph_gui(doc_name, root, depth), priority=PRIORITY_READ)
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
+
+    def get_downstream_impact(self, doc_name, names, depth=None):
+        """Objects a change to *names* invalidates, in recompute order.
+
+        names is an object name or a list of them. Returns "names" (the
+        given objects and everything depending on them within depth links,
+        each after its own dependencies) and "distance", the link count
+        from the nearest given object.
+        """
+        if isinstance(names, str):
+            names = [names]
+        try:
+            return run_in_gui(lambda: self._get_downstream_impact_gui(doc_name, names, depth), priority=PRIORITY_READ)
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
+
+    def get_document_fingerprint(self, doc_name, objects=None):
+        """A hash of the document's state, equal across calls while nothing changed.
+
+        Returns "fingerprint" and the current change token ("token", as for
+        get_objects since=). objects=True adds "objects", a fingerprint per
+        object; a list of names limits it to those. The fingerprints cover
+        creation, deletion, every property change and the recompute state;
+        view-only changes (colors, camera) are not seen.
+        """
+        try:
+            return run_in_gui(lambda: self._get_document_fingerprint_gui(doc_name, objects), priority=PRIORITY_READ)
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
 
     def insert_part_from_library(self, relative_path):
-        rpc_request_queue.put(lambda: self._insert_part_from_library(relative_path))
         try:
-            res = rpc_response_queue.get(timeout=30)
-        except queue.Empty:
-            return {"success": False, "error": "GUI task timed out. FreeCAD may be unresponsive."}
+            res = run_in_gui(lambda: self._insert_part_from_library(relative_path))
+        except TimeoutError:
+            return {"success": False, "error": _GUI_TIMEOUT_ERROR}
         if res is True:
             return {"success": True, "message": "Part inserted from library."}
         else:
             return {"success": False, "error": res}
 
+    @worker_safe
     def list_documents(self):
         return list(FreeCAD.listDocuments().keys())
 
+    @worker_safe
     def get_parts_list(self):
         return get_parts_list()
 
+    @worker_safe
+    def get_metrics(self, reset=False):
+        """Per-method phase latencies, GUI-thread utilization, GUI queue and cache counters.
+
+        Latencies are in milliseconds (count, sum, mean, p50/p90/p99 estimated
+        from histogram buckets, max). reset=True clears the histograms and
+        counters after reading.
+        """
+        snapshot = metrics.snapshot()
+        snapshot["queue"] = gui_queue_stats.snapshot()
+        snapshot["serialization_cache"] = serialization_cache.stats()
+        snapshot["mesh_cache"] = mesh_cache.stats()
+        snapshot["spatial_index"] = spatial_index.stats()
+        if reset:
+            metrics.reset()
+            gui_queue_stats.reset()
+            serialization_cache.reset_counters()
+            mesh_cache.reset_counters()
+            spatial_index.reset_counters()
+        return snapshot
+
+    @worker_safe
+    def get_queue_stats(self):
+        """GUI task queue depth, per-priority wait times and yield counts."""
+        return gui_queue_stats.snapshot()
+
+    @worker_safe
+    def get_transport_info(self):
+        """Describe the transports this server offers, for client negotiation."""
+        info = {
+            "protocols": ["xmlrpc"],
+            "framed_port": None,
+            "framed_version": FRAMED_PROTOCOL_VERSION,
+            "compression": list(compression.CODECS),
+        }
+        if framed_server_instance is not None:
+            info["protocols"].append("framed")
+            info["framed_port"] = framed_server_instance.server_address[1]
+        return info
+
     def get_active_screenshot(self, view_name: str = "Isometric", width: int | None = None, height: int | None = None, focus_object: str | None = None, background_color: str = "white") -> str | None:
         """Get a screenshot of the active view.
 
         Returns a base64-encoded string of the screenshot or None if a screenshot
         cannot be captured (e.g., when in TechDraw or Spreadsheet view).
         """
+        image_bytes = self._capture_active_screenshot(view_name, width, height, focus_object, background_color)
+        if image_bytes is None:
+            return None
+        return base64.b64encode(image_bytes).decode("utf-8")
+
+    def get_active_screenshot_bytes(self, view_name: str = "Isometric", width: int | None = None, height: int | None = None, focus_object: str | None = None, background_color: str = "white") -> bytes | None:
+        """Like get_active_screenshot, but return the raw webp bytes.
+
+        The framed transport sends these unencoded; XML-RPC marshals them as
+        a base64 Binary.
+        """
+        return self._capture_active_screenshot(view_name, width, height, focus_object, background_color)
+
+    def _capture_active_screenshot(self, view_name, width, height, focus_object, background_color):
+        if not FreeCAD.GuiUp:
+            FreeCAD.Console.PrintLog("Screenshots are unavailable in headless mode\n")
+            return None
+
         # First check if the active view supports screenshots
         def check_view_supports_screenshots():
             try:
@@ -402,10 +1179,9 @@ class FreeCADRPC:
                 FreeCAD.Console.PrintError(f"Error checking view capabilities: {e}\n")
                 return False
                 
-        rpc_request_queue.put(check_view_supports_screenshots)
         try:
-            supports_screenshots = rpc_response_queue.get(timeout=30)
-        except queue.Empty:
+            supports_screenshots = run_in_gui(check_view_supports_screenshots, priority=PRIORITY_SCREENSHOT)
+        except TimeoutError:
             FreeCAD.Console.PrintWarning("Timed out checking screenshot support\n")
             return None
 
@@ -414,66 +1190,345 @@ class FreeCADRPC:
             return None
 
         # If view supports screenshots, proceed with capture
-        fd, tmp_path = tempfile.mkstemp(suffix=".webp")
-        os.close(fd)
-        rpc_request_queue.put(
-            lambda: self._save_active_screenshot(tmp_path, view_name, width, height, focus_object, background_color)
-        )
         try:
-            res = rpc_response_queue.get(timeout=30)
-        except queue.Empty:
-            try:
-                os.remove(tmp_path)
-            except FileNotFoundError:
-                pass
+            res = run_in_gui(
+                lambda: self._render_active_screenshot(view_name, width, height, focus_object, background_color),
+                priority=PRIORITY_SCREENSHOT,
+            )
+        except TimeoutError:
             FreeCAD.Console.PrintWarning("Timed out waiting for screenshot capture\n")
             return None
-        if res is True:
+        if isinstance(res, bytes):
+            return res
+        FreeCAD.Console.PrintWarning(f"Failed to capture screenshot: {res}\n")
+        return None
+
+    def _get_objects_gui(self, doc_name, query, since=None):
+        doc = FreeCAD.getDocument(doc_name)
+        if doc:
             try:
-                with open(tmp_path, "rb") as image_file:
-                    image_bytes = image_file.read()
-                    encoded = base64.b64encode(image_bytes).decode("utf-8")
-            finally:
+                if since is None:
+                    token = changes.token(doc_name)
+                    selected = query.select(doc.Objects)
+                    page = query.page(selected)
+                    with metrics.timed("serialize"):
+                        objects = query.serialize_all(page)
+                    result = {
+                        "success": True, "objects": objects, "token": token, "total": len(selected),
+                        "fingerprint": changes.fingerprint(doc)[0],
+                    }
+                    if query.offset + len(page) < len(selected):
+                        result["next_offset"] = query.offset + len(page)
+                    return result
+                delta = changes.diff(doc_name, since)
+                if delta is None:
+                    token = changes.token(doc_name)
+                    with metrics.timed("serialize"):
+                        objects = query.serialize_all(query.filter(doc.Objects))
+                        unchanged = query.serialize_all([])
+                    return {
+                        "success": True, "token": token, "reset": True,
+                        "added": objects, "changed": unchanged, "removed": [],
+                    }
+                added, changed, removed, token = delta
+                added_objects, changed_objects = [], []
+                if added or changed:
+                    for obj in query.filter(doc.Objects):
+                        if obj.Name in added:
+                            added_objects.append(obj)
+                        elif obj.Name in changed:
+                            changed_objects.append(obj)
+                with metrics.timed("serialize"):
+                    return {
+                        "success": True, "token": token, "removed": removed,
+                        "added": query.serialize_all(added_objects),
+                        "changed": query.serialize_all(changed_objects),
+                    }
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+        else:
+            return {"success": False, "error": f"Document '{doc_name}' not found"}
+
+    def _get_object_gui(self, doc_name, obj_name, fields=None):
+        doc = FreeCAD.getDocument(doc_name)
+        if doc:
+            obj = doc.getObject(obj_name)
+            if obj is None:
+                return {"success": False, "error": f"Object '{obj_name}' not found in '{doc_name}'"}
+            try:
+                with metrics.timed("serialize"):
+                    data = serialize_fields(obj, fields) if fields else serialize_object(obj)
+                return {"success": True, "object": data}
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+        else:
+            return {"success": False, "error": f"Document '{doc_name}' not found"}
+
+    def _get_mesh_gui(self, doc_name, names, tolerance):
+        doc = FreeCAD.getDocument(doc_name)
+        if not doc:
+            return {"success": False, "error": f"Document '{doc_name}' not found"}
+        if names is None:
+            targets = [
+                obj for obj in doc.Objects
+                if getattr(obj, "Visibility", True) and getattr(obj, "Shape", None) is not None
+            ]
+        else:
+            targets = []
+            for name in names:
+                obj = doc.getObject(name)
+                if obj is None:
+                    return {"success": False, "error": f"Object '{name}' not found in '{doc_name}'"}
+                targets.append(obj)
+        meshes = []
+        with metrics.timed("tessellate"):
+            for obj in targets:
                 try:
-                    os.remove(tmp_path)
-                except FileNotFoundError:
-                    pass
-            return encoded
+                    meshes.append(tessellate_object(obj, tolerance))
+                except Exception as e:
+                    meshes.append({"name": obj.Name, "error": str(e)})
+        return {"success": True, "meshes": meshes, "fingerprint": changes.fingerprint(doc)[0]}
+
+    def _query_region_gui(self, doc_name, region, contained):
+        doc = FreeCAD.getDocument(doc_name)
+        if not doc:
+            return {"success": False, "error": f"Document '{doc_name}' not found"}
+        index = spatial_index.index(doc)
+        names = sorted(index.search(region, contained))
+        return {
+            "success": True,
+            "objects": [{"name": name, "bound_box": list(index.boxes[name])} for name in names],
+        }
+
+    def _query_nearby_gui(self, doc_name, target, radius, k):
+        doc = FreeCAD.getDocument(doc_name)
+        if not doc:
+            return {"success": False, "error": f"Document '{doc_name}' not found"}
+        index = spatial_index.index(doc)
+        exclude = None
+        if isinstance(target, str):
+            if doc.getObject(target) is None:
+                return {"success": False, "error": f"Object '{target}' not found in '{doc_name}'"}
+            if target not in index.boxes:
+                return {"success": False, "error": f"Object '{target}' has no bounding box"}
+            box, exclude = index.boxes[target], target
         else:
             try:
-                os.remove(tmp_path)
-            except FileNotFoundError:
-                pass
-            FreeCAD.Console.PrintWarning(f"Failed to capture screenshot: {res}\n")
-            return None
+                box = make_box(target, target)
+            except (TypeError, ValueError) as e:
+                return {"success": False, "error": f"Invalid target: {e}"}
+        found = index.nearest(box, k=k, radius=radius, exclude=exclude)
+        return {
+            "success": True,
+            "objects": [
+                {"name": name, "distance": dist, "bound_box": list(index.boxes[name])}
+                for dist, name in found
+            ],
+        }
+
+    def _get_dependency_graph_gui(self, doc_name, root, depth):
+        doc = FreeCAD.getDocument(doc_name)
+        if not doc:
+            return {"success": False, "error": f"Document '{doc_name}' not found"}
+        if root is not None and doc.getObject(root) is None:
+            return {"success": False, "error": f"Object '{root}' not found in '{doc_name}'"}
+        return {"success": True, **dependency_graph.graph(doc).export(root, depth)}
+
+    def _get_downstream_impact_gui(self, doc_name, names, depth):
+        doc = FreeCAD.getDocument(doc_name)
+        if not doc:
+            return {"success": False, "error": f"Document '{doc_name}' not found"}
+        for name in names:
+            if doc.getObject(name) is None:
+                return {"success": False, "error": f"Object '{name}' not found in '{doc_name}'"}
+        return {"success": True, **dependency_graph.graph(doc).downstream(names, depth)}
+
+    def _get_document_fingerprint_gui(self, doc_name, objects):
+        doc = FreeCAD.getDocument(doc_name)
+        if not doc:
+            return {"success": False, "error": f"Document '{doc_name}' not found"}
+        fingerprint, token, per_object = changes.fingerprint(doc, objects if objects else None)
+        result = {"success": True, "fingerprint": fingerprint, "token": token}
+        if per_object is not None:
+            result["objects"] = per_object
+        return result
 
     def _create_document_gui(self, name):
         doc = FreeCAD.newDocument(name)
-        doc.recompute()
+        _recompute(doc)
         FreeCAD.Console.PrintMessage(f"Document '{name}' created via RPC.\n")
         return True
 
-    def _create_object_gui(self, doc_name, obj: Object):
+    def _batch_gui(self, doc_name: str, ops: list[dict[str, Any]], on_error: str):
+        doc = FreeCAD.getDocument(doc_name)
+        if not doc:
+            FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
+            return {"success": False, "error": f"Document '{doc_name}' not found."}
+
+        # Transactions are no-ops while undo is off, which is the default for
+        # documents made in FreeCADCmd: turn it on for the batch so a rollback
+        # really undoes the ops that succeeded
+        undo_mode = doc.UndoMode
+        if on_error == "rollback" and not undo_mode:
+            doc.UndoMode = 1
+        try:
+            return self._run_batch(doc, doc_name, ops, on_error)
+        finally:
+            if doc.UndoMode != undo_mode:
+                doc.UndoMode = undo_mode
+
+    def _run_batch(self, doc, doc_name: str, ops: list[dict[str, Any]], on_error: str):
+        if on_error == "rollback" and not doc.UndoMode:
+            return {
+                "success": False,
+                "rolled_back": False,
+                "error": f"Cannot roll back on '{doc_name}': undo is unavailable, nothing was applied.",
+                "results": [],
+            }
+        results = []
+        failed = False
+        doc.openTransaction("MCP batch")
+        for index, op in enumerate(ops):
+            kind = op.get("Op")
+            name = op.get("Name", "New_Object")
+            try:
+                if kind == "create":
+                    obj = Object(
+                        name=name,
+                        type=op["Type"],
+                        analysis=op.get("Analysis", None),
+                        properties=op.get("Properties", {}),
+                    )
+                    res = self._create_object_gui(doc_name, obj, recompute=False)
+                elif kind == "edit":
+                    obj = Object(name=name, properties=op.get("Properties", {}))
+                    res = self._edit_object_gui(doc_name, obj, recompute=False)
+                elif kind == "delete":
+                    res = self._delete_object_gui(doc_name, name, recompute=False)
+                else:
+                    res = f"Unknown op '{kind}', expected 'create', 'edit' or 'delete'."
+            except Exception as e:
+                res = str(e)
+
+            if res is True:
+                results.append({"index": index, "success": True, "object_name": name})
+                continue
+            results.append({"index": index, "success": False, "object_name": name, "error": res})
+            failed = True
+            if on_error == "rollback":
+                break
+
+        if failed and on_error == "rollback":
+            doc.abortTransaction()
+            _recompute(doc)
+            FreeCAD.Console.PrintWarning(
+                f"Batch on '{doc_name}' rolled back at op {len(results) - 1}.\n"
+            )
+            return {
+                "success": False,
+                "rolled_back": True,
+                "error": f"Op {len(results) - 1} failed: {results[-1]['error']}",
+                "results": results,
+            }
+
+        doc.commitTransaction()
+        _recompute(doc)
+        FreeCAD.Console.PrintMessage(f"Batch of {len(ops)} ops applied to '{doc_name}' via RPC.\n")
+        return {"success": not failed, "rolled_back": False, "results": results}
+
+    def _execute_code_gui(self, code: str, output_buffer: io.StringIO):
+        try:
+            with contextlib.redirect_stdout(output_buffer):
+                exec(code, globals())
+            FreeCAD.Console.PrintMessage("Python code executed successfully.\n")
+            return True
+        except Exception as e:
+            FreeCAD.Console.PrintError(
+                f"Error executing Python code: {e}\n"
+            )
+            return f"Error executing Python code: {e}\n"
+
+    def _execute_code_job(self, job, code: str):
+        output_buffer = io.StringIO()
+
+        def task():
+            job.report(0.0, "Executing code")
+            return self._execute_code_gui(code, output_buffer)
+
+        res = job.run_in_gui(task)
+        if res is not True:
+            raise RuntimeError(res)
+        return {"message": "Python code executed. \nOutput: " + output_buffer.getvalue()}
+
+    def _create_object_job(self, job, doc_name: str, obj: Object):
+        if obj.type == "Fem::FemMeshGmsh" and obj.analysis:
+            return self._gmsh_mesh_job(job, doc_name, obj)
+        job.report(0.0, f"Creating {obj.type}")
+        res = job.run_in_gui(lambda: self._create_object_gui(doc_name, obj))
+        if res is not True:
+            raise RuntimeError(res)
+        return {"object_name": obj.name}
+
+    def _gmsh_mesh_job(self, job, doc_name: str, obj: Object):
+        """Mesh in three slices: write inputs (GUI), run Gmsh (job thread), load mesh (GUI)."""
+        from femmesh.gmshtools import GmshTools
+
+        def prepare():
+            doc = FreeCAD.getDocument(doc_name)
+            mesh_obj = self._make_gmsh_mesh_object(doc, obj)
+            tools = GmshTools(mesh_obj)
+            tools.update_mesh_data()
+            tools.get_tmp_file_paths()
+            tools.get_gmsh_command()
+            tools.write_gmsh_input_files()
+            return mesh_obj.Name, tools
+
+        job.report(0.05, "Writing Gmsh input files")
+        mesh_name, tools = job.run_in_gui(prepare)
+        job.report(0.2, "Running Gmsh")
+        error = tools.run_gmsh_with_geo()
+        job.check_cancelled()
+        job.report(0.9, "Loading mesh")
+
+        def load():
+            tools.read_and_set_new_mesh()
+            _recompute(FreeCAD.getDocument(doc_name))
+
+        job.run_in_gui(load)
+        FreeCAD.Console.PrintMessage(
+            f"FEM Mesh '{mesh_name}' generated successfully in '{doc_name}'.\n"
+        )
+        result = {"object_name": mesh_name}
+        if error:
+            result["gmsh_output"] = str(error)
+        return result
+
+    def _make_gmsh_mesh_object(self, doc, obj: Object):
+        """Create and configure a FemMeshGmsh object; the mesh itself is not generated."""
+        res = getattr(doc, obj.analysis).addObject(ObjectsFem.makeMeshGmsh(doc, obj.name))[0]
+        if "Part" in obj.properties:
+            target_obj = doc.getObject(obj.properties["Part"])
+            if target_obj:
+                res.Part = target_obj
+            else:
+                raise ValueError(f"Referenced object '{obj.properties['Part']}' not found.")
+            del obj.properties["Part"]
+        else:
+            raise ValueError("'Part' property not found in properties.")
+
+        for param, value in obj.properties.items():
+            if hasattr(res, param):
+                setattr(res, param, value)
+        _recompute(doc)
+        return res
+
+    def _create_object_gui(self, doc_name, obj: Object, recompute: bool = True):
         doc = FreeCAD.getDocument(doc_name)
         if doc:
             try:
                 if obj.type == "Fem::FemMeshGmsh" and obj.analysis:
                     from femmesh.gmshtools import GmshTools
-                    res = getattr(doc, obj.analysis).addObject(ObjectsFem.makeMeshGmsh(doc, obj.name))[0]
-                    if "Part" in obj.properties:
-                        target_obj = doc.getObject(obj.properties["Part"])
-                        if target_obj:
-                            res.Part = target_obj
-                        else:
-                            raise ValueError(f"Referenced object '{obj.properties['Part']}' not found.")
-                        del obj.properties["Part"]
-                    else:
-                        raise ValueError("'Part' property not found in properties.")
-
-                    for param, value in obj.properties.items():
-                        if hasattr(res, param):
-                            setattr(res, param, value)
-                    doc.recompute()
+                    res = self._make_gmsh_mesh_object(doc, obj)
 
                     gmsh_tools = GmshTools(res)
                     gmsh_tools.create_mesh()
@@ -505,8 +1560,9 @@ class FreeCADRPC:
                     FreeCAD.Console.PrintMessage(
                         f"{res.TypeId} '{res.Name}' added to '{doc_name}' via RPC.\n"
                     )
- 
-                doc.recompute()
+
+                if recompute:
+                    _recompute(doc)
                 return True
             except Exception as e:
                 return str(e)
@@ -514,7 +1570,7 @@ class FreeCADRPC:
             FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
             return f"Document '{doc_name}' not found.\n"
 
-    def _edit_object_gui(self, doc_name: str, obj: Object):
+    def _edit_object_gui(self, doc_name: str, obj: Object, recompute: bool = True):
         doc = FreeCAD.getDocument(doc_name)
         if not doc:
             FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
@@ -547,13 +1603,14 @@ class FreeCADRPC:
                 # delete References from properties
                 del obj.properties["References"]
             set_object_property(doc, obj_ins, obj.properties)
-            doc.recompute()
+            if recompute:
+                _recompute(doc)
             FreeCAD.Console.PrintMessage(f"Object '{obj.name}' updated via RPC.\n")
             return True
         except Exception as e:
             return str(e)
 
-    def _delete_object_gui(self, doc_name: str, obj_name: str):
+    def _delete_object_gui(self, doc_name: str, obj_name: str, recompute: bool = True):
         doc = FreeCAD.getDocument(doc_name)
         if not doc:
             FreeCAD.Console.PrintError(f"Document '{doc_name}' not found.\n")
@@ -561,7 +1618,8 @@ class FreeCADRPC:
 
         try:
             doc.removeObject(obj_name)
-            doc.recompute()
+            if recompute:
+                _recompute(doc)
             FreeCAD.Console.PrintMessage(f"Object '{obj_name}' deleted via RPC.\n")
             return True
         except Exception as e:
@@ -574,7 +1632,8 @@ class FreeCADRPC:
         except Exception as e:
             return str(e)
 
-    def _save_active_screenshot(self, save_path: str, view_name: str = "Isometric", width: int | None = None, height: int | None = None, focus_object: str | None = None, background_color: str = "white"):
+    def _render_active_screenshot(self, view_name: str = "Isometric", width: int | None = None, height: int | None = None, focus_object: str | None = None, background_color: str = "white"):
+        """Webp bytes of the active view, or an error message."""
         try:
             view = FreeCADGui.ActiveDocument.ActiveView
             # Check if the view supports screenshots
@@ -616,14 +1675,18 @@ class FreeCADRPC:
                 view.fitAll()
             actual_width = min(width if width is not None else _SCREENSHOT_DEFAULT_WIDTH, _SCREENSHOT_MAX_DIM)
             actual_height = min(height if height is not None else _SCREENSHOT_DEFAULT_HEIGHT, _SCREENSHOT_MAX_DIM)
-            view.saveImage(save_path, actual_width, actual_height, background_color)
-            return True
+            with metrics.timed("screenshot"):
+                image = _render_webp(view, actual_width, actual_height, background_color)
+                if image is None:
+                    image = _save_image(view, actual_width, actual_height, background_color)
+            return image
         except Exception as e:
             return str(e)
 
 
-def start_rpc_server(port=9875):
-    global rpc_server_thread, rpc_server_instance
+def start_rpc_server(port=9875, framed_port=None):
+    global rpc_server_thread, rpc_server_instance, _gui_dispatcher, _gui_tick_budget
+    global framed_server_thread, framed_server_instance, metrics_exporter
 
     if rpc_server_instance:
         return "RPC Server already running."
@@ -631,15 +1694,36 @@ def start_rpc_server(port=9875):
     settings = load_settings()
     remote_enabled = settings.get("remote_enabled", False)
     allowed_ips = settings.get("allowed_ips", "127.0.0.1")
+    workers = int(settings.get("rpc_workers", 4))
+    _gui_tick_budget = max(0.0, float(settings.get("gui_tick_budget_ms", 50))) / 1000.0
+    if framed_port is None:
+        framed_port = int(settings.get("framed_port", 9876))
+    compression_threshold = max(0, int(settings.get("compression_threshold", 1024)))
 
     if remote_enabled:
         host = "0.0.0.0"
     else:
         host = "localhost"
 
-    rpc_server_instance = FilteredXMLRPCServer(
-        (host, port), allowed_ips_str=allowed_ips, allow_none=True, logRequests=False
+    if workers > 0:
+        rpc_server_instance = ThreadedXMLRPCServer(
+            (host, port), workers=workers, allowed_ips_str=allowed_ips,
+            requestHandler=TracingRequestHandler, allow_none=True, logRequests=False,
+        )
+    else:
+        rpc_server_instance = FilteredXMLRPCServer(
+            (host, port), allowed_ips_str=allowed_ips,
+            requestHandler=TracingRequestHandler, allow_none=True, logRequests=False,
+        )
+    rpc_server_instance.compression_threshold = compression_threshold
+    changes.install()
+    serialize.shape_time_budget = max(0.0, float(settings.get("shape_budget_ms", 50))) / 1000.0
+    serialization_cache.install(
+        max_bytes=int(float(settings.get("serialization_cache_mb", 64)) * 1024 * 1024)
     )
+    mesh_cache.configure(int(float(settings.get("mesh_cache_mb", 64)) * 1024 * 1024))
+    spatial_index.install()
+    dependency_graph.install()
     rpc_server_instance.register_instance(FreeCADRPC())
 
     def server_loop():
@@ -651,7 +1735,53 @@ def start_rpc_server(port=9875):
     rpc_server_thread = threading.Thread(target=server_loop, daemon=True)
     rpc_server_thread.start()
 
-    QtCore.QTimer.singleShot(500, process_gui_tasks)
+    if framed_port:
+        try:
+            framed_server_instance = FramedRPCServer(
+                (host, framed_port),
+                dispatch=rpc_server_instance._dispatch,
+                verify_request=rpc_server_instance.verify_request,
+                observe=metrics.observe,
+                compression_threshold=compression_threshold,
+            )
+        except OSError as e:
+            FreeCAD.Console.PrintWarning(
+                f"Framed transport disabled, could not bind {host}:{framed_port}: {e}\n"
+            )
+        else:
+            framed_server_thread = threading.Thread(
+                target=framed_server_instance.serve_forever, daemon=True
+            )
+            framed_server_thread.start()
+            FreeCAD.Console.PrintMessage(f"Framed transport listening at {host}:{framed_port}\n")
+
+    trace_file = settings.get("trace_file", "")
+    if trace_file:
+        try:
+            tracing.configure(trace_file)
+            FreeCAD.Console.PrintMessage(f"Writing trace spans to {trace_file}\n")
+        except OSError as e:
+            FreeCAD.Console.PrintError(f"Tracing disabled, cannot open {trace_file}: {e}\n")
+
+    metrics_port = int(settings.get("metrics_port", 0))
+    metrics_file = settings.get("metrics_file", "")
+    if metrics_port or metrics_file:
+        try:
+            metrics_exporter = PrometheusExporter(
+                _render_prometheus, host=host, port=metrics_port, path=metrics_file
+            )
+        except OSError as e:
+            FreeCAD.Console.PrintWarning(f"Prometheus export disabled: {e}\n")
+        else:
+            if metrics_port:
+                FreeCAD.Console.PrintMessage(f"Prometheus metrics at http://{host}:{metrics_port}/metrics\n")
+            if metrics_file:
+                FreeCAD.Console.PrintMessage(f"Prometheus metrics written to {metrics_file}\n")
+
+    if _gui_dispatcher is None:
+        _gui_dispatcher = GuiTaskDispatcher() if FreeCAD.GuiUp else HeadlessTaskExecutor()
+    # Drain anything queued before the dispatcher existed
+    process_gui_tasks()
 
     msg = f"RPC Server started at {host}:{port}."
     if remote_enabled:
@@ -661,9 +1791,29 @@ def start_rpc_server(port=9875):
 
 def stop_rpc_server():
     global rpc_server_instance, rpc_server_thread
+    global framed_server_instance, framed_server_thread, metrics_exporter
+
+    if metrics_exporter:
+        metrics_exporter.stop()
+        metrics_exporter = None
+
+    tracing.configure("")
+    changes.uninstall()
+    serialization_cache.uninstall()
+    mesh_cache.clear()
+    spatial_index.uninstall()
+    dependency_graph.uninstall()
+
+    if framed_server_instance:
+        framed_server_instance.shutdown()
+        framed_server_instance.server_close()
+        framed_server_thread.join(timeout=5)
+        framed_server_instance = None
+        framed_server_thread = None
 
     if rpc_server_instance:
         rpc_server_instance.shutdown()
+        rpc_server_instance.server_close()
         rpc_server_thread.join(timeout=5)
         if rpc_server_thread.is_alive():
             FreeCAD.Console.PrintWarning("RPC server thread did not stop within timeout\n")
@@ -782,12 +1932,6 @@ class ConfigureAllowedIPsCommand:
         return True
 
 
-FreeCADGui.addCommand("Start_RPC_Server", StartRPCServerCommand())
-FreeCADGui.addCommand("Stop_RPC_Server", StopRPCServerCommand())
-FreeCADGui.addCommand("Toggle_Remote_Connections", ToggleRemoteConnectionsCommand())
-FreeCADGui.addCommand("Configure_Allowed_IPs", ConfigureAllowedIPsCommand())
-
-
 def _sync_remote_toggle_state():
     """Sync the Remote Connections checkbox with saved settings on startup."""
     try:
@@ -804,4 +1948,9 @@ def _sync_remote_toggle_state():
     QtCore.QTimer.singleShot(2000, _sync_remote_toggle_state)
 
 
-QtCore.QTimer.singleShot(2000, _sync_remote_toggle_state)
\ No newline at end of file
+if FreeCAD.GuiUp:
+    FreeCADGui.addCommand("Start_RPC_Server", StartRPCServerCommand())
+    FreeCADGui.addCommand("Stop_RPC_Server", StopRPCServerCommand())
+    FreeCADGui.addCommand("Toggle_Remote_Connections", ToggleRemoteConnectionsCommand())
+    FreeCADGui.addCommand("Configure_Allowed_IPs", ConfigureAllowedIPsCommand())
+    QtCore.QTimer.singleShot(2000, _sync_remote_toggle_state)
\ No newline at end of file
@@ -1,5 +1,8 @@
 import FreeCAD as App
-import json
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
 
 # Properties to skip in full serialization — large, internal, or already captured separately
 _SKIP_PROPERTIES = frozenset({
@@ -14,44 +17,182 @@ _SKIP_PROPERTIES = frozenset({
 # Max length for str() fallback values — prevents huge strings from Shape objects etc.
 _MAX_STR_LEN = 200
 
+# Seconds serialize_shape may spend per shape before skipping the remaining
+# metrics; 0 disables the limit. Set from the shape_budget_ms setting.
+shape_time_budget = 0.05
+
+# Shape metrics memoized by shape hash, so shared or unchanged shapes are
+# measured once. Only the values are kept, not the shape, so a freed shape's
+# hash can come back on a new one: serialization_cache's observer drops an
+# entry when the Shape of an object it was measured for changes or goes away,
+# and the memo is only used while that observer is installed.
+_SHAPE_MEMO_SIZE = 8192
+_shape_memo = OrderedDict()  # hashCode -> {metric: value}
+_shape_owners = {}  # (document, object) -> hashCode of the shape measured for it
+_shape_memo_lock = threading.Lock()
+
+
+def _vector(value):
+    return {"x": value.x, "y": value.y, "z": value.z}
+
+
+def _rotation(value):
+    return {"Axis": _vector(value.Axis), "Angle": value.Angle}
+
+
+def _placement(value):
+    return {"Base": _vector(value.Base), "Rotation": _rotation(value.Rotation)}
+
+
+def _sequence(value):
+    return [serialize_value(v) for v in value]
+
+
+def _link(value):
+    return {"Name": value.Name, "Label": value.Label}
+
+
+def _text(value):
+    s = str(value)
+    return s[:_MAX_STR_LEN] + "…" if len(s) > _MAX_STR_LEN else s
+
+
+def _identity(value):
+    return value
+
+
+def _converter_for(cls):
+    """The converter for instances of *cls*, resolved by the same checks in order."""
+    if issubclass(cls, (int, float, str, bool)):
+        return _identity
+    if issubclass(cls, App.Vector):
+        return _vector
+    if issubclass(cls, App.Rotation):
+        return _rotation
+    if issubclass(cls, App.Placement):
+        return _placement
+    if issubclass(cls, (list, tuple)):
+        return _sequence
+    if hasattr(App, "Color") and issubclass(cls, App.Color):
+        return list
+    if hasattr(App, "DocumentObject") and issubclass(cls, App.DocumentObject):
+        return _link
+    return _text
+
+
+# Converter per exact value type, filled in by _converter_for on first sight
+_CONVERTERS = {
+    int: _identity, float: _identity, str: _identity, bool: _identity,
+    list: _sequence, tuple: _sequence,
+}
+
+
+def _converter(cls):
+    convert = _CONVERTERS.get(cls)
+    if convert is None:
+        convert = _CONVERTERS[cls] = _converter_for(cls)
+    return convert
+
 
 def serialize_value(value):
-    if isinstance(value, (int, float, str, bool)):
-        return value
-    elif isinstance(value, App.Vector):
-        return {"x": value.x, "y": value.y, "z": value.z}
-    elif isinstance(value, App.Rotation):
-        return {
-            "Axis": {"x": value.Axis.x, "y": value.Axis.y, "z": value.Axis.z},
-            "Angle": value.Angle,
-        }
-    elif isinstance(value, App.Placement):
-        return {
-            "Base": serialize_value(value.Base),
-            "Rotation": serialize_value(value.Rotation),
-        }
-    elif isinstance(value, (list, tuple)):
-        return [serialize_value(v) for v in value]
-    elif hasattr(App, "Color") and isinstance(value, App.Color):
-        return list(value)
-    elif hasattr(App, "DocumentObject") and isinstance(value, App.DocumentObject):
-        return {"Name": value.Name, "Label": value.Label}
-    else:
-        s = str(value)
-        return s[:_MAX_STR_LEN] + "…" if len(s) > _MAX_STR_LEN else s
+    return _converter(type(value))(value)
+
+
+def _count_elements(shape, kind, attr):
+    count = getattr(shape, "countElement", None)
+    if count is not None:
+        # Counts the indexed sub-shapes without building a wrapper per element
+        return count(kind)
+    return len(getattr(shape, attr))
+
+
+# Output order of serialize_shape; the counts are computed first since they are cheap
+_SHAPE_FIELDS = ("Volume", "Area", "VertexCount", "EdgeCount", "FaceCount")
+_MASS_METRICS = (("Volume", lambda s: s.Volume), ("Area", lambda s: s.Area))
+
+# Estimated seconds per face of each mass metric, a guess until refined by
+# the shapes measured. A metric is only started when its estimate fits in
+# what is left of shape_time_budget.
+_mass_cost = {"Volume": 5e-5, "Area": 2.5e-5}
+
+
+def _shape_memo_key(shape):
+    try:
+        return shape.hashCode()
+    except Exception:
+        return None
+
+
+def _forget_shapes(doc_name, names=None):
+    """Drop memoized metrics of the shapes measured for *names*, or the whole document."""
+    with _shape_memo_lock:
+        if names is None:
+            names = [name for doc, name in _shape_owners if doc == doc_name]
+        for name in names:
+            key = _shape_owners.pop((doc_name, name), None)
+            if key is not None:
+                _shape_memo.pop(key, None)
+
 
+def _clear_shape_memo():
+    with _shape_memo_lock:
+        _shape_memo.clear()
+        _shape_owners.clear()
 
-def serialize_shape(shape):
+
+def serialize_shape(shape, owner=None):
+    """Volume, Area and sub-shape counts of *shape*.
+
+    Counts come from ``countElement`` when available. Volume and Area are
+    skipped when their estimated cost, from the face count, does not fit in
+    ``shape_time_budget``; skipped metrics are listed under "omitted"
+    instead. Those of *owner*'s shape (the document object it belongs to)
+    are memoized by shape hash while ``serialization_cache`` is installed.
+    """
     if shape is None:
         return None
     try:
-        return {
-            "Volume": shape.Volume,
-            "Area": shape.Area,
-            "VertexCount": len(shape.Vertexes),
-            "EdgeCount": len(shape.Edges),
-            "FaceCount": len(shape.Faces),
-        }
+        start = time.perf_counter()
+        counts = (
+            _count_elements(shape, "Vertex", "Vertexes"),
+            _count_elements(shape, "Edge", "Edges"),
+            _count_elements(shape, "Face", "Faces"),
+        )
+        values = dict(zip(("VertexCount", "EdgeCount", "FaceCount"), counts))
+        faces = max(counts[2], 1)
+        key = None
+        memo = {}
+        if owner is not None and serialization_cache._installed:
+            key = _shape_memo_key(shape)
+        if key is not None:
+            with _shape_memo_lock:
+                memo = dict(_shape_memo.get(key, ()))
+        measured = False
+        for name, measure in _MASS_METRICS:
+            if name in memo:
+                continue
+            if shape_time_budget:
+                remaining = shape_time_budget - (time.perf_counter() - start)
+                if faces * _mass_cost[name] > remaining:
+                    continue
+            began = time.perf_counter()
+            memo[name] = measure(shape)
+            _mass_cost[name] = 0.75 * _mass_cost[name] + 0.25 * (time.perf_counter() - began) / faces
+            measured = True
+        if key is not None:
+            with _shape_memo_lock:
+                _shape_owners[(owner.Document.Name, owner.Name)] = key
+                if measured:
+                    _shape_memo[key] = memo
+                if key in _shape_memo:
+                    _shape_memo.move_to_end(key)
+                if len(_shape_memo) > _SHAPE_MEMO_SIZE:
+                    _shape_memo.popitem(last=False)
+        values.update(memo)
+        result = {name: values[name] for name in _SHAPE_FIELDS if name in values}
+        if len(result) < len(_SHAPE_FIELDS):
+            result["omitted"] = [name for name in _SHAPE_FIELDS if name not in values]
+        return result
     except Exception as e:
         return {"error": str(e)}
 
@@ -67,6 +208,226 @@ def serialize_view_object(view):
     return result
 
 
+# Estimated JSON size of a number, bool or None, and of each item of a
+# container nested deeper than _estimated_size looks
+_SCALAR_SIZE = 16
+_NESTED_ITEM_SIZE = 24
+
+
+def _estimated_size(value, depth=2):
+    """Approximate JSON length of *value*, from its structure instead of encoding it.
+
+    Strings count their length and scalars a fixed size; containers more
+    than *depth* levels down count a fixed size per item.
+    """
+    cls = type(value)
+    if cls is str:
+        return len(value) + 2
+    if cls is dict:
+        if not depth:
+            return 2 + _NESTED_ITEM_SIZE * len(value)
+        size = 2
+        for key, item in value.items():
+            cls = type(item)
+            if cls is str:
+                size += len(key) + len(item) + 6
+            elif cls is dict or cls is list or cls is tuple:
+                size += len(key) + 4 + _estimated_size(item, depth - 1)
+            else:
+                size += len(key) + 4 + _SCALAR_SIZE
+        return size
+    if cls is list or cls is tuple:
+        if not depth:
+            return 2 + _NESTED_ITEM_SIZE * len(value)
+        size = 2
+        for item in value:
+            cls = type(item)
+            if cls is str:
+                size += len(item) + 3
+            elif cls is dict or cls is list or cls is tuple:
+                size += 1 + _estimated_size(item, depth - 1)
+            else:
+                size += 1 + _SCALAR_SIZE
+        return size
+    return _SCALAR_SIZE
+
+
+class SerializationCache:
+    """Bounded LRU of serialized document objects.
+
+    Entries are keyed by (document, object, summary_only), or
+    _FLAT_SUMMARY for serialize_columns' rows, and dropped by
+    document observer events: any change to the object, a Label change for
+    its direct dependents (their links embed it) and a Shape change for
+    everything depending on it. ViewObject data is not cached, since view
+    provider changes do not reach App observers. Sizes are estimated from
+    each entry's structure by _estimated_size, without encoding it; least
+    recently used entries are evicted beyond *max_bytes*. Inactive until
+    :meth:`install` registers the observer. Cached dicts are shared between
+    callers and must not be mutated.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._per_document = {}  # document name -> entry count
+        self._bytes = 0
+        self._installed = False
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def install(self, max_bytes=None):
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if not self._installed and self.max_bytes > 0:
+            self.clear()
+            App.addDocumentObserver(self)
+            self._installed = True
+
+    def uninstall(self):
+        if self._installed:
+            App.removeDocumentObserver(self)
+            self._installed = False
+            self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._per_document.clear()
+            self._bytes = 0
+        _clear_shape_memo()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def reset_counters(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get(self, key):
+        if not self._installed:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        if not self._installed:
+            return
+        size = _estimated_size(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            else:
+                self._per_document[key[0]] = self._per_document.get(key[0], 0) + 1
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key):
+        # Caller holds the lock
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        remaining = self._per_document[key[0]] - 1
+        if remaining:
+            self._per_document[key[0]] = remaining
+        else:
+            del self._per_document[key[0]]
+        return True
+
+    def _invalidate(self, doc_name, names):
+        with self._lock:
+            for name in names:
+                for variant in (True, False, _FLAT_SUMMARY):
+                    if self._drop((doc_name, name, variant)):
+                        self.invalidations += 1
+
+    def _invalidate_document(self, doc):
+        _forget_shapes(doc.Name)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == doc.Name]:
+                self._drop(key)
+                self.invalidations += 1
+
+    def _dependents(self, obj, recursive):
+        if recursive and hasattr(obj, "InListRecursive"):
+            return obj.InListRecursive
+        seen = {}
+        pending = list(obj.InList)
+        while pending:
+            dep = pending.pop()
+            if dep.Name not in seen:
+                seen[dep.Name] = dep
+                if recursive:
+                    pending.extend(dep.InList)
+        return list(seen.values())
+
+    # --- FreeCAD observer slots (called on the thread making the change) ---
+
+    def slotChangedObject(self, obj, prop):
+        doc_name = obj.Document.Name
+        if prop == "Shape":
+            _forget_shapes(doc_name, [obj.Name])
+        if doc_name not in self._per_document:
+            return
+        names = [obj.Name]
+        if prop in ("Shape", "Label"):
+            try:
+                names += [dep.Name for dep in self._dependents(obj, recursive=prop == "Shape")]
+            except Exception:
+                self._invalidate_document(obj.Document)
+                return
+        self._invalidate(doc_name, names)
+
+    def slotCreatedObject(self, obj):
+        # A new object may reuse the name of a deleted one
+        self._invalidate(obj.Document.Name, [obj.Name])
+
+    def slotDeletedObject(self, obj):
+        _forget_shapes(obj.Document.Name, [obj.Name])
+        self._invalidate(obj.Document.Name, [obj.Name])
+
+    def slotAppendDynamicProperty(self, obj, prop):
+        self._invalidate(obj.Document.Name, [obj.Name])
+
+    def slotRemoveDynamicProperty(self, obj, prop):
+        self._invalidate(obj.Document.Name, [obj.Name])
+
+    def slotDeletedDocument(self, doc):
+        self._invalidate_document(doc)
+
+    def slotUndoDocument(self, doc):
+        self._invalidate_document(doc)
+
+    def slotRedoDocument(self, doc):
+        self._invalidate_document(doc)
+
+    def slotAbortTransaction(self, doc):
+        self._invalidate_document(doc)
+
+
+serialization_cache = SerializationCache()
+
+
 def serialize_object(obj, summary_only: bool = False):
     """Serialize a FreeCAD object to a JSON-safe dict.
 
@@ -75,6 +436,9 @@ def serialize_object(obj, summary_only: bool = False):
         summary_only: When True, return only Name/Label/TypeId/Placement/Shape —
             no Properties dict, no ViewObject. Use for listing many objects.
             When False (default), return all properties excluding _SKIP_PROPERTIES.
+
+    Document objects are served from ``serialization_cache`` when it is
+    installed.
     """
     if isinstance(obj, list):
         return [serialize_object(item, summary_only=summary_only) for item in obj]
@@ -86,30 +450,237 @@ def serialize_object(obj, summary_only: bool = False):
             "Objects": [serialize_object(child, summary_only=summary_only) for child in obj.Objects],
         }
     else:
-        result = {
-            "Name": obj.Name,
-            "Label": obj.Label,
-            "TypeId": obj.TypeId,
-            "Placement": serialize_value(getattr(obj, "Placement", None)),
-            "Shape": serialize_shape(getattr(obj, "Shape", None)),
-        }
-
+        doc = getattr(obj, "Document", None)
+        key = (doc.Name, obj.Name, summary_only) if doc is not None else None
+        result = serialization_cache.get(key) if key is not None else None
+        if result is None:
+            result = _serialize_document_object(obj, summary_only)
+            shape = result.get("Shape")
+            # Metrics skipped for time may fit the budget on a later call
+            if key is not None and not (shape and "omitted" in shape):
+                serialization_cache.put(key, result)
         if summary_only:
             return result
+        result = dict(result)
+        if hasattr(obj, "ViewObject") and obj.ViewObject is not None:
+            result["ViewObject"] = serialize_view_object(obj.ViewObject)
+        return result
 
-        result["Properties"] = {}
-        result["ViewObject"] = {}
 
-        for prop in obj.PropertiesList:
+def _serialize_document_object(obj, summary_only):
+    """Everything serialize_object returns for *obj*, except ViewObject."""
+    result = {
+        "Name": obj.Name,
+        "Label": obj.Label,
+        "TypeId": obj.TypeId,
+        "Placement": serialize_value(getattr(obj, "Placement", None)),
+        "Shape": serialize_shape(getattr(obj, "Shape", None), obj),
+    }
+
+    if summary_only:
+        return result
+
+    result["Properties"] = properties = {}
+    result["ViewObject"] = {}
+
+    for prop, cls, convert in _property_plan(obj):
+        try:
+            value = getattr(obj, prop)
+            properties[prop] = convert(value) if type(value) is cls else serialize_value(value)
+        except Exception as e:
+            properties[prop] = f"<error: {str(e)}>"
+
+    return result
+
+
+# Property plans by (TypeId, PropertiesList): the properties to read, each
+# with the value type seen first and its converter
+_property_plans = {}
+_MAX_PROPERTY_PLANS = 1024
+
+
+def _property_plan(obj):
+    properties = tuple(obj.PropertiesList)
+    key = (obj.TypeId, properties)
+    plan = _property_plans.get(key)
+    if plan is None:
+        plan = []
+        for prop in properties:
             if prop in _SKIP_PROPERTIES:
                 continue
             try:
-                result["Properties"][prop] = serialize_value(getattr(obj, prop))
+                cls = type(getattr(obj, prop))
+                plan.append((prop, cls, _converter(cls)))
+            except Exception:
+                # Never matches a value's type, so falls back to serialize_value
+                plan.append((prop, None, serialize_value))
+        plan = tuple(plan)
+        if len(_property_plans) >= _MAX_PROPERTY_PLANS:
+            _property_plans.clear()
+        _property_plans[key] = plan
+    return plan
+
+
+def serialize_fields(obj, fields):
+    """Serialize only *fields* of *obj*, plus its Name.
+
+    A field is "Label", "TypeId", "Placement", "Shape", "ViewObject" or any
+    property name, and only those are evaluated. Fields the object does not
+    have are left out of the result.
+    """
+    result = {"Name": obj.Name}
+    for name in fields:
+        if name in result:
+            continue
+        if name == "Shape":
+            result["Shape"] = serialize_shape(getattr(obj, "Shape", None), obj)
+        elif name == "ViewObject":
+            result["ViewObject"] = serialize_view_object(getattr(obj, "ViewObject", None))
+        else:
+            try:
+                value = getattr(obj, name)
+            except AttributeError:
+                continue
+            except Exception as e:
+                result[name] = f"<error: {str(e)}>"
+                continue
+            if callable(value):
+                # A method of the object, not a property
+                continue
+            try:
+                result[name] = serialize_value(value)
             except Exception as e:
-                result["Properties"][prop] = f"<error: {str(e)}>"
+                result[name] = f"<error: {str(e)}>"
+    return result
 
-        if hasattr(obj, "ViewObject") and obj.ViewObject is not None:
-            view = obj.ViewObject
-            result["ViewObject"] = serialize_view_object(view)
 
-        return result
+# Keys of a serialized Vector; such dicts become vec3 columns
+_XYZ = frozenset({"x", "y", "z"})
+
+
+# serialization_cache key variant for flattened summary rows
+_FLAT_SUMMARY = "flat-summary"
+# One shared tuple per distinct row layout, so rows compare by identity
+_layouts = {}
+_MAX_LAYOUTS = 1024
+_NO_VECTOR = (None, None, None)
+
+
+def _flatten(value, path, names, values):
+    if isinstance(value, dict):
+        if value.keys() == _XYZ:
+            names.append(path)
+            values.append((value["x"], value["y"], value["z"]))
+        else:
+            for key, item in value.items():
+                _flatten(item, f"{path}.{key}", names, values)
+    else:
+        names.append(path)
+        values.append(value)
+
+
+def _flat_row(row):
+    """``(column names, values)`` of a serialized object; vectors become (x, y, z) tuples."""
+    names, values = [], []
+    for key, value in row.items():
+        _flatten(value, key, names, values)
+    names = tuple(names)
+    if len(_layouts) >= _MAX_LAYOUTS:
+        _layouts.clear()
+    return _layouts.setdefault(names, names), tuple(values)
+
+
+def _flat_summary(obj):
+    doc = getattr(obj, "Document", None)
+    key = (doc.Name, obj.Name, _FLAT_SUMMARY) if doc is not None else None
+    flat = serialization_cache.get(key) if key is not None else None
+    if flat is None:
+        row = serialize_object(obj, summary_only=True)
+        flat = _flat_row(row)
+        shape = row.get("Shape")
+        if key is not None and not (shape and "omitted" in shape):
+            serialization_cache.put(key, flat)
+    return flat
+
+
+def _encode_column(values):
+    kinds = set(map(type, values))
+    missing = type(None) in kinds
+    kinds.discard(type(None))
+    if kinds == {tuple}:
+        if missing:
+            values = [_NO_VECTOR if v is None else v for v in values]
+        return {"vec3": list(chain.from_iterable(values))}
+    if kinds == {str}:
+        distinct = dict.fromkeys(values)
+        distinct.pop(None, None)
+        # Only worth it when values repeat, as TypeIds do
+        if 2 * len(distinct) <= len(values):
+            index = {value: i for i, value in enumerate(distinct)}
+            index[None] = None
+            return {"dictionary": list(distinct), "indices": list(map(index.__getitem__, values))}
+    return values
+
+
+def serialize_columns(objects, summary_only=True, fields=None):
+    """Serialize *objects* as one column per field instead of one dict per object.
+
+    Objects are serialized as by serialize_object (or serialize_fields when
+    *fields* is given), and nested values are split into dotted columns
+    ("Placement.Rotation.Angle", "Shape.Volume"). A column is a list with one
+    value per object (None where the object lacks it), or:
+
+    - ``{"vec3": [x0, y0, z0, x1, ...]}`` for vectors such as "Placement.Base";
+    - ``{"dictionary": [...], "indices": [...]}`` for strings that repeat,
+      such as "TypeId".
+
+    Returns ``{"count": len(objects), "columns": {...}}``. Flattened summary
+    rows are kept in ``serialization_cache`` next to the summaries.
+    """
+    if fields is not None:
+        flat = [_flat_row(serialize_fields(obj, fields)) for obj in objects]
+    elif summary_only:
+        flat = [_flat_summary(obj) for obj in objects]
+    else:
+        flat = [_flat_row(serialize_object(obj, summary_only=False)) for obj in objects]
+    count = len(flat)
+    layout = flat[0][0] if flat else ()
+    if all(names is layout for names, _ in flat):
+        columns = dict(zip(layout, map(list, zip(*(values for _, values in flat)))))
+    else:
+        # Rows sharing a layout are transposed together, then scattered
+        groups = {}
+        for i, (names, values) in enumerate(flat):
+            group = groups.get(names)
+            if group is None:
+                group = groups[names] = ([], [])
+            group[0].append(i)
+            group[1].append(values)
+        columns = {}
+        for names, (rows, values) in groups.items():
+            for name, column_values in zip(names, zip(*values)):
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = [None] * count
+                for i, value in zip(rows, column_values):
+                    column[i] = value
+    return {"count": count, "columns": {name: _encode_column(values) for name, values in columns.items()}}
+
+
+def sort_key(obj, path):
+    """Sort key for *obj* by a property or dotted path such as "Placement.Base.z".
+
+    Numbers (including Quantity values) sort before strings. Objects without
+    the property get ``(2, 0)``.
+    """
+    value = obj
+    try:
+        for part in path.split("."):
+            value = getattr(value, part)
+    except Exception:
+        return (2, 0)
+    value = getattr(value, "Value", value)  # Units.Quantity
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, str(value))
+
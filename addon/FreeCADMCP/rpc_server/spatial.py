@@ -0,0 +1,310 @@
+"""Bounding-box index of document objects for region and proximity queries.
+
+Each document gets an R-tree over its objects' ``Shape.BoundBox``, bulk
+loaded in sort-tile-recursive order the first time it is queried. As a
+document observer, ``SpatialIndex`` notes which objects were created,
+reshaped, moved or deleted; the next query re-reads just those boxes. Until
+the tree is rebuilt, updated boxes live in a small side list scanned
+linearly and their old tree entries are skipped. The tree is rebuilt once
+such pending updates exceed a fraction of the document, so updates stay
+cheap and queries stay logarithmic.
+
+Distances are between bounding boxes (0 when they overlap), so they are a
+lower bound on the distance between the shapes themselves.
+"""
+
+import heapq
+import math
+import threading
+
+import FreeCAD
+
+# Children per tree node
+_NODE_CAPACITY = 16
+# Pending updates always tolerated before a rebuild, and the fraction of the
+# document (1/n) beyond which the tree is rebuilt
+_MIN_PENDING = 64
+_REBUILD_FRACTION = 16
+
+# Properties whose change moves or reshapes an object's bounding box
+_GEOMETRY_PROPERTIES = frozenset({"Shape", "Placement"})
+
+_INF = float("inf")
+
+
+def bound_box(obj):
+    """``(xmin, ymin, zmin, xmax, ymax, zmax)`` of *obj*'s shape, or None."""
+    shape = getattr(obj, "Shape", None)
+    if shape is None:
+        return None
+    try:
+        box = shape.BoundBox
+        if not box.isValid():
+            return None
+        return (box.XMin, box.YMin, box.ZMin, box.XMax, box.YMax, box.ZMax)
+    except Exception:
+        return None
+
+
+def make_box(low, high):
+    """A query box from two corners; None in either means unbounded on that axis."""
+    low = [(-_INF if v is None else float(v)) for v in low]
+    high = [(_INF if v is None else float(v)) for v in high]
+    if len(low) != 3 or len(high) != 3:
+        raise ValueError("Box corners need three coordinates each")
+    return tuple(low + high)
+
+
+def _union(boxes):
+    boxes = list(boxes)
+    return (
+        min(b[0] for b in boxes), min(b[1] for b in boxes), min(b[2] for b in boxes),
+        max(b[3] for b in boxes), max(b[4] for b in boxes), max(b[5] for b in boxes),
+    )
+
+
+def _intersects(a, b):
+    return (
+        a[0] <= b[3] and b[0] <= a[3]
+        and a[1] <= b[4] and b[1] <= a[4]
+        and a[2] <= b[5] and b[2] <= a[5]
+    )
+
+
+def _contains(outer, inner):
+    return (
+        outer[0] <= inner[0] and outer[1] <= inner[1] and outer[2] <= inner[2]
+        and inner[3] <= outer[3] and inner[4] <= outer[4] and inner[5] <= outer[5]
+    )
+
+
+def distance(a, b):
+    """Shortest distance between two boxes, 0 if they touch or overlap."""
+    dx = max(a[0] - b[3], b[0] - a[3], 0.0)
+    dy = max(a[1] - b[4], b[1] - a[4], 0.0)
+    dz = max(a[2] - b[5], b[2] - a[5], 0.0)
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+def _center(axis):
+    return lambda item: item[0][axis] + item[0][axis + 3]
+
+
+def _tile(items, capacity):
+    """Group (box, ...) items into runs of *capacity*, tiling x, then y, then z."""
+    groups = []
+    slabs = math.ceil(math.ceil(len(items) / capacity) ** (1 / 3))
+    items = sorted(items, key=_center(0))
+    slab_size = math.ceil(len(items) / slabs)
+    for i in range(0, len(items), slab_size):
+        slab = sorted(items[i:i + slab_size], key=_center(1))
+        columns = math.ceil(math.sqrt(math.ceil(len(slab) / capacity)))
+        column_size = math.ceil(len(slab) / columns)
+        for j in range(0, len(slab), column_size):
+            column = sorted(slab[j:j + column_size], key=_center(2))
+            for k in range(0, len(column), capacity):
+                groups.append(column[k:k + capacity])
+    return groups
+
+
+def _build(entries, capacity=_NODE_CAPACITY):
+    """Root node ``(box, children, is_leaf)`` over (box, name) entries, or None."""
+    if not entries:
+        return None
+    level, leaf = entries, True
+    while True:
+        nodes = [(_union(item[0] for item in group), group, leaf) for group in _tile(level, capacity)]
+        if len(nodes) == 1:
+            return nodes[0]
+        level, leaf = nodes, False
+
+
+class _DocumentIndex:
+    """Packed tree of one document plus the updates made since it was built."""
+
+    def __init__(self, boxes):
+        self.boxes = boxes  # object name -> current box
+        self.root = _build([(box, name) for name, box in boxes.items()])
+        self.tree_names = frozenset(boxes)
+        # Tree entries that are out of date, and current boxes not in the tree
+        self.stale = set()
+        self.extra = {}
+
+    def update(self, name, box):
+        if name in self.tree_names:
+            self.stale.add(name)
+        if box is None:
+            self.boxes.pop(name, None)
+            self.extra.pop(name, None)
+        else:
+            self.boxes[name] = box
+            self.extra[name] = box
+
+    def needs_rebuild(self):
+        pending = len(self.stale) + len(self.extra)
+        return pending > max(_MIN_PENDING, len(self.boxes) // _REBUILD_FRACTION)
+
+    def search(self, region, contained=False):
+        """Names of objects whose box intersects (or lies inside) *region*."""
+        test = _contains if contained else _intersects
+        found = [name for name, box in self.extra.items() if test(region, box)]
+        stack = [self.root] if self.root is not None and _intersects(region, self.root[0]) else []
+        while stack:
+            _, children, leaf = stack.pop()
+            if leaf:
+                found.extend(
+                    name for box, name in children
+                    if test(region, box) and name not in self.stale
+                )
+            else:
+                stack.extend(child for child in children if _intersects(region, child[0]))
+        return found
+
+    def nearest(self, target, k=None, radius=None, exclude=None):
+        """``(distance, name)`` pairs closest to the *target* box, nearest first.
+
+        Stops after *k* results and at *radius*, whichever comes first.
+        """
+        limit = _INF if radius is None else radius
+        # Entries are (distance, tiebreak, name or None, node); the tiebreak
+        # keeps tuples comparable when distances are equal
+        heap = [(distance(target, box), i, name, None) for i, (name, box) in enumerate(self.extra.items())]
+        counter = len(heap)
+        if self.root is not None:
+            heap.append((distance(target, self.root[0]), counter, None, self.root))
+            counter += 1
+        heapq.heapify(heap)
+        results = []
+        while heap and (k is None or len(results) < k):
+            dist, _, name, node = heapq.heappop(heap)
+            if dist > limit:
+                break
+            if node is None:
+                if name != exclude:
+                    results.append((dist, name))
+                continue
+            _, children, leaf = node
+            for child in children:
+                if leaf:
+                    box, child_name = child
+                    if child_name in self.stale:
+                        continue
+                    entry = (distance(target, box), counter, child_name, None)
+                else:
+                    entry = (distance(target, child[0]), counter, None, child)
+                if entry[0] <= limit:
+                    heapq.heappush(heap, entry)
+                    counter += 1
+        return results
+
+
+class SpatialIndex:
+    """Per-document bounding-box trees, kept current by document observer events.
+
+    Queries must run on the thread owning the documents (the GUI thread).
+    Without :meth:`install`, every query rebuilds the document's tree.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = {}  # document name -> _DocumentIndex
+        self._dirty = {}  # document name -> object names changed since the last query
+        self._installed = False
+        self.builds = self.updates = 0
+
+    def install(self):
+        if not self._installed:
+            self.clear()
+            FreeCAD.addDocumentObserver(self)
+            self._installed = True
+
+    def uninstall(self):
+        if self._installed:
+            FreeCAD.removeDocumentObserver(self)
+            self._installed = False
+            self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+            self._dirty.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "documents": len(self._indexes),
+                "objects": sum(len(index.boxes) for index in self._indexes.values()),
+                "builds": self.builds,
+                "updates": self.updates,
+            }
+
+    def reset_counters(self):
+        with self._lock:
+            self.builds = self.updates = 0
+
+    def index(self, doc):
+        """The up-to-date index of *doc*, building or refreshing it as needed."""
+        with self._lock:
+            index = self._indexes.get(doc.Name)
+            dirty = self._dirty.pop(doc.Name, ())
+        if index is None or not self._installed:
+            boxes = {}
+            for obj in doc.Objects:
+                box = bound_box(obj)
+                if box is not None:
+                    boxes[obj.Name] = box
+            index = _DocumentIndex(boxes)
+            self.builds += 1
+        elif dirty:
+            for name in dirty:
+                obj = doc.getObject(name)
+                index.update(name, bound_box(obj) if obj is not None else None)
+            self.updates += len(dirty)
+            if index.needs_rebuild():
+                index = _DocumentIndex(index.boxes)
+                self.builds += 1
+        if self._installed:
+            with self._lock:
+                self._indexes[doc.Name] = index
+        return index
+
+    def _mark(self, obj):
+        with self._lock:
+            doc_name = obj.Document.Name
+            if doc_name in self._indexes:
+                self._dirty.setdefault(doc_name, set()).add(obj.Name)
+
+    def _drop(self, doc):
+        with self._lock:
+            self._indexes.pop(doc.Name, None)
+            self._dirty.pop(doc.Name, None)
+
+    # --- FreeCAD observer slots (called on the thread making the change) ---
+
+    def slotCreatedObject(self, obj):
+        self._mark(obj)
+
+    def slotChangedObject(self, obj, prop):
+        if prop in _GEOMETRY_PROPERTIES:
+            self._mark(obj)
+
+    def slotDeletedObject(self, obj):
+        self._mark(obj)
+
+    def slotCreatedDocument(self, doc):
+        self._drop(doc)
+
+    def slotDeletedDocument(self, doc):
+        self._drop(doc)
+
+    def slotUndoDocument(self, doc):
+        self._drop(doc)
+
+    def slotRedoDocument(self, doc):
+        self._drop(doc)
+
+    def slotAbortTransaction(self, doc):
+        self._drop(doc)
+
+
+spatial_index = SpatialIndex()
@@ -0,0 +1,168 @@
+"""Addon side of the MCP server's tracing.
+
+Requests may carry a W3C ``traceparent`` (HTTP header on XML-RPC, request
+field on the framed transport). The addon continues that trace with a span
+per RPC and one per GUI task, and appends them as OTLP ``ResourceSpans``
+JSON lines to the file named by the ``trace_file`` setting, in the same
+shape as ``freecad_mcp.tracing`` on the MCP server side.
+
+The current span is thread-local; GUI tasks carry their submitter's span to
+the GUI thread explicitly.
+"""
+
+import contextlib
+import json
+import queue
+import random
+import re
+import threading
+import time
+
+SERVICE_NAME = "freecad-mcp-addon"
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_TRACEPARENT_RE = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+_context = threading.local()
+_exporter = None
+
+
+def _new_id(bits):
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "start_ns", "attributes")
+
+    def __init__(self, name, kind, parent, attributes, trace_id=None, span_id=None):
+        self.trace_id = trace_id or (parent.trace_id if parent else _new_id(128))
+        self.span_id = span_id or _new_id(64)
+        self.parent_id = parent.span_id if parent else ""
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.attributes = attributes
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+def parse_traceparent(value):
+    """Return the remote parent span described by *value*, or None."""
+    match = _TRACEPARENT_RE.match(value.strip().lower()) if value else None
+    if match is None:
+        return None
+    return Span("remote", SPAN_KIND_SERVER, None, {}, trace_id=match.group(1), span_id=match.group(2))
+
+
+def _attribute(key, value):
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+class _JsonLinesExporter:
+    """Appends finished spans to *path* from a background thread."""
+
+    def __init__(self, path):
+        # Opened here so a bad path fails configure() rather than the writer thread
+        self._file = open(path, "a", encoding="utf-8")
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="mcp-trace-writer", daemon=True)
+        self._thread.start()
+
+    def export(self, span, end_ns, error):
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "parentSpanId": span.parent_id,
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": [_attribute(k, v) for k, v in span.attributes.items()],
+            "status": {"code": _STATUS_ERROR, "message": error} if error else {"code": _STATUS_OK},
+        }
+        self._queue.put({
+            "resourceSpans": [{
+                "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": [otlp_span]}],
+            }]
+        })
+
+    def _run(self):
+        with self._file as f:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    return
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                if self._queue.empty():
+                    f.flush()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+
+def configure(path):
+    """Start writing spans to *path*; an empty path turns tracing off.
+
+    Raises OSError if *path* cannot be opened, leaving tracing off.
+    """
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+        _exporter = None
+    if path:
+        _exporter = _JsonLinesExporter(path)
+
+
+def enabled():
+    return _exporter is not None
+
+
+def current_span():
+    return getattr(_context, "span", None)
+
+
+@contextlib.contextmanager
+def activate(span):
+    """Make *span* (possibly a remote parent, or None) current on this thread."""
+    previous = getattr(_context, "span", None)
+    _context.span = span
+    try:
+        yield span
+    finally:
+        _context.span = previous
+
+
+@contextlib.contextmanager
+def span(name, kind=SPAN_KIND_INTERNAL, **attributes):
+    """Record a span around the block, as a child of the current span."""
+    if _exporter is None:
+        yield None
+        return
+    current = Span(name, kind, current_span(), attributes)
+    error = None
+    with activate(current):
+        try:
+            yield current
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            exporter = _exporter
+            if exporter is not None:
+                exporter.export(current, time.time_ns(), error)
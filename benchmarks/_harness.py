@@ -0,0 +1,76 @@
+"""Shared helpers for the benchmark scripts.
+
+Puts the pure-Python FreeCAD/Qt stand-ins in ``benchmarks/stubs`` and the
+addon on ``sys.path`` so ``rpc_server`` can be imported and driven without a
+FreeCAD install.
+"""
+
+import os
+import socket
+import sys
+import threading
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+STUBS_DIR = os.path.join(BENCH_DIR, "stubs")
+ADDON_DIR = os.path.join(REPO_ROOT, "addon", "FreeCADMCP")
+
+
+def load_rpc_server():
+    """Import the addon's ``rpc_server`` module against the stubs."""
+    for path in (ADDON_DIR, STUBS_DIR):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    from rpc_server import rpc_server
+
+    return rpc_server
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of *samples* (pct in 0..100)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return float("nan")
+    rank = max(0, min(len(ordered) - 1, round(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def format_latencies(label, samples):
+    ms = [s * 1000.0 for s in samples]
+    return (
+        f"{label:<28} n={len(ms):<5} p50={percentile(ms, 50):8.2f} ms  "
+        f"p99={percentile(ms, 99):8.2f} ms  max={max(ms):8.2f} ms"
+    )
+
+
+def run_with_gui_loop(driver):
+    """Run *driver* on a background thread while this thread runs the Qt loop.
+
+    The calling thread plays the part of FreeCAD's GUI thread. Returns the
+    driver's return value, re-raising anything it raised.
+    """
+    from PySide import QtCore
+
+    result = {}
+
+    def target():
+        try:
+            result["value"] = driver()
+        except BaseException as e:
+            result["error"] = e
+        finally:
+            QtCore.QCoreApplication.quit()
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    QtCore.QCoreApplication.exec()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
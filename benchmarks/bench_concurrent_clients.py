@@ -0,0 +1,90 @@
+"""Concurrent clients: single-threaded vs. threaded XML-RPC server.
+
+Two clients keep the GUI thread busy with slow ``execute_code`` calls while
+a third measures ``ping``/``list_documents`` latency and a fourth issues
+``get_objects`` reads. Run once per server mode against the stub FreeCAD.
+
+    python benchmarks/bench_concurrent_clients.py [--duration S] [--workers N]
+"""
+
+import argparse
+import threading
+import time
+import xmlrpc.client
+
+from _harness import format_latencies, free_port, load_rpc_server, run_with_gui_loop
+
+rpc = load_rpc_server()
+
+_SLOW_CODE = "import time\ntime.sleep(0.1)"
+
+
+def run_mode(workers, duration):
+    settings = rpc.load_settings()
+    settings["rpc_workers"] = workers
+    rpc.save_settings(settings)
+    port = free_port()
+    rpc.start_rpc_server(port=port)
+    url = f"http://localhost:{port}"
+
+    ping_latencies = []
+    read_latencies = []
+    slow_calls = []
+    stop = threading.Event()
+
+    def slow_client():
+        proxy = xmlrpc.client.ServerProxy(url, allow_none=True)
+        while not stop.is_set():
+            proxy.execute_code(_SLOW_CODE)
+            slow_calls.append(1)
+
+    def ping_client():
+        proxy = xmlrpc.client.ServerProxy(url, allow_none=True)
+        while not stop.is_set():
+            start = time.perf_counter()
+            proxy.ping()
+            proxy.list_documents()
+            ping_latencies.append(time.perf_counter() - start)
+            time.sleep(0.01)
+
+    def read_client():
+        proxy = xmlrpc.client.ServerProxy(url, allow_none=True)
+        while not stop.is_set():
+            start = time.perf_counter()
+            proxy.get_objects("Bench")
+            read_latencies.append(time.perf_counter() - start)
+
+    def driver():
+        proxy = xmlrpc.client.ServerProxy(url, allow_none=True)
+        if "Bench" not in proxy.list_documents():
+            proxy.create_document("Bench")
+            for i in range(50):
+                proxy.create_object("Bench", {"Name": f"Box{i}", "Type": "Part::Box"})
+        threads = [threading.Thread(target=fn) for fn in (slow_client, slow_client, ping_client, read_client)]
+        for t in threads:
+            t.start()
+        time.sleep(duration)
+        stop.set()
+        for t in threads:
+            t.join()
+
+    run_with_gui_loop(driver)
+    rpc.stop_rpc_server()
+
+    label = "single-threaded" if workers == 0 else f"threaded, {workers} workers"
+    print(f"--- {label}: {len(slow_calls)} slow execute_code calls in {duration:.0f} s")
+    print(format_latencies("  ping + list_documents", ping_latencies))
+    print(format_latencies("  get_objects (50 objs)", read_latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    run_mode(0, args.duration)
+    run_mode(args.workers, args.duration)
+
+
+if __name__ == "__main__":
+    main()
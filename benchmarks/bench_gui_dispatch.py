@@ -0,0 +1,68 @@
+"""GUI task dispatch latency: legacy 500 ms QTimer poll vs. queued signal.
+
+Measures the time from ``submit_gui_task`` on an RPC thread to the task
+starting on the GUI thread, which is pure idle latency added to every
+GUI-bound RPC.
+
+    python benchmarks/bench_gui_dispatch.py [--samples N]
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from _harness import format_latencies, load_rpc_server, run_with_gui_loop
+
+rpc = load_rpc_server()
+
+from PySide import QtCore  # noqa: E402  (stub, importable once the harness ran)
+
+
+def _legacy_poll():
+    """The pre-signal dispatcher: drain, then re-arm a 500 ms timer."""
+    rpc.process_gui_tasks()
+    QtCore.QTimer.singleShot(500, _legacy_poll)
+
+
+def measure(samples, think_ms):
+    latencies = []
+
+    def driver():
+        for _ in range(samples):
+            done = threading.Event()
+            start = time.perf_counter()
+
+            def task(start=start, done=done):
+                latencies.append(time.perf_counter() - start)
+                done.set()
+
+            rpc.submit_gui_task(task)
+            done.wait()
+            # Random client "think time" so submissions land at a random
+            # phase relative to any periodic timer
+            time.sleep(random.uniform(0.0, think_ms / 1000.0))
+
+    run_with_gui_loop(driver)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=40)
+    parser.add_argument("--think-ms", type=float, default=500.0)
+    args = parser.parse_args()
+
+    rpc._gui_dispatcher = None
+    QtCore.QTimer.singleShot(500, _legacy_poll)
+    before = measure(args.samples, args.think_ms)
+
+    rpc._gui_dispatcher = rpc.GuiTaskDispatcher()
+    after = measure(args.samples, args.think_ms)
+
+    print(format_latencies("before (500 ms poll)", before))
+    print(format_latencies("after (queued signal)", after))
+
+
+if __name__ == "__main__":
+    main()
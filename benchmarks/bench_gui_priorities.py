@@ -0,0 +1,84 @@
+"""GUI queue under a burst: FIFO full drain vs. time-sliced priority drain.
+
+A burst of slow "mutation" tasks is queued on the GUI thread while a reader
+keeps submitting cheap reads and a 10 ms heartbeat timer stands in for Qt
+repaints and input. The baseline mimics the old behaviour (reads queued as
+mutations, unlimited tick budget); the second run uses read priority and the
+configured per-tick budget.
+
+    python benchmarks/bench_gui_priorities.py [--burst N] [--task-ms MS] [--budget-ms MS]
+"""
+
+import argparse
+import threading
+import time
+
+from _harness import format_latencies, load_rpc_server, percentile, run_with_gui_loop
+
+rpc = load_rpc_server()
+
+from PySide import QtCore  # noqa: E402  (stubs are on sys.path after load_rpc_server)
+
+
+def run_mode(label, burst, task_s, budget_s, read_priority):
+    rpc._gui_tick_budget = budget_s
+    rpc.gui_queue_stats.reset()
+    if rpc._gui_dispatcher is None:
+        rpc._gui_dispatcher = rpc.GuiTaskDispatcher()
+
+    heartbeat_gaps = []
+    read_latencies = []
+    stop = threading.Event()
+    last_beat = [time.perf_counter()]
+
+    def heartbeat():
+        now = time.perf_counter()
+        heartbeat_gaps.append(now - last_beat[0])
+        last_beat[0] = now
+        if not stop.is_set():
+            QtCore.QTimer.singleShot(10, heartbeat)
+
+    def driver():
+        QtCore.QTimer.singleShot(0, heartbeat)
+        mutations = [
+            rpc.submit_gui_task(lambda: time.sleep(task_s), rpc.PRIORITY_MUTATION)
+            for _ in range(burst)
+        ]
+        while not all(f.done() for f in mutations):
+            start = time.perf_counter()
+            rpc.run_in_gui(lambda: None, priority=read_priority)
+            read_latencies.append(time.perf_counter() - start)
+            time.sleep(0.005)
+        stop.set()
+        time.sleep(0.05)
+
+    run_with_gui_loop(driver)
+    stats = rpc.gui_queue_stats.snapshot()
+
+    gaps_ms = [g * 1000.0 for g in heartbeat_gaps]
+    print(f"--- {label}")
+    print(format_latencies("  read round-trip", read_latencies))
+    print(
+        f"  {'UI heartbeat gap':<26} p50={percentile(gaps_ms, 50):8.2f} ms  "
+        f"p99={percentile(gaps_ms, 99):8.2f} ms  max={max(gaps_ms):8.2f} ms"
+    )
+    print(f"  queue: max_depth={stats['max_depth']} ticks={stats['ticks']} yields={stats['yields']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--burst", type=int, default=40, help="mutation tasks in the burst")
+    parser.add_argument("--task-ms", type=float, default=20.0, help="GUI time per mutation task")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="per-tick budget for the sliced run")
+    args = parser.parse_args()
+
+    task_s = args.task_ms / 1000.0
+    run_mode("FIFO, full drain (before)", args.burst, task_s, float("inf"), rpc.PRIORITY_MUTATION)
+    run_mode(
+        f"priorities, {args.budget_ms:.0f} ms tick budget (after)",
+        args.burst, task_s, args.budget_ms / 1000.0, rpc.PRIORITY_READ,
+    )
+
+
+if __name__ == "__main__":
+    main()
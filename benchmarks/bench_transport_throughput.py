@@ -0,0 +1,70 @@
+"""XML-RPC vs. framed binary transport throughput.
+
+Compares ``get_objects(detailed=True)`` on a synthetic document and raw
+screenshot transfer over both transports against the stub FreeCAD.
+
+    python benchmarks/bench_transport_throughput.py [--objects N] [--calls N]
+"""
+
+import argparse
+import base64
+import os
+import sys
+import time
+import xmlrpc.client
+
+from _harness import REPO_ROOT, free_port, load_rpc_server, run_with_gui_loop
+
+rpc = load_rpc_server()
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+from freecad_mcp.framed_client import FramedServerProxy  # noqa: E402
+
+
+def _timed(fn, calls):
+    start = time.perf_counter()
+    size = 0
+    for _ in range(calls):
+        size = fn()
+    elapsed = time.perf_counter() - start
+    return calls / elapsed, size * calls / elapsed / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument("--calls", type=int, default=30)
+    args = parser.parse_args()
+
+    port, framed_port = free_port(), free_port()
+    rpc.start_rpc_server(port=port, framed_port=framed_port)
+
+    def driver():
+        xml = xmlrpc.client.ServerProxy(f"http://localhost:{port}", allow_none=True)
+        framed = FramedServerProxy("localhost", framed_port)
+        xml.create_document("Bench")
+        ops = [{"Op": "create", "Name": f"Box{i}", "Type": "Part::Box"} for i in range(args.objects)]
+        xml.batch("Bench", ops)
+
+        rows = []
+        for label, proxy in (("xmlrpc", xml), ("framed", framed)):
+            rows.append((f"{label} get_objects detailed", *_timed(
+                lambda: len(repr(proxy.get_objects("Bench", False))), args.calls)))
+        for width, height in ((400, 300), (1600, 1200)):
+            rows.append((f"xmlrpc screenshot {width}x{height}", *_timed(
+                lambda: len(base64.b64decode(xml.get_active_screenshot("Isometric", width, height))),
+                args.calls)))
+            rows.append((f"framed screenshot {width}x{height}", *_timed(
+                lambda: len(framed.get_active_screenshot_bytes("Isometric", width, height)),
+                args.calls)))
+        framed.close()
+        return rows
+
+    rows = run_with_gui_loop(driver)
+    rpc.stop_rpc_server()
+    print(f"{args.objects} objects, {args.calls} calls per row")
+    for label, rate, mbps in rows:
+        print(f"{label:<34} {rate:8.1f} calls/s  {mbps:8.2f} MB/s payload")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+"""Pure-Python stand-in for the ``FreeCAD`` module (benchmarks only).
+
+Implements the subset of the App API the addon uses: documents, document
+objects with properties, Vector/Rotation/Placement, a trivial Shape and the
+console. Documents are plain in-memory containers; ``recompute`` only
+clears the objects' Touched state, so dispatch overhead can be measured
+without geometry kernels. Editing a dimension or the placement rebuilds the
+object's shape, as a recompute would. Observers registered with
+:func:`addDocumentObserver` get the App slots FreeCAD emits (object
+created, changed, deleted, recomputed; document created, deleted,
+recomputed; transaction aborted), on the thread making the change.
+:func:`synthesize_document` fills a document with thousands of objects for
+load tests.
+"""
+
+import itertools
+import math
+import random
+import tempfile
+
+GuiUp = True
+
+_user_dir = tempfile.mkdtemp(prefix="freecad_stub_")
+
+
+def getUserAppDataDir():
+    return _user_dir
+
+
+class _Console:
+    quiet = True
+
+    def _write(self, msg):
+        if not self.quiet:
+            print(msg, end="")
+
+    def PrintMessage(self, msg):
+        self._write(msg)
+
+    def PrintWarning(self, msg):
+        self._write(msg)
+
+    def PrintError(self, msg):
+        self._write(msg)
+
+    def PrintLog(self, msg):
+        self._write(msg)
+
+
+Console = _Console()
+
+_observers = []
+
+
+def addDocumentObserver(observer):
+    _observers.append(observer)
+
+
+def removeDocumentObserver(observer):
+    _observers.remove(observer)
+
+
+def _notify(slot, *args):
+    for observer in list(_observers):
+        handler = getattr(observer, slot, None)
+        if handler is not None:
+            handler(*args)
+
+
+class Vector:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __add__(self, other):
+        return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other):
+        return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __repr__(self):
+        return f"Vector ({self.x}, {self.y}, {self.z})"
+
+    @property
+    def Length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+
+class Rotation:
+    def __init__(self, axis=None, angle=0.0):
+        self.Axis = axis if axis is not None else Vector(0, 0, 1)
+        self.Angle = math.radians(angle)
+
+    def __repr__(self):
+        return f"Rotation (axis={self.Axis}, angle={self.Angle})"
+
+
+class Placement:
+    def __init__(self, base=None, rotation=None):
+        self.Base = base if base is not None else Vector()
+        self.Rotation = rotation if rotation is not None else Rotation()
+
+    def __repr__(self):
+        return f"Placement [Pos={self.Base}, Rot={self.Rotation}]"
+
+
+class BoundBox:
+    def __init__(self, xmin=0.0, ymin=0.0, zmin=0.0, xmax=0.0, ymax=0.0, zmax=0.0):
+        self.XMin, self.YMin, self.ZMin = xmin, ymin, zmin
+        self.XMax, self.YMax, self.ZMax = xmax, ymax, zmax
+
+    def isValid(self):
+        return self.XMax >= self.XMin and self.YMax >= self.YMin and self.ZMax >= self.ZMin
+
+    @property
+    def DiagonalLength(self):
+        return math.sqrt(
+            (self.XMax - self.XMin) ** 2 + (self.YMax - self.YMin) ** 2 + (self.ZMax - self.ZMin) ** 2
+        )
+
+
+class Shape:
+    """Box-like stand-in for ``Part.TopoShape``.
+
+    Like the real one, ``Vertexes``, ``Edges`` and ``Faces`` build a new list
+    of wrappers on every access, ``countElement`` only counts, and Volume and
+    Area are recomputed on every access.
+    """
+
+    _COUNTS = {"Vertex": 8, "Edge": 12, "Face": 6}
+    _hashes = itertools.count(1)
+
+    def __init__(self, length=10.0, width=10.0, height=10.0, base=None):
+        base = base if base is not None else Vector()
+        self._dims = (length, width, height)
+        self._hash = next(self._hashes)
+        self.BoundBox = BoundBox(
+            base.x, base.y, base.z, base.x + length, base.y + width, base.z + height
+        )
+
+    # Sample points per mass-property query; OCC integrates over every face,
+    # so Volume and Area cost far more than reading a count
+    _INTEGRATION_SAMPLES = 200
+
+    def _integrate(self, value):
+        return sum(value / self._INTEGRATION_SAMPLES for _ in range(self._INTEGRATION_SAMPLES))
+
+    @property
+    def Volume(self):
+        length, width, height = self._dims
+        return self._integrate(length * width * height)
+
+    @property
+    def Area(self):
+        length, width, height = self._dims
+        return self._integrate(2 * (length * width + width * height + length * height))
+
+    @property
+    def Vertexes(self):
+        return [object() for _ in range(self._COUNTS["Vertex"])]
+
+    @property
+    def Edges(self):
+        return [object() for _ in range(self._COUNTS["Edge"])]
+
+    @property
+    def Faces(self):
+        return [object() for _ in range(self._COUNTS["Face"])]
+
+    def countElement(self, kind):
+        return self._COUNTS[kind]
+
+    def hashCode(self):
+        return self._hash
+
+    def isSame(self, other):
+        return self._hash == getattr(other, "_hash", None)
+
+    def isNull(self):
+        return False
+
+    # Most grid segments per face edge tessellate produces
+    _MAX_SEGMENTS = 32
+
+    def tessellate(self, tolerance):
+        """Per-face grids, finer for smaller tolerances, as for curved faces in OCC.
+
+        Returns ``(points, facets)`` like ``TopoShape.tessellate``: a list of
+        Vectors and a list of index triples; faces do not share vertices.
+        """
+        length, width, height = self._dims
+        base = Vector(self.BoundBox.XMin, self.BoundBox.YMin, self.BoundBox.ZMin)
+        n = min(self._MAX_SEGMENTS, max(1, math.ceil(max(self._dims) / (tolerance * 20))))
+        points, facets = [], []
+        # (origin, u edge, v edge) of the six faces
+        faces = []
+        for origin in (Vector(), Vector(length, width, height)):
+            sign = 1 if origin.x == 0 else -1
+            faces += [
+                (origin, Vector(sign * length, 0, 0), Vector(0, sign * width, 0)),
+                (origin, Vector(0, sign * width, 0), Vector(0, 0, sign * height)),
+                (origin, Vector(0, 0, sign * height), Vector(sign * length, 0, 0)),
+            ]
+        for origin, u, v in faces:
+            start = len(points)
+            for i in range(n + 1):
+                for j in range(n + 1):
+                    points.append(Vector(
+                        base.x + origin.x + (u.x * i + v.x * j) / n,
+                        base.y + origin.y + (u.y * i + v.y * j) / n,
+                        base.z + origin.z + (u.z * i + v.z * j) / n,
+                    ))
+            for i in range(n):
+                for j in range(n):
+                    a = start + i * (n + 1) + j
+                    b = a + n + 1
+                    facets.append((a, b, a + 1))
+                    facets.append((a + 1, b, b + 1))
+        return points, facets
+
+
+class ViewObject:
+    def __init__(self):
+        self.Visibility = True
+        self.ShapeColor = (0.8, 0.8, 0.8, 0.0)
+        self.Transparency = 0
+
+
+# Default properties per TypeId for objects created through addObject
+_TYPE_PROPERTIES = {
+    "Part::Box": {"Length": 10.0, "Width": 10.0, "Height": 10.0},
+    "Part::Cylinder": {"Radius": 2.0, "Height": 10.0, "Angle": 360.0},
+    "Part::Sphere": {"Radius": 5.0},
+    "Part::Feature": {},
+    "Part::Cut": {"Base": None, "Tool": None, "Refine": False},
+    "Part::Fuse": {"Base": None, "Tool": None, "Refine": False},
+}
+
+# Attachment properties every Part:: object carries in FreeCAD
+_PART_PROPERTIES = {
+    "AttacherType": "Attacher::AttachEngine3D",
+    "AttachmentOffset": None,
+    "MapMode": "Deactivated",
+    "MapReversed": False,
+    "MapPathParameter": 0.0,
+    "Support": [],
+}
+
+# Setting any of these rebuilds Shape
+_GEOMETRY_PROPERTIES = frozenset({"Length", "Width", "Height", "Radius", "Placement"})
+
+
+class DocumentObject:
+    def __init__(self, doc, type_id, name):
+        self.Document = doc
+        self.TypeId = type_id
+        self.Name = name
+        self.Label = name
+        self.Placement = Placement()
+        self.ViewObject = ViewObject()
+        self.Label2 = ""
+        self.Visibility = True
+        self.State = []
+        if type_id.startswith("Part::"):
+            for prop, value in _PART_PROPERTIES.items():
+                setattr(self, prop, Placement() if prop == "AttachmentOffset" else value)
+        for prop, value in _TYPE_PROPERTIES.get(type_id, {}).items():
+            setattr(self, prop, value)
+        self._refresh_shape()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        attached = self.__dict__.get("_attached", False)
+        if attached and not name.startswith("_"):
+            if name != "State":
+                self.__dict__["State"] = ["Touched"]
+            _notify("slotChangedObject", self, name)
+        if name in _GEOMETRY_PROPERTIES and "Shape" in self.__dict__:
+            self._refresh_shape()
+            if attached:
+                _notify("slotChangedObject", self, "Shape")
+
+    @property
+    def PropertiesList(self):
+        return [
+            k for k in self.__dict__
+            if not k.startswith("_") and k not in ("Document", "TypeId", "Name", "ViewObject")
+        ]
+
+    @property
+    def OutList(self):
+        return [v for v in self.__dict__.values() if isinstance(v, DocumentObject)]
+
+    @property
+    def InList(self):
+        return [o for o in self.Document.Objects if self in o.OutList]
+
+    def _refresh_shape(self):
+        length = getattr(self, "Length", None) or 2 * getattr(self, "Radius", 5.0)
+        width = getattr(self, "Width", None) or length
+        height = getattr(self, "Height", None) or length
+        self.__dict__["Shape"] = Shape(float(length), float(width), float(height), self.Placement.Base)
+
+    def isDerivedFrom(self, type_id):
+        if type_id in (self.TypeId, "App::DocumentObject", "App::GeoFeature"):
+            return True
+        return type_id == "Part::Feature" and self.TypeId.startswith("Part::")
+
+    def touch(self):
+        # State is status flags, not a property: no change notification
+        self.__dict__["State"] = ["Touched"]
+
+    def isValid(self):
+        return True
+
+
+class Document:
+    def __init__(self, name):
+        self.Name = name
+        self.Label = name
+        self.FileName = ""
+        self._objects = {}
+        self.RecomputeCount = 0
+        # As for documents made in the GUI; FreeCADCmd leaves undo off
+        self.UndoMode = 1
+        self._transaction = None
+
+    @property
+    def Objects(self):
+        return list(self._objects.values())
+
+    def addObject(self, type_id, name="Object"):
+        unique = name
+        i = 1
+        while unique in self._objects:
+            unique = f"{name}{i:03d}"
+            i += 1
+        obj = DocumentObject(self, type_id, unique)
+        self._objects[unique] = obj
+        obj._attached = True
+        _notify("slotCreatedObject", obj)
+        return obj
+
+    def getObject(self, name):
+        return self._objects.get(name)
+
+    def removeObject(self, name):
+        if name not in self._objects:
+            raise ValueError(f"No object named '{name}'")
+        _notify("slotDeletedObject", self._objects[name])
+        self._objects.pop(name)._attached = False
+
+    def recompute(self):
+        self.RecomputeCount += 1
+        recomputed = [obj for obj in self._objects.values() if obj.State]
+        for obj in recomputed:
+            obj.__dict__["State"] = []
+            _notify("slotRecomputedObject", obj)
+        _notify("slotRecomputedDocument", self)
+        return len(recomputed)
+
+    def openTransaction(self, name=""):
+        # Like FreeCAD, transactions do nothing while undo is off
+        if self.UndoMode:
+            self._transaction = dict(self._objects)
+
+    def commitTransaction(self):
+        self._transaction = None
+
+    def abortTransaction(self):
+        if self._transaction is not None:
+            self._objects = self._transaction
+            for obj in self._objects.values():
+                obj.__dict__["_attached"] = True
+        self._transaction = None
+        _notify("slotAbortTransaction", self)
+
+
+_documents = {}
+ActiveDocument = None
+
+
+def synthesize_document(name, count, seed=0, boolean_every=10):
+    """Create document *name* with *count* primitives scattered in space.
+
+    Every *boolean_every*-th object is a ``Part::Cut`` of the two previous
+    primitives, so documents also carry a realistic dependency graph.
+    Deterministic for a given *seed*.
+    """
+    rng = random.Random(seed)
+    doc = newDocument(name)
+    primitives = []
+    for i in range(count):
+        if boolean_every and i % boolean_every == boolean_every - 1 and len(primitives) >= 2:
+            obj = doc.addObject("Part::Cut", f"Cut{i}")
+            obj.Base, obj.Tool = primitives[-2], primitives[-1]
+            continue
+        type_id = rng.choice(("Part::Box", "Part::Cylinder", "Part::Sphere"))
+        obj = doc.addObject(type_id, f"{type_id.split('::')[1]}{i}")
+        obj.Placement = Placement(
+            Vector(rng.uniform(-1000, 1000), rng.uniform(-1000, 1000), rng.uniform(-1000, 1000)),
+            Rotation(Vector(0, 0, 1), rng.uniform(0, 360)),
+        )
+        if type_id == "Part::Box":
+            obj.Length, obj.Width, obj.Height = (rng.uniform(1, 50) for _ in range(3))
+        else:
+            obj.Radius = rng.uniform(1, 25)
+        obj.Label = f"{obj.Name} ({i})"
+        primitives.append(obj)
+    doc.recompute()
+    return doc
+
+
+def newDocument(name="Unnamed"):
+    global ActiveDocument
+    doc = Document(name)
+    _documents[name] = doc
+    ActiveDocument = doc
+    _notify("slotCreatedDocument", doc)
+    return doc
+
+
+def getDocument(name):
+    try:
+        return _documents[name]
+    except KeyError:
+        raise NameError(f"Unknown document '{name}'")
+
+
+def listDocuments():
+    return dict(_documents)
+
+
+def closeDocument(name):
+    global ActiveDocument
+    doc = _documents.pop(name)
+    _notify("slotDeletedDocument", doc)
+    if ActiveDocument is doc:
+        ActiveDocument = next(iter(_documents.values()), None)
@@ -0,0 +1,94 @@
+"""Pure-Python stand-in for the ``FreeCADGui`` module (benchmarks only)."""
+
+import sys
+
+import FreeCAD
+
+_commands = {}
+
+
+def addCommand(name, command):
+    _commands[name] = command
+
+
+def updateGui():
+    pass
+
+
+def SendMsgToActiveView(msg):
+    pass
+
+
+class _MainWindow:
+    def findChildren(self, cls):
+        return []
+
+
+def getMainWindow():
+    return _MainWindow()
+
+
+class _Selection:
+    def clearSelection(self):
+        pass
+
+    def addSelection(self, obj):
+        pass
+
+
+Selection = _Selection()
+
+
+class _SceneGraph:
+    pass
+
+
+class _RenderManager:
+    def __init__(self):
+        self._root = _SceneGraph()
+
+    def getSceneGraph(self):
+        return self._root
+
+
+class _Viewer:
+    def __init__(self):
+        self._render_manager = _RenderManager()
+
+    def getSoRenderManager(self):
+        return self._render_manager
+
+
+class View3DInventor:
+    """Active 3D view; ``saveImage`` writes a placeholder image of the requested size."""
+
+    def __init__(self):
+        self._viewer = _Viewer()
+
+    def getViewer(self):
+        return self._viewer
+
+    def _set_view(self):
+        pass
+
+    viewIsometric = viewFront = viewTop = viewRight = viewBack = _set_view
+    viewLeft = viewBottom = viewDimetric = viewTrimetric = fitAll = _set_view
+
+    def saveImage(self, path, width, height, background="white"):
+        # The offscreen render and its copy into a QImage, as FreeCAD makes
+        bytes(bytes(width * height * 3))
+        # Roughly the size of a compressed webp of a simple CAD view
+        with open(path, "wb") as f:
+            f.write(b"RIFF" + bytes(max(64, width * height // 20)))
+
+
+class _GuiDocument:
+    def __init__(self):
+        self.ActiveView = View3DInventor()
+
+
+ActiveDocument = _GuiDocument()
+
+
+# Real FreeCAD exposes the GUI module as FreeCAD.Gui once the GUI is up
+FreeCAD.Gui = sys.modules[__name__]
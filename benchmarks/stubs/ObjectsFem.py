@@ -0,0 +1,13 @@
+"""Pure-Python stand-in for ``ObjectsFem`` (benchmarks only)."""
+
+
+def makeAnalysis(doc, name="Analysis"):
+    return doc.addObject("Fem::FemAnalysisPython", name)
+
+
+def makeMaterialSolid(doc, name="MaterialSolid"):
+    return doc.addObject("App::MaterialObjectPython", name)
+
+
+def makeMeshGmsh(doc, name="FEMMeshGmsh"):
+    return doc.addObject("Fem::FemMeshShapeNetgenObject", name)
@@ -0,0 +1,205 @@
+"""Pure-Python stand-in for ``PySide.QtCore`` used by the benchmarks.
+
+Only the pieces the addon touches are implemented: a main-thread event loop,
+``QTimer.singleShot``, ``QObject`` thread affinity and queued ``Signal``
+delivery. Semantics follow Qt closely enough that dispatch latency measured
+here reflects what the real event loop does.
+"""
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+
+
+class Qt:
+    AutoConnection = 0
+    DirectConnection = 1
+    QueuedConnection = 2
+
+
+class _EventLoop:
+    def __init__(self):
+        self._posted = queue.Queue()
+        self._timers = []
+        self._timer_lock = threading.Lock()
+        self._seq = itertools.count()
+        self._quit = False
+        self.thread = threading.current_thread()
+
+    def post(self, fn):
+        self._posted.put(fn)
+
+    def add_timer(self, msec, fn):
+        deadline = time.perf_counter() + msec / 1000.0
+        with self._timer_lock:
+            heapq.heappush(self._timers, (deadline, next(self._seq), fn))
+        # Wake the loop so it re-evaluates the nearest deadline
+        self._posted.put(None)
+
+    def _run_due_timers(self):
+        now = time.perf_counter()
+        due = []
+        with self._timer_lock:
+            while self._timers and self._timers[0][0] <= now:
+                due.append(heapq.heappop(self._timers)[2])
+        for fn in due:
+            fn()
+
+    def _next_timeout(self):
+        with self._timer_lock:
+            if not self._timers:
+                return None
+            return max(0.0, self._timers[0][0] - time.perf_counter())
+
+    def process_events(self):
+        self._run_due_timers()
+        while True:
+            try:
+                fn = self._posted.get_nowait()
+            except queue.Empty:
+                break
+            if fn is not None:
+                fn()
+        self._run_due_timers()
+
+    def exec(self):
+        self._quit = False
+        while not self._quit:
+            self._run_due_timers()
+            try:
+                fn = self._posted.get(timeout=self._next_timeout())
+            except queue.Empty:
+                continue
+            if fn is not None:
+                fn()
+        return 0
+
+    def quit(self):
+        def _stop():
+            self._quit = True
+
+        self.post(_stop)
+
+
+_loop = _EventLoop()
+
+
+class QCoreApplication:
+    _instance = None
+
+    def __init__(self, *args):
+        QCoreApplication._instance = self
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = QCoreApplication()
+        return cls._instance
+
+    @staticmethod
+    def exec():
+        return _loop.exec()
+
+    exec_ = exec
+
+    @staticmethod
+    def quit():
+        _loop.quit()
+
+    @staticmethod
+    def processEvents(*args):
+        _loop.process_events()
+
+
+class QThread:
+    @staticmethod
+    def currentThread():
+        return threading.current_thread()
+
+
+class QObject:
+    def __init__(self, parent=None):
+        self._thread = threading.current_thread()
+
+    def thread(self):
+        return self._thread
+
+    def deleteLater(self):
+        pass
+
+
+class _BoundSignal:
+    def __init__(self, owner):
+        self._owner = owner
+        self._slots = []
+
+    def connect(self, slot, type=Qt.AutoConnection):
+        self._slots.append((slot, type))
+
+    def disconnect(self, slot=None):
+        self._slots = [s for s in self._slots if slot is not None and s[0] != slot]
+
+    def emit(self, *args):
+        receiver_thread = getattr(self._owner, "_thread", _loop.thread)
+        for slot, conn_type in list(self._slots):
+            queued = conn_type == Qt.QueuedConnection or (
+                conn_type == Qt.AutoConnection
+                and threading.current_thread() is not receiver_thread
+            )
+            if queued:
+                _loop.post(lambda slot=slot: slot(*args))
+            else:
+                slot(*args)
+
+
+class Signal:
+    def __init__(self, *types, **kwargs):
+        self._attr = f"_signal_{id(self)}"
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        bound = instance.__dict__.get(self._attr)
+        if bound is None:
+            bound = instance.__dict__[self._attr] = _BoundSignal(instance)
+        return bound
+
+
+def Slot(*types, **kwargs):
+    def decorator(fn):
+        return fn
+
+    return decorator
+
+
+class QTimer(QObject):
+    @staticmethod
+    def singleShot(msec, fn):
+        _loop.add_timer(msec, fn)
+
+
+class QIODevice:
+    WriteOnly = 2
+
+
+class QByteArray(bytearray):
+    pass
+
+
+class QBuffer:
+    """Writes into a QByteArray, as ``QBuffer(QByteArray)`` does."""
+
+    def __init__(self, data=None):
+        self._data = QByteArray() if data is None else data
+
+    def open(self, mode):
+        return True
+
+    def write(self, chunk):
+        self._data.extend(chunk)
+        return len(chunk)
+
+    def data(self):
+        return self._data
@@ -0,0 +1,45 @@
+"""Pure-Python stand-in for ``PySide.QtGui`` (benchmarks only)."""
+
+_NAMED_COLORS = {"white": (255, 255, 255), "black": (0, 0, 0)}
+
+
+class QColor:
+    def __init__(self, name):
+        name = name.lower()
+        if name.startswith("#") and len(name) == 7:
+            rgb = tuple(int(name[i:i + 2], 16) for i in (1, 3, 5))
+        else:
+            rgb = _NAMED_COLORS.get(name)
+        self._rgb = rgb
+
+    def isValid(self):
+        return self._rgb is not None
+
+    def redF(self):
+        return self._rgb[0] / 255
+
+    def greenF(self):
+        return self._rgb[1] / 255
+
+    def blueF(self):
+        return self._rgb[2] / 255
+
+
+class QImage:
+    """Pixel rows of a given format; ``save`` writes a placeholder webp."""
+
+    Format_RGB888 = 13
+
+    def __init__(self, data, width, height, bytes_per_line, image_format):
+        self._data = data
+        self._width, self._height = width, height
+        self._bytes_per_line = bytes_per_line
+
+    def mirrored(self, horizontal=False, vertical=True):
+        # One copy of the pixels, as Qt makes; row order does not matter here
+        return QImage(bytes(self._data), self._width, self._height, self._bytes_per_line, 0)
+
+    def save(self, device, image_format, quality=-1):
+        # Same size as the stub view's saveImage output
+        device.write(b"RIFF" + bytes(max(64, self._width * self._height // 20)))
+        return True
@@ -0,0 +1,25 @@
+"""Pure-Python stand-in for ``PySide.QtWidgets`` (benchmarks only)."""
+
+
+class QAction:
+    def text(self):
+        return ""
+
+    def setChecked(self, checked):
+        pass
+
+
+class QLineEdit:
+    Normal = 0
+
+
+class QInputDialog:
+    @staticmethod
+    def getText(*args, **kwargs):
+        return "", False
+
+
+class QMessageBox:
+    @staticmethod
+    def warning(*args, **kwargs):
+        pass
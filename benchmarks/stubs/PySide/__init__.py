@@ -0,0 +1 @@
+"""Pure-Python stand-in for FreeCAD's ``PySide`` shim (benchmarks only)."""
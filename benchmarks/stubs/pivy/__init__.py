@@ -0,0 +1 @@
+"""Pure-Python stand-in for ``pivy`` (benchmarks only)."""
@@ -0,0 +1,38 @@
+"""Pure-Python stand-in for ``pivy.coin``: just the offscreen renderer.
+
+``render`` produces a blank RGB buffer of the viewport's size, so the
+memory traffic of a real render is there but not its drawing time.
+"""
+
+
+class SbColor:
+    def __init__(self, r, g, b):
+        self.rgb = (r, g, b)
+
+
+class SbViewportRegion:
+    def __init__(self, width, height):
+        self.size = (width, height)
+
+
+class SoOffscreenRenderer:
+    RGB = 3
+
+    def __init__(self, viewport):
+        self._viewport = viewport
+        self._components = self.RGB
+        self._buffer = None
+
+    def setComponents(self, components):
+        self._components = components
+
+    def setBackgroundColor(self, color):
+        self._background = color
+
+    def render(self, root):
+        width, height = self._viewport.size
+        self._buffer = bytes(width * height * self._components)
+        return True
+
+    def getBuffer(self):
+        return self._buffer
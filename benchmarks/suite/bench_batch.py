@@ -0,0 +1,69 @@
+"""Mutation throughput: one ``batch`` call vs. one RPC per object."""
+
+import itertools
+
+import FreeCAD
+import pytest
+
+from conftest import record_rate
+
+OPS_PER_ROUND = 100
+
+_doc_names = itertools.count()
+
+
+@pytest.fixture
+def empty_document(gui_loop):
+    name = f"Batch{next(_doc_names)}"
+    FreeCAD.newDocument(name)
+    yield name
+    FreeCAD.closeDocument(name)
+
+
+def _create_ops(prefix):
+    return [
+        {
+            "Op": "create",
+            "Name": f"{prefix}_{i}",
+            "Type": "Part::Box",
+            "Properties": {"Length": 5.0 + i, "Placement": {"Base": {"x": i, "y": 0, "z": 0}}},
+        }
+        for i in range(OPS_PER_ROUND)
+    ]
+
+
+def bench_batch_create(benchmark, freecad_rpc, empty_document):
+    """OPS_PER_ROUND creates in one GUI task, one transaction, one recompute."""
+    rounds = itertools.count()
+
+    def run():
+        res = freecad_rpc.batch(empty_document, _create_ops(f"B{next(rounds)}"))
+        assert res["success"]
+
+    benchmark(run)
+    record_rate(benchmark, "ops", OPS_PER_ROUND)
+
+
+def bench_individual_create(benchmark, freecad_rpc, empty_document):
+    """The same creates as separate create_object calls, one recompute each."""
+    rounds = itertools.count()
+
+    def run():
+        for op in _create_ops(f"I{next(rounds)}"):
+            res = freecad_rpc.create_object(empty_document, op)
+            assert res["success"]
+
+    benchmark(run)
+    record_rate(benchmark, "ops", OPS_PER_ROUND)
+
+
+def bench_batch_create_xmlrpc(benchmark, xmlrpc_proxy, empty_document):
+    """Batch over XML-RPC, including marshalling the op list."""
+    rounds = itertools.count()
+
+    def run():
+        res = xmlrpc_proxy.batch(empty_document, _create_ops(f"X{next(rounds)}"))
+        assert res["success"]
+
+    benchmark(run)
+    record_rate(benchmark, "ops", OPS_PER_ROUND)
@@ -0,0 +1,78 @@
+"""Columnar get_objects listings against one dict per object, on 10k objects.
+
+Each case records the payload it produces in ``extra_info``: ``json_bytes``
+(the encoded result) and ``xmlrpc_bytes`` (the marshalled response), plus
+``text_bytes`` for what the MCP tool hands the model (JSON objects, or the
+rendered table). The serialization cache is warm, as for a client polling
+a document.
+"""
+
+import json
+import xmlrpc.client
+
+import FreeCAD
+import pytest
+
+from rpc_server.serialize import serialization_cache
+from freecad_mcp.columns import render_table
+
+from conftest import installed, record_rate
+
+COLUMNAR_DOCUMENT = "Columnar"
+COLUMNAR_DOCUMENT_OBJECTS = 10000
+FORMATS = ["rows", "columns"]
+
+
+@pytest.fixture(scope="module")
+def columnar_document(gui_loop):
+    if COLUMNAR_DOCUMENT not in FreeCAD.listDocuments():
+        FreeCAD.synthesize_document(COLUMNAR_DOCUMENT, COLUMNAR_DOCUMENT_OBJECTS)
+    return FreeCAD.getDocument(COLUMNAR_DOCUMENT)
+
+
+@pytest.fixture
+def warm_cache(freecad_rpc, columnar_document):
+    with installed(serialization_cache):
+        freecad_rpc.get_objects(COLUMNAR_DOCUMENT)
+        yield
+
+
+def _record(benchmark, objects, columnar):
+    count = objects["count"] if columnar else len(objects)
+    record_rate(benchmark, "objects", count)
+    benchmark.extra_info["json_bytes"] = len(json.dumps(objects))
+    benchmark.extra_info["xmlrpc_bytes"] = len(xmlrpc.client.dumps(({"objects": objects},), allow_none=True))
+    benchmark.extra_info["text_bytes"] = len(render_table(objects) if columnar else json.dumps(objects))
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def bench_summary_listing(benchmark, freecad_rpc, warm_cache, fmt):
+    """The default summary of every object, in process."""
+    columnar = fmt == "columns"
+    res = benchmark(freecad_rpc.get_objects, COLUMNAR_DOCUMENT, True, None, None, None, 0, None, None, columnar)
+    assert res["success"]
+    _record(benchmark, res["objects"], columnar)
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def bench_fields_listing(benchmark, freecad_rpc, columnar_document, fmt):
+    """A projection of placement and type, no cache involved."""
+    columnar = fmt == "columns"
+    fields = ["TypeId", "Placement"]
+    res = benchmark(freecad_rpc.get_objects, COLUMNAR_DOCUMENT, True, None, fields, None, 0, None, None, columnar)
+    assert res["success"]
+    _record(benchmark, res["objects"], columnar)
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def bench_summary_over_wire(benchmark, framed_proxy, warm_cache, fmt):
+    """End to end over the framed transport: serialization, encoding and decoding."""
+    columnar = fmt == "columns"
+    res = benchmark.pedantic(
+        framed_proxy.get_objects,
+        args=(COLUMNAR_DOCUMENT, True, None, None, None, 0, None, None, columnar),
+        rounds=5,
+        iterations=1,
+    )
+    assert res["success"]
+    _record(benchmark, res["objects"], columnar)
@@ -0,0 +1,89 @@
+"""Body compression: bytes on the wire and CPU cost per codec and document size.
+
+``bench_compress_*`` and ``bench_decompress_*`` time the codec alone on
+the response body of ``get_objects(detailed)``, as XML-RPC and framed
+transports carry it; ``extra_info`` holds ``raw_bytes``, ``wire_bytes``
+and ``ratio``. ``bench_get_objects_framed_compressed`` runs the whole round
+trip over a real socket, including compression on the addon side. zstd
+cases are skipped unless ``zstandard`` (or Python 3.14) is available.
+"""
+
+import json
+import xmlrpc.client
+
+import FreeCAD
+import pytest
+
+from rpc_server import compression
+from rpc_server.framed_transport import _MAX_FRAME_BYTES
+
+from conftest import FramedServerProxy, record_rate
+
+SIZES = [100, 1000, 5000]
+CODECS = ["gzip", "zstd"]
+
+
+def _require(codec):
+    if codec != "identity" and codec not in compression.CODECS:
+        pytest.skip(f"{codec} is not available")
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"{n}obj")
+def sized_document(request, gui_loop):
+    name = f"Compress{request.param}"
+    if name not in FreeCAD.listDocuments():
+        FreeCAD.synthesize_document(name, request.param)
+    return name, request.param
+
+
+@pytest.fixture(scope="module")
+def response_bodies(rpc, sized_document):
+    """The detailed get_objects response, as each transport encodes it."""
+    res = rpc.FreeCADRPC().get_objects(sized_document[0], False)
+    assert res["success"]
+    return {
+        "xmlrpc": xmlrpc.client.dumps((res,), methodresponse=True, allow_none=True).encode("utf-8"),
+        "framed": json.dumps(res, separators=(",", ":")).encode("utf-8"),
+    }
+
+
+def _record_sizes(benchmark, raw, wire, count):
+    benchmark.extra_info["raw_bytes"] = len(raw)
+    benchmark.extra_info["wire_bytes"] = len(wire)
+    benchmark.extra_info["ratio"] = len(raw) / len(wire)
+    benchmark.extra_info["wire_bytes_per_object"] = len(wire) / count
+    record_rate(benchmark, "raw_bytes", len(raw))
+
+
+@pytest.mark.parametrize("transport", ["xmlrpc", "framed"])
+@pytest.mark.parametrize("codec", CODECS)
+def bench_compress_response(benchmark, response_bodies, sized_document, transport, codec):
+    _require(codec)
+    raw = response_bodies[transport]
+    wire = benchmark(compression.compress, codec, raw)
+    _record_sizes(benchmark, raw, wire, sized_document[1])
+
+
+@pytest.mark.parametrize("transport", ["xmlrpc", "framed"])
+@pytest.mark.parametrize("codec", CODECS)
+def bench_decompress_response(benchmark, response_bodies, sized_document, transport, codec):
+    _require(codec)
+    raw = response_bodies[transport]
+    wire = compression.compress(codec, raw)
+    assert benchmark(compression.decompress, codec, wire, _MAX_FRAME_BYTES) == raw
+    _record_sizes(benchmark, raw, wire, sized_document[1])
+
+
+@pytest.mark.parametrize("codec", ["identity", *CODECS])
+def bench_get_objects_framed_compressed(benchmark, servers, response_bodies, sized_document, codec):
+    """End to end over the framed transport with the addon's default threshold."""
+    _require(codec)
+    codecs = () if codec == "identity" else (codec,)
+    proxy = FramedServerProxy("localhost", servers[1], codecs=codecs, compression_threshold=1024)
+    try:
+        res = benchmark.pedantic(proxy.get_objects, args=(sized_document[0], False), rounds=5, iterations=1)
+    finally:
+        proxy.close()
+    assert len(res["objects"]) == sized_document[1]
+    raw = response_bodies["framed"]
+    _record_sizes(benchmark, raw, compression.compress(codec, raw) if codecs else raw, sized_document[1])
@@ -0,0 +1,70 @@
+"""Dependency graph: building it, exporting it and downstream-impact queries.
+
+``build`` reads every object's OutList, as a client reconstructing the graph
+object by object must; the other cases use the maintained graph. The chain
+document stacks ``CHAIN_LENGTH`` features on one base, the worst case for
+downstream impact.
+"""
+
+import FreeCAD
+import pytest
+
+from rpc_server.depgraph import dependency_graph
+
+from conftest import LARGE_DOCUMENT, installed, record_rate
+
+CHAIN_DOCUMENT = "Chain"
+CHAIN_LENGTH = 2000
+
+
+@pytest.fixture
+def installed_graph():
+    with installed(dependency_graph):
+        yield dependency_graph
+
+
+@pytest.fixture(scope="module")
+def chain_document(gui_loop):
+    if CHAIN_DOCUMENT not in FreeCAD.listDocuments():
+        doc = FreeCAD.newDocument(CHAIN_DOCUMENT)
+        previous = doc.addObject("Part::Box", "Base")
+        for i in range(CHAIN_LENGTH):
+            feature = doc.addObject("Part::Cut", f"Step{i}")
+            feature.Base, feature.Tool = previous, doc.addObject("Part::Cylinder", f"Tool{i}")
+            previous = feature
+    return FreeCAD.getDocument(CHAIN_DOCUMENT)
+
+
+def bench_graph_build(benchmark, large_document):
+    """Read the whole graph from the document (uninstalled, so every call rebuilds)."""
+    with installed(dependency_graph, active=False):
+        benchmark(dependency_graph.graph, large_document)
+    record_rate(benchmark, "objects", len(large_document.Objects))
+
+
+def bench_get_dependency_graph(benchmark, installed_graph, freecad_rpc, large_document):
+    """The full CSR export through the RPC method, graph already maintained."""
+    res = benchmark(freecad_rpc.get_dependency_graph, LARGE_DOCUMENT)
+    assert res["success"]
+    record_rate(benchmark, "objects", len(res["names"]))
+
+
+def bench_downstream_of_base(benchmark, installed_graph, freecad_rpc, chain_document):
+    """Everything depending on the base of a long feature chain, in recompute order."""
+    res = benchmark(freecad_rpc.get_downstream_impact, CHAIN_DOCUMENT, "Base")
+    assert res["names"][-1] == f"Step{CHAIN_LENGTH - 1}"
+    record_rate(benchmark, "objects", len(res["names"]))
+
+
+def bench_downstream_after_relink(benchmark, installed_graph, chain_document):
+    """Relink one feature, then query: only the changed object is re-read."""
+    installed_graph.graph(chain_document)
+    feature = chain_document.getObject(f"Step{CHAIN_LENGTH // 2}")
+    tools = [chain_document.getObject("Tool0"), chain_document.getObject("Tool1")]
+    flips = iter(range(10 ** 9))
+
+    def relink_and_query():
+        feature.Tool = tools[next(flips) % 2]
+        return installed_graph.graph(chain_document).downstream(["Tool0"], depth=1)
+
+    benchmark(relink_and_query)
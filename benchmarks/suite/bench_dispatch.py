@@ -0,0 +1,100 @@
+"""Value conversion and full-detail serialization against the isinstance chain.
+
+``plan`` cases run the current code: converters dispatched on the exact
+value type and a cached property plan per TypeId. ``chain`` cases run a
+copy of the code they replaced, kept here as the reference: an
+``isinstance`` chain per value and a property list filtered per object.
+The serialization cache is off, so every object is converted.
+"""
+
+import FreeCAD as App
+import pytest
+
+from rpc_server import serialize
+from rpc_server.serialize import serialization_cache, serialize_value
+
+from conftest import installed, record_rate
+
+IMPLEMENTATIONS = ["plan", "chain"]
+
+
+def _chain_serialize_value(value):
+    if isinstance(value, (int, float, str, bool)):
+        return value
+    elif isinstance(value, App.Vector):
+        return {"x": value.x, "y": value.y, "z": value.z}
+    elif isinstance(value, App.Rotation):
+        return {
+            "Axis": {"x": value.Axis.x, "y": value.Axis.y, "z": value.Axis.z},
+            "Angle": value.Angle,
+        }
+    elif isinstance(value, App.Placement):
+        return {
+            "Base": _chain_serialize_value(value.Base),
+            "Rotation": _chain_serialize_value(value.Rotation),
+        }
+    elif isinstance(value, (list, tuple)):
+        return [_chain_serialize_value(v) for v in value]
+    elif hasattr(App, "Color") and isinstance(value, App.Color):
+        return list(value)
+    elif hasattr(App, "DocumentObject") and isinstance(value, App.DocumentObject):
+        return {"Name": value.Name, "Label": value.Label}
+    else:
+        s = str(value)
+        return s[:serialize._MAX_STR_LEN] + "…" if len(s) > serialize._MAX_STR_LEN else s
+
+
+def _chain_serialize_object(obj):
+    result = {
+        "Name": obj.Name,
+        "Label": obj.Label,
+        "TypeId": obj.TypeId,
+        "Placement": _chain_serialize_value(getattr(obj, "Placement", None)),
+        "Shape": serialize.serialize_shape(getattr(obj, "Shape", None)),
+        "Properties": {},
+        "ViewObject": {},
+    }
+    for prop in obj.PropertiesList:
+        if prop in serialize._SKIP_PROPERTIES:
+            continue
+        try:
+            result["Properties"][prop] = _chain_serialize_value(getattr(obj, prop))
+        except Exception as e:
+            result["Properties"][prop] = f"<error: {str(e)}>"
+    return result
+
+
+@pytest.fixture
+def no_cache():
+    with installed(serialization_cache, active=False):
+        yield
+
+
+@pytest.mark.parametrize("impl", IMPLEMENTATIONS)
+def bench_serialize_values(benchmark, large_document, impl):
+    """Every property value of the document, converted one by one."""
+    values = [
+        getattr(obj, prop)
+        for obj in large_document.Objects
+        for prop in obj.PropertiesList
+        if prop not in serialize._SKIP_PROPERTIES
+    ]
+    convert = serialize_value if impl == "plan" else _chain_serialize_value
+    result = benchmark(lambda: [convert(v) for v in values])
+    assert result == [_chain_serialize_value(v) for v in values]
+    record_rate(benchmark, "values", len(values))
+
+
+@pytest.mark.parametrize("impl", IMPLEMENTATIONS)
+def bench_serialize_detailed(benchmark, monkeypatch, no_cache, large_document, impl):
+    """Full-detail serialization of every object, without the ViewObject."""
+    # Measure every metric; a scheduling hiccup must not turn into "omitted"
+    monkeypatch.setattr(serialize, "shape_time_budget", 0)
+    objects = large_document.Objects
+    if impl == "plan":
+        result = benchmark(lambda: [serialize._serialize_document_object(obj, False) for obj in objects])
+    else:
+        result = benchmark(lambda: [_chain_serialize_object(obj) for obj in objects])
+    assert result[:10] == [_chain_serialize_object(obj) for obj in objects[:10]]
+    record_rate(benchmark, "objects", len(objects))
+
@@ -0,0 +1,64 @@
+"""get_document_fingerprint: the "has anything changed?" check against a re-read.
+
+``seed`` is the first call on a document, which fingerprints every object
+not yet seen by the change tracker. After that the document fingerprint is
+kept up to date by each change and a call costs the same at any size;
+``relist`` is what a client pays to find out the same from a warm summary
+listing.
+"""
+
+import pytest
+
+from rpc_server.changes import changes
+
+from conftest import LARGE_DOCUMENT, installed, record_rate
+
+
+@pytest.fixture(autouse=True)
+def tracking():
+    """The change tracker must see edits, as it does once the servers are started."""
+    with installed(changes):
+        yield
+
+
+def bench_fingerprint_seed(benchmark, freecad_rpc, large_document):
+    """First fingerprint of a document: every object is hashed once."""
+    res = benchmark.pedantic(
+        freecad_rpc.get_document_fingerprint, args=(LARGE_DOCUMENT,),
+        setup=lambda: changes._reset(large_document), rounds=5,
+    )
+    assert res["success"]
+    record_rate(benchmark, "objects", len(large_document.Objects))
+
+
+@pytest.mark.parametrize("check", ["fingerprint", "relist"])
+def bench_unchanged_check(benchmark, freecad_rpc, large_document, check):
+    """Confirm nothing moved: one fingerprint call, or a warm summary listing."""
+    if check == "fingerprint":
+        freecad_rpc.get_document_fingerprint(LARGE_DOCUMENT)
+        res = benchmark(freecad_rpc.get_document_fingerprint, LARGE_DOCUMENT)
+    else:
+        freecad_rpc.get_objects(LARGE_DOCUMENT)
+        res = benchmark(freecad_rpc.get_objects, LARGE_DOCUMENT)
+    assert res["success"]
+
+
+def bench_fingerprint_after_edit(benchmark, freecad_rpc, large_document):
+    """Edit one object and recompute, then fingerprint; each event updates the hash in O(1)."""
+    obj = next(o for o in large_document.Objects if o.TypeId == "Part::Box")
+    before = freecad_rpc.get_document_fingerprint(LARGE_DOCUMENT)["fingerprint"]
+    lengths = iter(range(1, 10 ** 9))
+
+    def edit_and_check():
+        obj.Length = 1 + next(lengths) % 50
+        large_document.recompute()
+        return freecad_rpc.get_document_fingerprint(LARGE_DOCUMENT)
+
+    assert benchmark(edit_and_check)["fingerprint"] != before
+
+
+def bench_object_fingerprints(benchmark, freecad_rpc, large_document):
+    """Per-object fingerprints of the whole document, to find what changed."""
+    res = benchmark(freecad_rpc.get_document_fingerprint, LARGE_DOCUMENT, True)
+    assert len(res["objects"]) == len(large_document.Objects)
+    record_rate(benchmark, "objects", len(res["objects"]))
@@ -0,0 +1,56 @@
+"""Peak memory of large reads, measured with tracemalloc.
+
+Each benchmark times one call and records the peak bytes allocated during a
+separate traced call in ``extra_info``, normalized per object. The budgets
+are loose ceilings meant to catch order-of-magnitude regressions (an
+accidental copy of every object, a leaked cache), not small drifts.
+"""
+
+import tracemalloc
+import xmlrpc.client
+
+from conftest import LARGE_DOCUMENT
+
+# Peak bytes per object, about 5x what the current code needs
+_SUMMARY_BUDGET = 6 * 1024
+_FULL_BUDGET = 16 * 1024
+_MARSHAL_BUDGET = 80 * 1024
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _check(benchmark, fn, count, budget):
+    peak = _peak_bytes(fn)
+    benchmark.extra_info["peak_kib"] = peak / 1024
+    benchmark.extra_info["peak_bytes_per_object"] = peak / count
+    assert peak / count < budget, f"{peak / count:.0f} B/object exceeds the {budget} B budget"
+
+
+def bench_get_objects_summary_memory(benchmark, freecad_rpc, large_document):
+    call = lambda: freecad_rpc.get_objects(LARGE_DOCUMENT, True)  # noqa: E731
+    benchmark.pedantic(call, rounds=3, iterations=1)
+    _check(benchmark, call, len(large_document.Objects), _SUMMARY_BUDGET)
+
+
+def bench_get_objects_full_memory(benchmark, freecad_rpc, large_document):
+    call = lambda: freecad_rpc.get_objects(LARGE_DOCUMENT, False)  # noqa: E731
+    benchmark.pedantic(call, rounds=3, iterations=1)
+    _check(benchmark, call, len(large_document.Objects), _FULL_BUDGET)
+
+
+def bench_get_objects_xmlrpc_marshal_memory(benchmark, freecad_rpc, large_document):
+    """Serialization plus XML-RPC marshalling of the response, as the server does it."""
+
+    def call():
+        res = freecad_rpc.get_objects(LARGE_DOCUMENT, False)
+        return xmlrpc.client.dumps((res,), methodresponse=True, allow_none=True)
+
+    benchmark.pedantic(call, rounds=3, iterations=1)
+    _check(benchmark, call, len(large_document.Objects), _MARSHAL_BUDGET)
@@ -0,0 +1,57 @@
+"""get_mesh: tessellation, buffer packing and transfer per level of detail.
+
+``cold`` cases empty the tessellation cache before every round, ``warm``
+ones serve repeated reads of unchanged shapes from it. Over the wire,
+``extra_info["vertices_per_s"]`` compares the framed transport, which sends
+the buffers as raw blobs, with XML-RPC's base64.
+"""
+
+import FreeCAD
+import pytest
+
+from rpc_server.mesh import mesh_cache
+
+from conftest import record_rate
+
+MESH_DOCUMENT = "Mesh"
+MESH_DOCUMENT_OBJECTS = 50
+LODS = ["coarse", "medium", "fine"]
+
+
+@pytest.fixture(scope="module")
+def mesh_document(gui_loop):
+    if MESH_DOCUMENT not in FreeCAD.listDocuments():
+        FreeCAD.synthesize_document(MESH_DOCUMENT, MESH_DOCUMENT_OBJECTS)
+    return FreeCAD.getDocument(MESH_DOCUMENT)
+
+
+def _record(benchmark, res):
+    assert res["success"]
+    record_rate(benchmark, "objects", len(res["meshes"]))
+    record_rate(benchmark, "vertices", sum(m.get("vertex_count", 0) for m in res["meshes"]))
+    benchmark.extra_info["bytes"] = sum(len(m["vertices"]) + len(m["triangles"]) for m in res["meshes"])
+
+
+@pytest.mark.parametrize("cache", ["cold", "warm"])
+@pytest.mark.parametrize("lod", LODS)
+def bench_get_mesh_in_process(benchmark, freecad_rpc, mesh_document, lod, cache):
+    """Tessellate and pack every visible shape, no network."""
+    if cache == "cold":
+        res = benchmark.pedantic(
+            freecad_rpc.get_mesh, args=(MESH_DOCUMENT, None, lod), setup=mesh_cache.clear, rounds=5
+        )
+    else:
+        freecad_rpc.get_mesh(MESH_DOCUMENT, None, lod)
+        res = benchmark(freecad_rpc.get_mesh, MESH_DOCUMENT, None, lod)
+    _record(benchmark, res)
+
+
+@pytest.mark.parametrize("transport", ["xmlrpc", "framed"])
+def bench_get_mesh_over_wire(benchmark, request, mesh_document, transport):
+    """Warm-cache "medium" meshes of the whole document, end to end."""
+    proxy = request.getfixturevalue(f"{transport}_proxy")
+    res = benchmark.pedantic(proxy.get_mesh, args=(MESH_DOCUMENT, None, "medium"), rounds=5, iterations=1)
+    if transport == "xmlrpc":
+        for mesh in res["meshes"]:
+            mesh["vertices"], mesh["triangles"] = mesh["vertices"].data, mesh["triangles"].data
+    _record(benchmark, res)
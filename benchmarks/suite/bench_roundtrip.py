@@ -0,0 +1,41 @@
+"""Round-trip latency: GUI queue dispatch, XML-RPC and the framed transport."""
+
+import pytest
+
+
+def bench_gui_queue_dispatch(benchmark, rpc, gui_loop):
+    """Submit a no-op GUI task and wait for its future."""
+    benchmark(lambda: rpc.run_in_gui(lambda: None))
+
+
+def bench_ping_xmlrpc(benchmark, xmlrpc_proxy):
+    """Worker-safe call; never touches the GUI queue."""
+    benchmark(xmlrpc_proxy.ping)
+
+
+def bench_ping_framed(benchmark, framed_proxy):
+    benchmark(framed_proxy.ping)
+
+
+@pytest.fixture(scope="module")
+def small_document(servers, xmlrpc_proxy):
+    xmlrpc_proxy.create_document("RoundTrip")
+    xmlrpc_proxy.create_object("RoundTrip", {"Name": "Box", "Type": "Part::Box"})
+    return "RoundTrip"
+
+
+def bench_get_object_xmlrpc(benchmark, xmlrpc_proxy, small_document):
+    """GUI-bound read: dispatch, GUI queue hop, serialize and marshal."""
+    res = benchmark(xmlrpc_proxy.get_object, small_document, "Box")
+    assert res["success"]
+
+
+def bench_get_object_framed(benchmark, framed_proxy, small_document):
+    res = benchmark(framed_proxy.get_object, small_document, "Box")
+    assert res["success"]
+
+
+def bench_screenshot_bytes_framed(benchmark, framed_proxy, small_document):
+    """Two GUI hops plus a 400x300 placeholder image carried as raw bytes."""
+    image = benchmark(framed_proxy.get_active_screenshot_bytes)
+    assert image
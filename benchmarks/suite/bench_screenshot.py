@@ -0,0 +1,26 @@
+"""Screenshot capture per resolution: in-memory encoding against saveImage and a temp file.
+
+``memory`` renders offscreen and encodes through a QBuffer; ``tempfile``
+forces the saveImage fallback (mkstemp, write, read back, delete). The
+stubs render a blank buffer and write a placeholder webp of the same size
+either way, so the gap is the file round trip and the extra copies, not
+drawing or encoding time. ``extra_info["bytes"]`` is the image size.
+"""
+
+import pytest
+
+from conftest import record_rate
+
+RESOLUTIONS = [(400, 300), (800, 600), (1600, 1200)]
+
+
+@pytest.mark.parametrize("path", ["memory", "tempfile"])
+@pytest.mark.parametrize("size", RESOLUTIONS, ids=lambda size: f"{size[0]}x{size[1]}")
+def bench_capture_screenshot(benchmark, monkeypatch, rpc, freecad_rpc, size, path):
+    """``get_active_screenshot_bytes`` in process: support check, view setup and capture."""
+    if path == "tempfile":
+        monkeypatch.setattr(rpc, "_render_webp", lambda *args: None)
+    image = benchmark(freecad_rpc.get_active_screenshot_bytes, "Isometric", *size)
+    assert image
+    benchmark.extra_info["bytes"] = len(image)
+    record_rate(benchmark, "pixels", size[0] * size[1])
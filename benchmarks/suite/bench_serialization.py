@@ -0,0 +1,109 @@
+"""Serialization throughput on a large synthesized document.
+
+``extra_info["objects_per_s"]`` in the saved results is the number to
+watch: it is normalized by document size, so runs with a different
+``LARGE_DOCUMENT_OBJECTS`` stay comparable. ``uncached`` cases run with the
+serialization cache off; ``cached`` ones measure warm hits.
+"""
+
+import pytest
+
+from rpc_server import serialize
+from rpc_server.serialize import serialization_cache, serialize_object, serialize_shape
+
+from conftest import LARGE_DOCUMENT, installed, record_rate
+
+
+@pytest.fixture(params=["uncached", "cached"])
+def cache_mode(request):
+    """Run with the serialization cache off or on, restoring its state afterwards."""
+    with installed(serialization_cache, active=request.param == "cached"):
+        yield request.param
+
+
+@pytest.mark.parametrize("summary_only", [True, False], ids=["summary", "full"])
+def bench_serialize_objects(benchmark, large_document, summary_only, cache_mode):
+    """``serialize_object`` alone, no RPC."""
+    objects = large_document.Objects
+    benchmark(lambda: [serialize_object(obj, summary_only=summary_only) for obj in objects])
+    record_rate(benchmark, "objects", len(objects))
+
+
+@pytest.mark.parametrize("summary_only", [True, False], ids=["summary", "full"])
+def bench_get_objects_in_process(benchmark, freecad_rpc, large_document, summary_only, cache_mode):
+    """``FreeCADRPC.get_objects``: GUI queue hop plus serialization, no marshalling."""
+    res = benchmark(freecad_rpc.get_objects, LARGE_DOCUMENT, summary_only)
+    assert res["success"]
+    record_rate(benchmark, "objects", len(res["objects"]))
+
+
+@pytest.mark.parametrize("transport", ["xmlrpc", "framed"])
+def bench_get_objects_over_wire(benchmark, request, large_document, transport):
+    """End to end over a real socket, full detail."""
+    proxy = request.getfixturevalue(f"{transport}_proxy")
+    res = benchmark.pedantic(proxy.get_objects, args=(LARGE_DOCUMENT, False), rounds=5, iterations=1)
+    assert res["success"]
+    record_rate(benchmark, "objects", len(res["objects"]))
+
+
+def bench_set_object_property(benchmark, rpc, large_document):
+    """``set_object_property`` with a placement and scalar dimensions."""
+    obj = large_document.getObject("Box0") or next(
+        o for o in large_document.Objects if o.TypeId == "Part::Box"
+    )
+    properties = {
+        "Length": 12.5,
+        "Width": 7.0,
+        "Height": 3.0,
+        "Placement": {
+            "Base": {"x": 1.0, "y": 2.0, "z": 3.0},
+            "Rotation": {"Axis": {"x": 0, "y": 0, "z": 1}, "Angle": 45},
+        },
+    }
+    benchmark(rpc.set_object_property, large_document, obj, properties)
+
+
+def bench_get_objects_since_one_edit(benchmark, rpc, freecad_rpc, servers, large_document):
+    """Incremental poll (``since=token``) after one edit: a diff plus one object serialized."""
+    obj = large_document.Objects[0]
+    token = freecad_rpc.get_objects(LARGE_DOCUMENT, True)["token"]
+
+    def poll():
+        obj.Label = obj.Label  # one change notification
+        return freecad_rpc.get_objects(LARGE_DOCUMENT, True, token)
+
+    res = benchmark(poll)
+    assert [o["Name"] for o in res["changed"]] == [obj.Name]
+
+
+@pytest.mark.parametrize("fields", [["Placement", "Length"], ["Label"]], ids=["placement_length", "label"])
+def bench_get_objects_fields(benchmark, freecad_rpc, large_document, fields):
+    """Projection: only the named properties are evaluated, no cache involved."""
+    res = benchmark(freecad_rpc.get_objects, LARGE_DOCUMENT, True, None, fields)
+    assert res["success"]
+    record_rate(benchmark, "objects", len(res["objects"]))
+
+
+def bench_get_objects_page(benchmark, freecad_rpc, large_document):
+    """One sorted, filtered page of 50 boxes."""
+    res = benchmark(freecad_rpc.get_objects, LARGE_DOCUMENT, True, None, ["Length"], "Part::Box", 0, 50, "-Length")
+    assert len(res["objects"]) == 50
+
+
+@pytest.mark.parametrize("memo", ["cold", "warm"])
+def bench_serialize_shape(benchmark, monkeypatch, large_document, memo):
+    """``serialize_shape`` over every shape, with the metric memo emptied first or kept warm."""
+    # Measure every metric; a scheduling hiccup must not turn into "omitted"
+    monkeypatch.setattr(serialize, "shape_time_budget", 0)
+    objects = [obj for obj in large_document.Objects if getattr(obj, "Shape", None) is not None]
+
+    def run():
+        if memo == "cold":
+            serialize._clear_shape_memo()
+        return [serialize_shape(obj.Shape, obj) for obj in objects]
+
+    # The memo is kept up to date by the cache's observer
+    with installed(serialization_cache):
+        results = benchmark(run)
+    assert all("omitted" not in r for r in results)
+    record_rate(benchmark, "shapes", len(objects))
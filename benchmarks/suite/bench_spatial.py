@@ -0,0 +1,113 @@
+"""Spatial index: build time and region / nearest queries against a linear scan.
+
+Queries are drawn away from the origin, where the stub piles up its boolean
+results. ``scan`` cases answer the same region query by walking
+``doc.Objects``, as a client of ``get_objects`` or an ``execute_code`` loop
+would; the gap between them widens with document size. Every query's
+results are checked against the same scan.
+"""
+
+import heapq
+import random
+
+import FreeCAD
+import pytest
+
+from rpc_server.spatial import _intersects, bound_box, distance, make_box, spatial_index
+
+from conftest import installed, record_rate
+
+SIZES = [5000, 20000]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"{n}obj")
+def spatial_document(request, gui_loop):
+    name = f"Spatial{request.param}"
+    if name not in FreeCAD.listDocuments():
+        FreeCAD.synthesize_document(name, request.param)
+    return FreeCAD.getDocument(name)
+
+
+@pytest.fixture
+def installed_index():
+    with installed(spatial_index):
+        yield spatial_index
+
+
+def _queries(count=100, seed=0):
+    rng = random.Random(seed)
+    return [[rng.uniform(100, 900) for _ in range(3)] for _ in range(count)]
+
+
+def _boxes(doc):
+    return [(obj.Name, box) for obj in doc.Objects if (box := bound_box(obj)) is not None]
+
+
+def _scan_search(boxes, region):
+    return sorted(name for name, box in boxes if _intersects(region, box))
+
+
+def _assert_nearest(results, boxes, target, k):
+    """*results* are the k nearest by the scan; ties may come in any order."""
+    expected = heapq.nsmallest(k, (distance(target, box) for _, box in boxes))
+    by_name = dict(boxes)
+    assert [dist for dist, _ in results] == expected
+    assert all(distance(target, by_name[name]) == dist for dist, name in results)
+
+
+def bench_spatial_build(benchmark, spatial_document):
+    """Bulk-load the tree from every object's bounding box (uninstalled, so every call rebuilds)."""
+    with installed(spatial_index, active=False):
+        benchmark(spatial_index.index, spatial_document)
+    record_rate(benchmark, "objects", len(spatial_document.Objects))
+
+
+@pytest.mark.parametrize("method", ["index", "scan"])
+def bench_region_query(benchmark, installed_index, spatial_document, method):
+    """100 region queries of 100 mm cubes."""
+    regions = [make_box(p, [v + 100 for v in p]) for p in _queries()]
+    if method == "index":
+        index = installed_index.index(spatial_document)
+        found = benchmark(lambda: [index.search(region) for region in regions])
+        boxes = _boxes(spatial_document)
+        assert [sorted(names) for names in found] == [_scan_search(boxes, region) for region in regions]
+    else:
+        objects = spatial_document.Objects
+
+        def scan():
+            return [
+                [obj.Name for obj in objects if (box := bound_box(obj)) is not None and _intersects(region, box)]
+                for region in regions[:5]
+            ]
+
+        found = benchmark(scan)
+        boxes = _boxes(spatial_document)
+        assert [sorted(names) for names in found] == [_scan_search(boxes, region) for region in regions[:5]]
+    record_rate(benchmark, "queries", len(regions) if method == "index" else 5)
+
+
+@pytest.mark.parametrize("k", [1, 10, 100])
+def bench_nearest_query(benchmark, installed_index, spatial_document, k):
+    """100 k-nearest queries from random points."""
+    index = installed_index.index(spatial_document)
+    targets = [make_box(p, p) for p in _queries()]
+    found = benchmark(lambda: [index.nearest(target, k=k) for target in targets])
+    boxes = _boxes(spatial_document)
+    # Brute force is slow on the larger document; a sample covers the tree
+    for results, target in list(zip(found, targets))[:20]:
+        _assert_nearest(results, boxes, target, k)
+    record_rate(benchmark, "queries", len(targets))
+
+
+def bench_query_after_edit(benchmark, installed_index, spatial_document):
+    """Resize one object, then query: the index re-reads only that box."""
+    installed_index.index(spatial_document)
+    box = next(obj for obj in spatial_document.Objects if obj.TypeId == "Part::Box")
+    target = make_box([500, 500, 500], [500, 500, 500])
+    lengths = iter(range(1, 10 ** 9))
+
+    def edit_and_query():
+        box.Length = 1 + next(lengths) % 50
+        return installed_index.index(spatial_document).nearest(target, k=10)
+
+    _assert_nearest(benchmark(edit_and_query), _boxes(spatial_document), target, 10)
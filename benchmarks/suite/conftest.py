@@ -0,0 +1,106 @@
+"""Fixtures for the pytest-benchmark suite.
+
+The stub Qt event loop runs on a background thread standing in for
+FreeCAD's GUI thread, so ``FreeCADRPC`` methods go through the real GUI
+queue and dispatcher. Servers listen on free localhost ports.
+"""
+
+import contextlib
+import os
+import sys
+import threading
+import xmlrpc.client
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _harness import REPO_ROOT, free_port, load_rpc_server  # noqa: E402
+
+rpc_module = load_rpc_server()
+
+import FreeCAD  # noqa: E402  (the stub, importable once load_rpc_server ran)
+from PySide import QtCore  # noqa: E402
+
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+from freecad_mcp.framed_client import FramedServerProxy  # noqa: E402
+
+LARGE_DOCUMENT = "Large"
+LARGE_DOCUMENT_OBJECTS = 5000
+
+
+def record_rate(benchmark, unit, count):
+    """Store ``<unit>_per_s`` in the saved results (skipped with --benchmark-disable)."""
+    benchmark.extra_info[unit] = count
+    if benchmark.stats is not None:
+        benchmark.extra_info[f"{unit}_per_s"] = count / benchmark.stats.stats.mean
+
+
+@contextlib.contextmanager
+def installed(observer, active=True):
+    """Install *observer* (uninstall it if not *active*) for the block, then restore its state."""
+    was_installed = observer._installed
+    if active:
+        observer.install()
+    else:
+        observer.uninstall()
+    try:
+        yield observer
+    finally:
+        if was_installed:
+            observer.install()
+        else:
+            observer.uninstall()
+
+
+@pytest.fixture(scope="session")
+def rpc():
+    return rpc_module
+
+
+@pytest.fixture(scope="session")
+def gui_loop(rpc):
+    """Run the stub Qt event loop on its own thread for the whole session."""
+    thread = threading.Thread(target=QtCore.QCoreApplication.exec, name="stub-gui", daemon=True)
+    thread.start()
+    if rpc._gui_dispatcher is None:
+        rpc._gui_dispatcher = rpc.GuiTaskDispatcher()
+    yield
+    QtCore.QCoreApplication.quit()
+    thread.join(timeout=5)
+
+
+@pytest.fixture(scope="session")
+def large_document(gui_loop):
+    """A document with LARGE_DOCUMENT_OBJECTS objects, primitives and booleans."""
+    if LARGE_DOCUMENT not in FreeCAD.listDocuments():
+        FreeCAD.synthesize_document(LARGE_DOCUMENT, LARGE_DOCUMENT_OBJECTS)
+    return FreeCAD.getDocument(LARGE_DOCUMENT)
+
+
+@pytest.fixture(scope="session")
+def servers(rpc, gui_loop):
+    """Start the XML-RPC and framed servers; yields their ports."""
+    port, framed_port = free_port(), free_port()
+    rpc.start_rpc_server(port=port, framed_port=framed_port)
+    yield port, framed_port
+    rpc.stop_rpc_server()
+
+
+@pytest.fixture(scope="session")
+def xmlrpc_proxy(servers):
+    return xmlrpc.client.ServerProxy(f"http://localhost:{servers[0]}", allow_none=True)
+
+
+@pytest.fixture(scope="session")
+def framed_proxy(servers):
+    proxy = FramedServerProxy("localhost", servers[1])
+    yield proxy
+    proxy.close()
+
+
+@pytest.fixture
+def freecad_rpc(rpc, gui_loop):
+    """An in-process FreeCADRPC: dispatch and GUI queue, no network."""
+    return rpc.FreeCADRPC()
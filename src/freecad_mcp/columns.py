@@ -0,0 +1,55 @@
+"""Columnar ``get_objects`` results: decoding and dense text tables.
+
+The addon's ``serialize_columns`` sends ``{"count", "columns"}`` where each
+column is a list with one value per object, ``{"vec3": [...]}`` (flat x, y,
+z triples) or ``{"dictionary": [...], "indices": [...]}`` (repeated
+strings). A table renders as one tab-separated line per object under a
+header of column names, which costs far fewer tokens than a JSON object per
+row repeating every key.
+"""
+
+from typing import Any
+
+# Significant digits kept for floats in rendered tables
+TABLE_DIGITS = 6
+
+
+def decode_column(column: Any, count: int) -> list[Any]:
+    """One value per object; vectors come back as (x, y, z) tuples or None."""
+    if isinstance(column, list):
+        return column
+    if "vec3" in column:
+        flat = column["vec3"]
+        return [None if flat[i] is None else tuple(flat[i:i + 3]) for i in range(0, 3 * count, 3)]
+    if "dictionary" in column:
+        table = column["dictionary"]
+        return [None if i is None else table[i] for i in column["indices"]]
+    raise ValueError(f"Unknown column encoding: {sorted(column)}")
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, float):
+        return format(value, f".{TABLE_DIGITS}g")
+    if isinstance(value, tuple):
+        return ",".join(_cell(v) for v in value)
+    text = str(value)
+    # Keep one object per line and one cell per tab
+    return text.replace("\t", " ").replace("\n", " ")
+
+
+def render_table(table: dict[str, Any]) -> str:
+    """Tab-separated text: a header of column names, then one line per object.
+
+    Vectors are written as ``x,y,z``, floats to ``TABLE_DIGITS`` significant
+    digits, missing values as empty cells.
+    """
+    count = table["count"]
+    names = list(table["columns"])
+    columns = [decode_column(table["columns"][name], count) for name in names]
+    lines = ["\t".join(names)]
+    lines.extend("\t".join(_cell(column[i]) for column in columns) for i in range(count))
+    return "\n".join(lines)
@@ -0,0 +1,113 @@
+"""Negotiated compression of RPC bodies, client side.
+
+Mirrors the addon's ``rpc_server/compression.py``: gzip is always
+available, zstd when Python 3.14's ``compression.zstd`` or the
+``zstandard`` package can be imported. ``CODECS`` lists what this side can
+decode, best first. Requests are only compressed with a codec the addon
+listed in ``get_transport_info``; responses are compressed by the addon
+with a codec this side advertised.
+"""
+
+import zlib
+from collections.abc import Callable, Iterable
+from typing import Any
+
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+_zstd_compress: Callable[[bytes], bytes] | None = None
+_zstd_decompress: Callable[[bytes, int], bytes] | None = None
+
+try:
+    from compression import zstd as _zstd  # type: ignore[import-not-found]  # Python 3.14+
+
+    def _zstd_compress(data: bytes) -> bytes:
+        return bytes(_zstd.compress(data, ZSTD_LEVEL))
+
+    def _zstd_decompress(data: bytes, max_size: int) -> bytes:
+        return bytes(_zstd.ZstdDecompressor().decompress(data, max_length=max_size + 1))
+
+except ImportError:
+    try:
+        import zstandard as _zstandard  # type: ignore[import-not-found]
+
+        def _zstd_compress(data: bytes) -> bytes:
+            return bytes(_zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data))
+
+        def _zstd_decompress(data: bytes, max_size: int) -> bytes:
+            with _zstandard.ZstdDecompressor().stream_reader(data) as reader:
+                return bytes(reader.read(max_size + 1))
+
+    except ImportError:
+        pass
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_decompress(data: bytes, max_size: int) -> bytes:
+    return zlib.decompressobj(31).decompress(data, max_size + 1)
+
+
+_COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {"gzip": _gzip_compress}
+_DECOMPRESSORS: dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip_decompress}
+if _zstd_compress is not None and _zstd_decompress is not None:
+    _COMPRESSORS["zstd"] = _zstd_compress
+    _DECOMPRESSORS["zstd"] = _zstd_decompress
+
+CODECS: tuple[str, ...] = tuple(c for c in ("zstd", "gzip") if c in _COMPRESSORS)
+
+# Framed header flags, as in the addon's framed_transport.py
+FLAG_CODEC_MASK = 0x03
+_CODEC_IDS = {"gzip": 1, "zstd": 2}
+_CODEC_NAMES = {v: k for k, v in _CODEC_IDS.items()}
+_ACCEPT_SHIFT = 4
+
+
+def choose(accepted: Iterable[Any]) -> str | None:
+    """The best local codec among *accepted*, or None."""
+    accepted = set(accepted)
+    for codec in CODECS:
+        if codec in accepted:
+            return codec
+    return None
+
+
+def compress(codec: str, data: bytes) -> bytes:
+    return _COMPRESSORS[codec](data)
+
+
+def decompress(codec: str, data: bytes, max_size: int) -> bytes:
+    """Decompress *data*, refusing output larger than *max_size* bytes."""
+    decoder = _DECOMPRESSORS.get(codec)
+    if decoder is None:
+        raise ValueError(f"Unsupported content encoding: {codec}")
+    try:
+        out = decoder(data, max_size)
+    except Exception as e:
+        raise ValueError(f"Corrupt {codec} body: {e}") from e
+    if len(out) > max_size:
+        raise ValueError(f"Decompressed body exceeds {max_size} bytes")
+    return out
+
+
+def codec_flags(codec: str | None) -> int:
+    return _CODEC_IDS[codec] if codec else 0
+
+
+def accept_flags(codecs: Iterable[str]) -> int:
+    flags = 0
+    for codec in codecs:
+        flags |= _CODEC_IDS[codec]
+    return flags << _ACCEPT_SHIFT
+
+
+def codec_from_flags(flags: int) -> str | None:
+    codec_id = flags & FLAG_CODEC_MASK
+    if not codec_id:
+        return None
+    if codec_id not in _CODEC_NAMES:
+        raise ValueError(f"Unsupported frame codec: {codec_id}")
+    return _CODEC_NAMES[codec_id]
@@ -0,0 +1,185 @@
+"""Client for the FreeCAD addon's framed binary transport.
+
+Speaks the protocol defined in the addon's ``rpc_server/framed_transport.py``:
+one persistent TCP connection, each message framed as
+
+    flags: u8 | json_len: u32 | blob_len: u32 | json bytes | blob bytes
+
+with ``bytes`` values carried raw in the blob. The current trace context, if
+any, travels as the request's ``traceparent`` field. With *codecs* set,
+request JSON above *compression_threshold* bytes is compressed and the
+proxy advertises those codecs for responses. :class:`FramedServerProxy`
+mimics ``xmlrpc.client.ServerProxy`` so ``FreeCADConnection`` can use either.
+"""
+
+import itertools
+import json
+import select
+import socket
+import struct
+import threading
+from typing import Any
+
+from freecad_mcp import compression, tracing
+
+PROTOCOL_VERSION = 1
+
+_HEADER = struct.Struct("!BII")
+_BYTES_KEY = "__bytes__"
+_MAX_FRAME_BYTES = 512 * 1024 * 1024
+
+
+class FramedRPCError(Exception):
+    """Raised when the addon reports an error for a framed call."""
+
+
+def _extract_blobs(value: Any, blobs: list[bytes], offset: int) -> tuple[Any, int]:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        blobs.append(bytes(value))
+        return {_BYTES_KEY: [offset, len(value)]}, offset + len(value)
+    if isinstance(value, dict):
+        out = {}
+        for k, v in value.items():
+            out[k], offset = _extract_blobs(v, blobs, offset)
+        return out, offset
+    if isinstance(value, (list, tuple)):
+        items = []
+        for v in value:
+            item, offset = _extract_blobs(v, blobs, offset)
+            items.append(item)
+        return items, offset
+    return value, offset
+
+
+def _restore_blobs(value: Any, blob: bytes) -> Any:
+    if isinstance(value, dict):
+        ref = value.get(_BYTES_KEY)
+        if ref is not None and len(value) == 1:
+            start, length = ref
+            return blob[start : start + length]
+        return {k: _restore_blobs(v, blob) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_restore_blobs(v, blob) for v in value]
+    return value
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:], size - received)
+        if n == 0:
+            raise ConnectionError("FreeCAD closed the framed connection")
+        received += n
+    return bytes(buf)
+
+
+class FramedServerProxy:
+    """``ServerProxy`` look-alike over one persistent framed connection.
+
+    Calls are serialized on the connection; use one proxy per concurrent
+    caller. An idle connection the addon dropped is re-opened once per call,
+    but only while the request has not fully reached the addon: once it has,
+    a failure is raised rather than risking running the call twice.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        codecs: tuple[str, ...] = (),
+        compression_threshold: int = 0,
+    ):
+        self._address = (host, port)
+        self._timeout = timeout
+        # Codecs both sides support, best first
+        self._codecs = tuple(c for c in compression.CODECS if c in codecs)
+        self._compression_threshold = compression_threshold
+        self._sock: socket.socket | None = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def call(*params: Any) -> Any:
+            return self._call(name, params)
+
+        return call
+
+    def _connect(self) -> socket.socket:
+        sock = socket.create_connection(self._address, timeout=self._timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _encode(self, request: dict[str, Any]) -> bytes:
+        blobs: list[bytes] = []
+        payload, blob_len = _extract_blobs(request, blobs, 0)
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        flags = 0
+        if self._codecs and self._compression_threshold:
+            flags = compression.accept_flags(self._codecs)
+            if len(data) > self._compression_threshold:
+                data = compression.compress(self._codecs[0], data)
+                flags |= compression.codec_flags(self._codecs[0])
+        return b"".join([_HEADER.pack(flags, len(data), blob_len), data, *blobs])
+
+    def _send(self, frame: bytes) -> None:
+        # An idle connection has nothing to read; if it is readable the addon
+        # closed it (e.g. restarted), so start over before sending anything
+        if self._sock is not None and select.select([self._sock], [], [], 0)[0]:
+            self.close()
+        if self._sock is None:
+            self._sock = self._connect()
+            self._sock.sendall(frame)
+            return
+        try:
+            self._sock.sendall(frame)
+        except ConnectionError:
+            # The reused connection broke before the whole frame went out, so
+            # the addon never read the request: resend once on a fresh one
+            self.close()
+            self._sock = self._connect()
+            self._sock.sendall(frame)
+
+    def _receive(self) -> dict[str, Any]:
+        assert self._sock is not None
+        flags, json_len, blob_len = _HEADER.unpack(_recv_exact(self._sock, _HEADER.size))
+        if flags & ~compression.FLAG_CODEC_MASK:
+            raise FramedRPCError(f"Unsupported frame flags: {flags:#x}")
+        data = _recv_exact(self._sock, json_len)
+        codec = compression.codec_from_flags(flags)
+        if codec is not None:
+            data = compression.decompress(codec, data, _MAX_FRAME_BYTES)
+        response = json.loads(data)
+        if blob_len:
+            response = _restore_blobs(response, _recv_exact(self._sock, blob_len))
+        return response
+
+    def _call(self, method: str, params: tuple[Any, ...]) -> Any:
+        request = {"id": next(self._ids), "method": method, "params": list(params)}
+        traceparent = tracing.current_traceparent()
+        if traceparent is not None:
+            request["traceparent"] = traceparent
+        frame = self._encode(request)
+        with self._lock:
+            try:
+                self._send(frame)
+                # The addon may already have run the call: never resend past here
+                response = self._receive()
+            except Exception:
+                self.close()
+                raise
+        if "error" in response:
+            raise FramedRPCError(response["error"])
+        return response.get("result")
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
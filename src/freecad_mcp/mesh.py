@@ -0,0 +1,109 @@
+"""Binary glTF (.glb) files from ``get_mesh`` results.
+
+The addon's vertex and index buffers are already little-endian float32 and
+uint32, which is what glTF stores, so they are copied into the file as is:
+one glTF mesh and node per FreeCAD object. Coordinates stay in FreeCAD
+millimetres, Z up; a root node scales and rotates them into glTF's metres,
+Y up, so viewers show the model upright and at the right size.
+"""
+
+import json
+import struct
+import sys
+from array import array
+from typing import Any
+
+_GLB_MAGIC = 0x46546C67  # "glTF"
+_GLB_VERSION = 2
+_CHUNK_JSON = 0x4E4F534A
+_CHUNK_BIN = 0x004E4942
+
+_FLOAT = 5126
+_UNSIGNED_INT = 5125
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+
+# -90 degrees about X (Z up to Y up), millimetres to metres
+_ROOT_ROTATION = [-0.70710678, 0.0, 0.0, 0.70710678]
+_ROOT_SCALE = [0.001, 0.001, 0.001]
+
+
+def _pad(data: bytes, fill: bytes) -> bytes:
+    return data + fill * (-len(data) % 4)
+
+
+def _bounds(vertices: bytes) -> tuple[list[float], list[float]]:
+    """Per-axis minimum and maximum of packed float32 x, y, z vertices."""
+    coords = array("f")
+    coords.frombytes(vertices)
+    if sys.byteorder == "big":
+        coords.byteswap()
+    return (
+        [min(coords[axis::3]) for axis in range(3)],
+        [max(coords[axis::3]) for axis in range(3)],
+    )
+
+
+def to_glb(meshes: list[dict[str, Any]]) -> bytes:
+    """Encode the meshes of a ``get_mesh`` result; entries with "error" or no triangles are skipped."""
+    chunks: list[bytes] = []
+    views: list[dict[str, Any]] = []
+    accessors: list[dict[str, Any]] = []
+    gltf_meshes: list[dict[str, Any]] = []
+    nodes: list[dict[str, Any]] = [
+        {"name": "FreeCAD", "rotation": _ROOT_ROTATION, "scale": _ROOT_SCALE, "children": []}
+    ]
+    offset = 0
+
+    def add_view(data: bytes, target: int) -> int:
+        nonlocal offset
+        views.append({"buffer": 0, "byteOffset": offset, "byteLength": len(data), "target": target})
+        data = _pad(data, b"\0")
+        chunks.append(data)
+        offset += len(data)
+        return len(views) - 1
+
+    for mesh in meshes:
+        if "error" in mesh or not mesh.get("triangle_count"):
+            continue
+        low, high = _bounds(mesh["vertices"])
+        accessors.append({
+            "bufferView": add_view(mesh["vertices"], _ARRAY_BUFFER),
+            "componentType": _FLOAT,
+            "count": mesh["vertex_count"],
+            "type": "VEC3",
+            "min": low,
+            "max": high,
+        })
+        accessors.append({
+            "bufferView": add_view(mesh["triangles"], _ELEMENT_ARRAY_BUFFER),
+            "componentType": _UNSIGNED_INT,
+            "count": 3 * mesh["triangle_count"],
+            "type": "SCALAR",
+        })
+        gltf_meshes.append({
+            "name": mesh["name"],
+            "primitives": [{"attributes": {"POSITION": len(accessors) - 2}, "indices": len(accessors) - 1}],
+        })
+        nodes[0]["children"].append(len(nodes))
+        nodes.append({"name": mesh["name"], "mesh": len(gltf_meshes) - 1})
+
+    binary = b"".join(chunks)
+    document: dict[str, Any] = {
+        "asset": {"version": "2.0", "generator": "freecad-mcp"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": nodes,
+    }
+    if not nodes[0]["children"]:
+        del nodes[0]["children"]
+    if binary:
+        # glTF forbids empty arrays, so these are only present with geometry
+        document.update(
+            meshes=gltf_meshes, accessors=accessors, bufferViews=views, buffers=[{"byteLength": len(binary)}]
+        )
+    json_chunk = _pad(json.dumps(document, separators=(",", ":")).encode("utf-8"), b" ")
+    body = struct.pack("<II", len(json_chunk), _CHUNK_JSON) + json_chunk
+    if binary:
+        body += struct.pack("<II", len(binary), _CHUNK_BIN) + binary
+    return struct.pack("<III", _GLB_MAGIC, _GLB_VERSION, 12 + len(body)) + body
@@ -1,18 +1,34 @@
+import asyncio
 import base64
 import json
 import logging
 import os
+import shlex
 import shutil
 import subprocess
 import tempfile
+import time
 import uuid
 import xmlrpc.client
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Literal, cast
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Dict, Any, Literal, TypeVar, cast
 
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.types import TextContent, ImageContent
 
+from freecad_mcp import compression, tracing
+from freecad_mcp.columns import render_table
+from freecad_mcp.mesh import to_glb
+from freecad_mcp.framed_client import (
+    PROTOCOL_VERSION as FRAMED_PROTOCOL_VERSION,
+    FramedRPCError,
+    FramedServerProxy,
+)
+
+if TYPE_CHECKING:
+    from _typeshed import SizedBuffer
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -20,22 +36,156 @@ logging.basicConfig(
 logger = logging.getLogger("FreeCADMCPserver")
 
 
+T = TypeVar("T")
+
+# Largest response body accepted after decompression
+_MAX_RESPONSE_BYTES = 512 * 1024 * 1024
+
 _only_text_feedback = False
 _rpc_host = "localhost"
-
-# Snapshots for before/after: {view_name: (screenshot_b64, gemini_analysis_text)}
-_snapshots: dict[str, tuple[str, str]] = {}
+_rpc_transport: Literal["auto", "xmlrpc", "framed"] = "auto"
+_rpc_pool_size = 4
+_rpc_timeout = 60.0
+# Compress RPC bodies above this many bytes when the addon supports it; 0 disables
+_rpc_compression_threshold = 1024
+# Headless FreeCAD worker processes; 0 connects to a single FreeCAD at _rpc_host
+_worker_count = 0
+_worker_cmd = os.environ.get("FREECAD_CMD", "FreeCADCmd")
+_worker_base_port = 9900
+
+# Snapshots for before/after: {view_name: (screenshot webp bytes, gemini_analysis_text)}
+_snapshots: dict[str, tuple[bytes, str]] = {}
 
 _session_dir: str | None = None
 _screenshot_count: int = 0
+_mesh_count: int = 0
 _detected_client_name: str | None = None
 
+# Tool responses reused while their document's fingerprint is unchanged:
+# {(tool, arguments...): (fingerprint, response texts)}
+_RESPONSE_CACHE_SIZE = 32
+_response_cache: OrderedDict[tuple[Any, ...], tuple[str, list[str]]] = OrderedDict()
+
+
+class _TimeoutTransport(xmlrpc.client.Transport):
+    """XML-RPC transport with a socket timeout (``None`` blocks forever).
+
+    Advertises every local codec in ``Accept-Encoding`` and compresses
+    request bodies above *compression_threshold* bytes (0 disables both).
+    Requests use gzip, which every addon decodes, until :meth:`set_codecs`
+    passes the codecs the addon listed in ``get_transport_info``.
+    """
+
+    # Accept-Encoding is sent by send_headers, with zstd when available
+    accept_gzip_encoding = False
+
+    def __init__(self, timeout: float | None = None, compression_threshold: int = 0):
+        super().__init__()
+        self._timeout = timeout
+        self._compression_threshold = compression_threshold
+        self._request_codec: str | None = "gzip"
+
+    def set_codecs(self, codecs: list[str]) -> None:
+        self._request_codec = compression.choose(codecs)
+
+    def make_connection(self, host: Any) -> Any:
+        conn = super().make_connection(host)
+        conn.timeout = self._timeout
+        return conn
+
+    def send_headers(self, connection: Any, headers: Any) -> None:
+        traceparent = tracing.current_traceparent()
+        if traceparent is not None:
+            headers = [*headers, ("traceparent", traceparent)]
+        if self._compression_threshold:
+            headers = [*headers, ("Accept-Encoding", ", ".join(compression.CODECS))]
+        super().send_headers(connection, headers)
+
+    def send_content(self, connection: Any, request_body: "SizedBuffer") -> None:
+        body = bytes(request_body)
+        codec = self._request_codec
+        if codec and self._compression_threshold and len(body) > self._compression_threshold:
+            connection.putheader("Content-Encoding", codec)
+            body = compression.compress(codec, body)
+        connection.putheader("Content-Length", str(len(body)))
+        connection.endheaders(body)
+
+    def parse_response(self, response: Any) -> Any:
+        encoding = response.getheader("Content-Encoding", "")
+        if encoding not in ("", "identity", "gzip"):
+            # xmlrpc.client only decodes gzip itself
+            body = compression.decompress(encoding, response.read(), _MAX_RESPONSE_BYTES)
+            parser, unmarshaller = self.getparser()
+            parser.feed(body)
+            parser.close()
+            return unmarshaller.close()
+        return super().parse_response(response)
+
 
 class FreeCADConnection:
-    def __init__(self, host: str = "localhost", port: int = 9875):
-        self.server = xmlrpc.client.ServerProxy(
-            f"http://{host}:{port}", allow_none=True
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 9875,
+        transport: Literal["auto", "xmlrpc", "framed"] = "auto",
+        timeout: float | None = None,
+        compression_threshold: int = 0,
+    ):
+        self._xmlrpc_transport = _TimeoutTransport(timeout, compression_threshold)
+        self.server: Any = xmlrpc.client.ServerProxy(
+            f"http://{host}:{port}",
+            transport=self._xmlrpc_transport,
+            allow_none=True,
         )
+        self.transport = "xmlrpc"
+        self._timeout = timeout
+        self._compression_threshold = compression_threshold
+        if transport != "xmlrpc" or compression_threshold:
+            self._negotiate(host, transport)
+
+    def _negotiate(self, host: str, transport: str) -> None:
+        """Pick up the addon's codecs and, unless XML-RPC is forced, its framed transport.
+
+        Falls back to XML-RPC (older addon, transport disabled, port blocked)
+        unless *transport* is ``"framed"``.
+        """
+        try:
+            info = self.server.get_transport_info()
+        except Exception as e:
+            if transport == "framed":
+                raise
+            logger.info(f"Using XML-RPC transport ({e})")
+            return
+        codecs = [c for c in info.get("compression", ()) if c in compression.CODECS]
+        # Every XML-RPC server in the standard library decodes gzip requests
+        self._xmlrpc_transport.set_codecs(codecs or ["gzip"])
+        if transport != "xmlrpc":
+            self._negotiate_framed(host, info, codecs, required=transport == "framed")
+
+    def _negotiate_framed(
+        self, host: str, info: dict[str, Any], codecs: list[str], required: bool
+    ) -> None:
+        """Switch to the addon's framed transport if it offers one."""
+        try:
+            framed_port = info.get("framed_port")
+            if not framed_port or info.get("framed_version") != FRAMED_PROTOCOL_VERSION:
+                raise RuntimeError("addon does not offer a compatible framed transport")
+            proxy = FramedServerProxy(
+                host,
+                framed_port,
+                timeout=self._timeout,
+                codecs=tuple(codecs),
+                compression_threshold=self._compression_threshold,
+            )
+            proxy.ping()
+        except Exception as e:
+            if required:
+                raise
+            logger.info(f"Using XML-RPC transport ({e})")
+            return
+        self.server = proxy
+        self.transport = "framed"
+        logger.info(f"Using framed transport on port {framed_port}")
 
     def ping(self) -> bool:
         return cast(bool, self.server.ping())
@@ -56,12 +206,29 @@ class FreeCADConnection:
     def delete_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
         return cast(dict[str, Any], self.server.delete_object(doc_name, obj_name))
 
+    def batch(
+        self, doc_name: str, ops: list[dict[str, Any]], on_error: str = "rollback"
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.batch(doc_name, ops, on_error))
+
     def insert_part_from_library(self, relative_path: str) -> dict[str, Any]:
         return cast(dict[str, Any], self.server.insert_part_from_library(relative_path))
 
     def execute_code(self, code: str) -> dict[str, Any]:
         return cast(dict[str, Any], self.server.execute_code(code))
 
+    def submit_job(self, kind: str, params: dict[str, Any]) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.submit_job(kind, params))
+
+    def job_status(self, job_id: str) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.job_status(job_id))
+
+    def job_result(self, job_id: str) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.job_result(job_id))
+
+    def cancel_job(self, job_id: str) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.cancel_job(job_id))
+
     def get_active_screenshot(
         self,
         view_name: str = "Isometric",
@@ -69,7 +236,15 @@ class FreeCADConnection:
         height: int | None = None,
         focus_object: str | None = None,
         background_color: str = "white",
-    ) -> str | None:
+    ) -> bytes | None:
+        if not self.supports_screenshots():
+            return None
+        return self.capture_screenshot(
+            view_name, width, height, focus_object, background_color
+        )
+
+    def supports_screenshots(self) -> bool:
+        """Return True if the active view can produce a screenshot."""
         try:
             # Check if we're in a view that supports screenshots
             result = cast(
@@ -103,39 +278,656 @@ else:
                 logger.info(
                     "Screenshot unavailable in current view (likely Spreadsheet or TechDraw view)"
                 )
-                return None
+                return False
+            return True
+        except Exception as e:
+            logger.error(f"Error checking screenshot support: {e}")
+            return False
 
-            # Otherwise, try to get the screenshot
-            return cast(
-                str | None,
-                self.server.get_active_screenshot(
-                    view_name, width, height, focus_object, background_color
-                ),
+    def capture_screenshot(
+        self,
+        view_name: str = "Isometric",
+        width: int | None = None,
+        height: int | None = None,
+        focus_object: str | None = None,
+        background_color: str = "white",
+    ) -> bytes | None:
+        """Capture the active view without re-checking support. Returns webp bytes."""
+        try:
+            if self.transport == "framed":
+                # Raw bytes on the wire, no base64 on either side
+                return cast(
+                    bytes | None,
+                    self.server.get_active_screenshot_bytes(
+                        view_name, width, height, focus_object, background_color
+                    ),
+                )
+            image = self.server.get_active_screenshot(
+                view_name, width, height, focus_object, background_color
             )
+            return base64.b64decode(image) if image else None
         except Exception as e:
             # Log the error but return None instead of raising an exception
             logger.error(f"Error getting screenshot: {e}")
             return None
 
-    def get_objects(self, doc_name: str, summary_only: bool = True) -> dict[str, Any]:
-        return cast(dict[str, Any], self.server.get_objects(doc_name, summary_only))
-
-    def get_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
+    def get_objects(
+        self,
+        doc_name: str,
+        summary_only: bool = True,
+        since: str | None = None,
+        fields: list[str] | None = None,
+        type_filter: str | list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        order_by: str | None = None,
+        columnar: bool = False,
+    ) -> dict[str, Any]:
+        args: list[Any] = [
+            doc_name, summary_only, since, fields, type_filter, offset or None, limit, order_by,
+            columnar or None,
+        ]
+        # Send only the parameters in use, so older addons keep working
+        while len(args) > 2 and args[-1] is None:
+            args.pop()
+        result = self.server.get_objects(*args)
+        if isinstance(result, list):
+            # Older addons return the bare list of objects
+            return {"success": True, "objects": result, "total": len(result)}
+        return cast(dict[str, Any], result)
+
+    def get_object(
+        self, doc_name: str, obj_name: str, fields: list[str] | None = None
+    ) -> dict[str, Any]:
+        if fields:
+            return cast(dict[str, Any], self.server.get_object(doc_name, obj_name, fields))
         return cast(dict[str, Any], self.server.get_object(doc_name, obj_name))
 
+    def get_mesh(
+        self, doc_name: str, objects: list[str] | None = None, tolerance: float | str = "medium"
+    ) -> dict[str, Any]:
+        result = cast(dict[str, Any], self.server.get_mesh(doc_name, objects, tolerance))
+        # XML-RPC wraps the buffers in Binary; the framed transport returns bytes
+        for mesh in result.get("meshes", ()):
+            for key in ("vertices", "triangles"):
+                if isinstance(mesh.get(key), xmlrpc.client.Binary):
+                    mesh[key] = mesh[key].data
+        return result
+
+    def query_region(
+        self,
+        doc_name: str,
+        low: list[float | None],
+        high: list[float | None],
+        contained: bool = False,
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.query_region(doc_name, low, high, contained))
+
+    def query_nearby(
+        self,
+        doc_name: str,
+        target: str | list[float],
+        radius: float | None = None,
+        k: int | None = None,
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.query_nearby(doc_name, target, radius, k))
+
+    def get_dependency_graph(
+        self, doc_name: str, root: str | None = None, depth: int | None = None
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.get_dependency_graph(doc_name, root, depth))
+
+    def get_downstream_impact(
+        self, doc_name: str, names: str | list[str], depth: int | None = None
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.get_downstream_impact(doc_name, names, depth))
+
+    def get_document_fingerprint(
+        self, doc_name: str, objects: bool | list[str] | None = None
+    ) -> dict[str, Any]:
+        if objects:
+            return cast(dict[str, Any], self.server.get_document_fingerprint(doc_name, objects))
+        return cast(dict[str, Any], self.server.get_document_fingerprint(doc_name))
+
     def get_parts_list(self) -> list[str]:
         return cast(list[str], self.server.get_parts_list())
 
     def list_documents(self) -> list[str]:
         return cast(list[str], self.server.list_documents())
 
+    def get_metrics(self, reset: bool = False) -> dict[str, Any]:
+        return cast(dict[str, Any], self.server.get_metrics(reset))
+
+    def close(self) -> None:
+        if isinstance(self.server, FramedServerProxy):
+            self.server.close()
+
+
+class AsyncFreeCADConnection:
+    """Non-blocking facade over a bounded pool of FreeCADConnection instances.
+
+    Each call borrows an idle connection (or opens one, up to *pool_size*),
+    runs the blocking RPC on a worker thread and gives up after *timeout*
+    seconds, so a slow screenshot or execute_code never stalls the FastMCP
+    event loop and independent calls can be awaited concurrently.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 9875,
+        transport: Literal["auto", "xmlrpc", "framed"] = "auto",
+        pool_size: int = 4,
+        timeout: float = 60.0,
+        compression_threshold: int = 0,
+    ):
+        self._host = host
+        self._port = port
+        self._transport = transport
+        self._compression_threshold = compression_threshold
+        self._idle: list[FreeCADConnection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+        self.timeout = timeout
+        # Client-side round trips per method: [count, total seconds, max seconds]
+        self._round_trips: dict[str, list[float]] = {}
+
+    def _connect(self) -> FreeCADConnection:
+        # Socket timeout slightly above the call timeout, so abandoned calls
+        # eventually free their thread
+        return FreeCADConnection(
+            self._host,
+            self._port,
+            self._transport,
+            timeout=self.timeout + 5,
+            compression_threshold=self._compression_threshold,
+        )
+
+    async def _call(self, method: str, *args: Any, timeout: float | None = None) -> Any:
+        start = time.perf_counter()
+        try:
+            with tracing.span(f"rpc {method}", tracing.SPAN_KIND_CLIENT, **{"rpc.method": method}):
+                return await self._call_pooled(method, args, timeout)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self._round_trips.setdefault(method, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+
+    def round_trip_stats(self, reset: bool = False) -> dict[str, dict[str, float]]:
+        """Client-side latency per method, including pool waits and transport."""
+        stats = {
+            method: {"count": n, "mean_ms": 1000.0 * total / n, "max_ms": 1000.0 * peak}
+            for method, (n, total, peak) in sorted(self._round_trips.items())
+            if n
+        }
+        if reset:
+            self._round_trips.clear()
+        return stats
+
+    async def _call_pooled(self, method: str, args: tuple[Any, ...], timeout: float | None) -> Any:
+        timeout = timeout if timeout is not None else self.timeout
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else await asyncio.to_thread(self._connect)
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.to_thread(getattr(conn, method), *args), timeout
+                )
+            except TimeoutError:
+                await asyncio.to_thread(conn.close)
+                raise TimeoutError(
+                    f"FreeCAD did not answer '{method}' within {timeout:g} s"
+                ) from None
+            except (xmlrpc.client.Fault, FramedRPCError):
+                # The addon answered; the connection is still usable
+                self._idle.append(conn)
+                raise
+            except BaseException:
+                # Timed out, cancelled or transport failure: the connection may
+                # still be mid-call, so drop it instead of reusing it
+                await asyncio.to_thread(conn.close)
+                raise
+            self._idle.append(conn)
+            return result
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    async def ping(self) -> bool:
+        return cast(bool, await self._call("ping"))
+
+    async def create_document(self, name: str) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("create_document", name))
+
+    async def create_object(self, doc_name: str, obj_data: dict[str, Any]) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("create_object", doc_name, obj_data))
+
+    async def edit_object(
+        self, doc_name: str, obj_name: str, obj_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        return cast(
+            dict[str, Any], await self._call("edit_object", doc_name, obj_name, obj_data)
+        )
+
+    async def delete_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("delete_object", doc_name, obj_name))
+
+    async def batch(
+        self, doc_name: str, ops: list[dict[str, Any]], on_error: str = "rollback"
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("batch", doc_name, ops, on_error))
+
+    async def insert_part_from_library(self, relative_path: str) -> dict[str, Any]:
+        return cast(
+            dict[str, Any], await self._call("insert_part_from_library", relative_path)
+        )
+
+    async def execute_code(self, code: str) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("execute_code", code))
+
+    async def submit_job(self, kind: str, params: dict[str, Any]) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("submit_job", kind, params))
+
+    async def job_status(self, job_id: str) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("job_status", job_id))
+
+    async def job_result(self, job_id: str) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("job_result", job_id))
+
+    async def cancel_job(self, job_id: str) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("cancel_job", job_id))
+
+    async def supports_screenshots(self) -> bool:
+        try:
+            return cast(bool, await self._call("supports_screenshots"))
+        except Exception as e:
+            logger.error(f"Error checking screenshot support: {e}")
+            return False
+
+    async def capture_screenshot(
+        self,
+        view_name: str = "Isometric",
+        width: int | None = None,
+        height: int | None = None,
+        focus_object: str | None = None,
+        background_color: str = "white",
+    ) -> bytes | None:
+        try:
+            return cast(
+                bytes | None,
+                await self._call(
+                    "capture_screenshot",
+                    view_name, width, height, focus_object, background_color,
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Error getting screenshot: {e}")
+            return None
+
+    async def get_active_screenshot(
+        self,
+        view_name: str = "Isometric",
+        width: int | None = None,
+        height: int | None = None,
+        focus_object: str | None = None,
+        background_color: str = "white",
+    ) -> bytes | None:
+        if not await self.supports_screenshots():
+            return None
+        return await self.capture_screenshot(
+            view_name, width, height, focus_object, background_color
+        )
+
+    async def get_objects(
+        self,
+        doc_name: str,
+        summary_only: bool = True,
+        since: str | None = None,
+        fields: list[str] | None = None,
+        type_filter: str | list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        order_by: str | None = None,
+        columnar: bool = False,
+    ) -> dict[str, Any]:
+        return cast(
+            dict[str, Any],
+            await self._call(
+                "get_objects", doc_name, summary_only, since, fields, type_filter, offset, limit, order_by,
+                columnar,
+            ),
+        )
+
+    async def get_object(
+        self, doc_name: str, obj_name: str, fields: list[str] | None = None
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("get_object", doc_name, obj_name, fields))
+
+    async def get_mesh(
+        self, doc_name: str, objects: list[str] | None = None, tolerance: float | str = "medium"
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("get_mesh", doc_name, objects, tolerance))
+
+    async def query_region(
+        self,
+        doc_name: str,
+        low: list[float | None],
+        high: list[float | None],
+        contained: bool = False,
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("query_region", doc_name, low, high, contained))
+
+    async def query_nearby(
+        self,
+        doc_name: str,
+        target: str | list[float],
+        radius: float | None = None,
+        k: int | None = None,
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("query_nearby", doc_name, target, radius, k))
+
+    async def get_dependency_graph(
+        self, doc_name: str, root: str | None = None, depth: int | None = None
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("get_dependency_graph", doc_name, root, depth))
+
+    async def get_downstream_impact(
+        self, doc_name: str, names: str | list[str], depth: int | None = None
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("get_downstream_impact", doc_name, names, depth))
+
+    async def get_document_fingerprint(
+        self, doc_name: str, objects: bool | list[str] | None = None
+    ) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("get_document_fingerprint", doc_name, objects))
+
+    async def get_parts_list(self) -> list[str]:
+        return cast(list[str], await self._call("get_parts_list"))
+
+    async def list_documents(self) -> list[str]:
+        return cast(list[str], await self._call("list_documents"))
+
+    async def get_metrics(self, reset: bool = False) -> dict[str, Any]:
+        return cast(dict[str, Any], await self._call("get_metrics", reset))
+
+
+class _Worker:
+    """One headless FreeCAD process and the connection to it."""
+
+    def __init__(self, index: int, port: int, framed_port: int, log_path: str):
+        self.index = index
+        self.port = port
+        self.framed_port = framed_port
+        self.log_path = log_path
+        self.process: asyncio.subprocess.Process | None = None
+        self.conn: AsyncFreeCADConnection | None = None
+        self.documents: set[str] = set()
+        self.in_flight = 0
+        self.failures = 0
+
+    @property
+    def load(self) -> tuple[int, int]:
+        return len(self.documents), self.in_flight
+
+
+class FreeCADWorkerPool(AsyncFreeCADConnection):
+    """Spreads documents over a pool of headless FreeCAD processes.
+
+    Each worker is ``FreeCADCmd`` running the addon's headless server on its
+    own port pair. A document is pinned to the worker that created it
+    (``create_document`` picks the least-loaded one), and every call naming
+    a document is routed there, so independent documents are modelled in
+    parallel on separate cores. Calls without a document (``execute_code``,
+    screenshots, parts library) go to the worker of the most recently used
+    document. A background task pings every worker and restarts crashed or
+    hung ones; documents that lived on a restarted worker are lost.
+    """
+
+    # Methods whose first argument is the document name
+    _DOC_METHODS = frozenset(
+        {
+            "create_object", "edit_object", "delete_object", "batch", "get_objects", "get_object",
+            "get_mesh", "query_region", "query_nearby", "get_dependency_graph", "get_downstream_impact",
+            "get_document_fingerprint",
+        }
+    )
+    _JOB_METHODS = frozenset({"job_status", "job_result", "cancel_job"})
+
+    def __init__(
+        self,
+        workers: int,
+        freecad_cmd: str = "FreeCADCmd",
+        base_port: int = 9900,
+        transport: Literal["auto", "xmlrpc", "framed"] = "auto",
+        pool_size: int = 4,
+        timeout: float = 60.0,
+        health_interval: float = 10.0,
+        startup_timeout: float = 120.0,
+        compression_threshold: int = 0,
+    ):
+        super().__init__("localhost", base_port, transport, pool_size, timeout, compression_threshold)
+        self._pool_size = pool_size
+        self._cmd = shlex.split(freecad_cmd)
+        self._log_dir = tempfile.mkdtemp(prefix="freecad_mcp_workers_")
+        self._workers = [
+            _Worker(i, base_port + 2 * i, base_port + 2 * i + 1,
+                    os.path.join(self._log_dir, f"worker{i}.log"))
+            for i in range(workers)
+        ]
+        self._affinity: dict[str, _Worker] = {}
+        self._jobs: dict[str, _Worker] = {}
+        self._lost: set[str] = set()
+        self._active = self._workers[0]
+        self._health_interval = health_interval
+        self._startup_timeout = startup_timeout
+        self._health_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        await asyncio.gather(*(self._spawn(w) for w in self._workers))
+        self._health_task = asyncio.create_task(self._health_loop())
+        logger.info(
+            f"Started {len(self._workers)} FreeCAD workers on ports "
+            f"{self._workers[0].port}-{self._workers[-1].framed_port} (logs in {self._log_dir})"
+        )
+
+    async def _spawn(self, worker: _Worker) -> None:
+        env = dict(
+            os.environ,
+            FREECAD_MCP_PORT=str(worker.port),
+            FREECAD_MCP_FRAMED_PORT=str(worker.framed_port),
+        )
+        with open(worker.log_path, "ab") as log:
+            worker.process = await asyncio.create_subprocess_exec(
+                *self._cmd, "-c", "from rpc_server.headless import main; main()",
+                env=env, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+            )
+        worker.conn = AsyncFreeCADConnection(
+            "localhost",
+            worker.port,
+            self._transport,
+            self._pool_size,
+            self.timeout,
+            self._compression_threshold,
+        )
+        deadline = time.monotonic() + self._startup_timeout
+        while True:
+            if worker.process.returncode is not None:
+                raise RuntimeError(
+                    f"FreeCAD worker {worker.index} exited with code "
+                    f"{worker.process.returncode}; see {worker.log_path}"
+                )
+            try:
+                if await worker.conn._call_pooled("ping", (), 2.0):
+                    break
+            except Exception:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"FreeCAD worker {worker.index} did not start within "
+                    f"{self._startup_timeout:g} s; see {worker.log_path}"
+                )
+            await asyncio.sleep(0.5)
+        worker.failures = 0
+
+    async def _stop_worker(self, worker: _Worker) -> None:
+        if worker.conn is not None:
+            await worker.conn.close()
+            worker.conn = None
+        process, worker.process = worker.process, None
+        if process is not None and process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), 10)
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+
+    async def _restart(self, worker: _Worker) -> None:
+        lost = sorted(worker.documents)
+        for doc_name in lost:
+            self._affinity.pop(doc_name, None)
+            self._lost.add(doc_name)
+        worker.documents.clear()
+        self._jobs = {j: w for j, w in self._jobs.items() if w is not worker}
+        logger.warning(
+            f"Restarting FreeCAD worker {worker.index}"
+            + (f"; lost documents: {', '.join(lost)}" if lost else "")
+        )
+        await self._stop_worker(worker)
+        await self._spawn(worker)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            for worker in self._workers:
+                exited = worker.process is None or worker.process.returncode is not None
+                if not exited:
+                    try:
+                        assert worker.conn is not None
+                        await worker.conn._call_pooled("ping", (), 5.0)
+                        worker.failures = 0
+                        continue
+                    except Exception:
+                        worker.failures += 1
+                if exited or worker.failures >= 2:
+                    try:
+                        await self._restart(worker)
+                    except Exception as e:
+                        logger.error(f"Failed to restart FreeCAD worker {worker.index}: {e}")
+
+    async def _refresh_affinity(self) -> None:
+        """Pick up documents opened behind the pool's back (e.g. by execute_code)."""
+        listings = await asyncio.gather(
+            *(w.conn._call_pooled("list_documents", (), None) for w in self._workers if w.conn),
+            return_exceptions=True,
+        )
+        for worker, docs in zip([w for w in self._workers if w.conn], listings):
+            if isinstance(docs, BaseException):
+                continue
+            for doc_name in docs:
+                self._affinity.setdefault(doc_name, worker)
+                worker.documents.add(doc_name)
+
+    async def _worker_for_document(self, doc_name: str) -> _Worker:
+        worker = self._affinity.get(doc_name)
+        if worker is None:
+            await self._refresh_affinity()
+            worker = self._affinity.get(doc_name)
+        if worker is None:
+            if doc_name in self._lost:
+                raise LookupError(
+                    f"Document '{doc_name}' was lost when its FreeCAD worker restarted"
+                )
+            raise LookupError(f"Document '{doc_name}' is not open on any FreeCAD worker")
+        return worker
+
+    async def _route(self, method: str, args: tuple[Any, ...]) -> _Worker:
+        if method == "create_document":
+            worker = self._affinity.get(args[0]) or min(self._workers, key=lambda w: w.load)
+        elif method in self._DOC_METHODS:
+            worker = await self._worker_for_document(args[0])
+        elif method == "submit_job" and args[0] == "create_object":
+            worker = await self._worker_for_document(args[1].get("doc_name", ""))
+        elif method in self._JOB_METHODS:
+            return self._jobs.get(args[0], self._active)
+        else:
+            return self._active
+        self._active = worker
+        return worker
+
+    async def _call_pooled(self, method: str, args: tuple[Any, ...], timeout: float | None) -> Any:
+        worker = await self._route(method, args)
+        if worker.conn is None:
+            raise ConnectionError(f"FreeCAD worker {worker.index} is restarting")
+        worker.in_flight += 1
+        try:
+            result = await worker.conn._call_pooled(method, args, timeout)
+        finally:
+            worker.in_flight -= 1
+        if isinstance(result, dict) and result.get("success"):
+            if method == "create_document":
+                self._affinity[args[0]] = worker
+                self._lost.discard(args[0])
+                worker.documents.add(args[0])
+            elif method == "submit_job":
+                self._jobs[result["job_id"]] = worker
+        return result
+
+    async def ping(self) -> bool:
+        results = await asyncio.gather(
+            *(w.conn._call_pooled("ping", (), 5.0) for w in self._workers if w.conn),
+            return_exceptions=True,
+        )
+        return len(results) == len(self._workers) and all(r is True for r in results)
+
+    async def list_documents(self) -> list[str]:
+        await self._refresh_affinity()
+        return sorted(self._affinity)
+
+    async def get_metrics(self, reset: bool = False) -> dict[str, Any]:
+        results = await asyncio.gather(
+            *(w.conn._call_pooled("get_metrics", (reset,), None) for w in self._workers if w.conn),
+            return_exceptions=True,
+        )
+        workers: dict[str, Any] = {}
+        for worker, res in zip([w for w in self._workers if w.conn], results):
+            if isinstance(res, BaseException):
+                res = {"error": str(res)}
+            res["documents"] = sorted(worker.documents)
+            workers[str(worker.index)] = res
+        return {"workers": workers}
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        await asyncio.gather(*(self._stop_worker(w) for w in self._workers))
+        shutil.rmtree(self._log_dir, ignore_errors=True)
+
+
+async def _with_screenshot(
+    freecad: AsyncFreeCADConnection, call: Awaitable[T], capture: bool
+) -> tuple[T, bytes | None]:
+    """Await *call*, then capture a screenshot if *capture* is set.
+
+    The screenshot-support probe does not depend on the call's outcome, so it
+    runs concurrently with it; only the capture itself waits for the call.
+    """
+    if not capture:
+        return await call, None
+    result, supported = await asyncio.gather(call, freecad.supports_screenshots())
+    screenshot = await freecad.capture_screenshot() if supported else None
+    return result, screenshot
+
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     try:
         logger.info("FreeCADMCP server starting up")
         try:
-            _ = get_freecad_connection()
+            _ = await get_freecad_connection()
             logger.info("Successfully connected to FreeCAD on startup")
         except Exception as e:
             logger.warning(f"Could not connect to FreeCAD on startup: {str(e)}")
@@ -148,30 +940,66 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         global _freecad_connection, _session_dir
         if _freecad_connection:
             logger.info("Disconnecting from FreeCAD on shutdown")
+            await _freecad_connection.close()
             _freecad_connection = None
         if _session_dir and os.path.isdir(_session_dir):
             shutil.rmtree(_session_dir, ignore_errors=True)
-            logger.info(f"Cleaned up screenshot session dir: {_session_dir}")
+            logger.info(f"Cleaned up session dir: {_session_dir}")
             _session_dir = None
         logger.info("FreeCADMCP server shut down")
 
 
-mcp = FastMCP(
+class _TracedFastMCP(FastMCP):
+    """FastMCP that opens a root trace span for every tool call."""
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        with tracing.span(f"tool {name}", tracing.SPAN_KIND_SERVER, **{"mcp.tool": name}):
+            return await super().call_tool(name, arguments)
+
+
+mcp = _TracedFastMCP(
     "FreeCADMCP",
     instructions="FreeCAD integration through the Model Context Protocol",
     lifespan=server_lifespan,
 )
 
 
-_freecad_connection: FreeCADConnection | None = None
+_freecad_connection: AsyncFreeCADConnection | None = None
 
 
-def get_freecad_connection() -> FreeCADConnection:
+async def get_freecad_connection() -> AsyncFreeCADConnection:
     """Get or create a persistent FreeCAD connection"""
     global _freecad_connection
+    if _freecad_connection is None and _worker_count > 0:
+        pool = FreeCADWorkerPool(
+            _worker_count,
+            freecad_cmd=_worker_cmd,
+            base_port=_worker_base_port,
+            transport=_rpc_transport,
+            pool_size=_rpc_pool_size,
+            timeout=_rpc_timeout,
+            compression_threshold=_rpc_compression_threshold,
+        )
+        try:
+            await pool.start()
+        except Exception as e:
+            await pool.close()
+            raise Exception(f"Failed to start FreeCAD workers: {e}") from e
+        _freecad_connection = pool
     if _freecad_connection is None:
-        _freecad_connection = FreeCADConnection(host=_rpc_host, port=9875)
-        if not _freecad_connection.ping():
+        _freecad_connection = AsyncFreeCADConnection(
+            host=_rpc_host,
+            port=9875,
+            transport=_rpc_transport,
+            pool_size=_rpc_pool_size,
+            timeout=_rpc_timeout,
+            compression_threshold=_rpc_compression_threshold,
+        )
+        try:
+            alive = await _freecad_connection.ping()
+        except Exception:
+            alive = False
+        if not alive:
             logger.error("Failed to ping FreeCAD")
             _freecad_connection = None
             raise Exception(
@@ -201,26 +1029,66 @@ def _is_cli_client(ctx: Context) -> bool:
     return "code" in _detected_client_name.lower()
 
 
-def _save_screenshot_file(screenshot_b64: str) -> str:
-    """Decode and save a base64 screenshot to a temp file. Returns the file path.
+def _session_path(filename: str) -> str:
+    """Path of *filename* in the per-session temp directory, removed on server shutdown."""
+    global _session_dir
+    if _session_dir is None:
+        _session_dir = tempfile.mkdtemp(prefix="freecad_mcp_")
+    return os.path.join(_session_dir, filename)
+
+
+async def _document_fingerprint(freecad: AsyncFreeCADConnection, doc_name: str) -> str | None:
+    """The document's fingerprint, or None when the addon cannot give one (older addon)."""
+    try:
+        result = await freecad.get_document_fingerprint(doc_name)
+    except Exception as e:
+        logger.debug(f"No fingerprint for {doc_name!r}: {e}")
+        return None
+    return cast(str | None, result.get("fingerprint")) if result.get("success") else None
+
+
+def _cached_response(key: tuple[Any, ...], fingerprint: str | None) -> list[str] | None:
+    """Response texts stored under *key* at *fingerprint*, if any."""
+    entry = _response_cache.get(key)
+    if fingerprint is None or entry is None or entry[0] != fingerprint:
+        return None
+    _response_cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_response(key: tuple[Any, ...], fingerprint: str | None, texts: list[str]) -> None:
+    if fingerprint is None:
+        return
+    _response_cache[key] = (fingerprint, texts)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def _save_screenshot_file(screenshot: bytes) -> str:
+    """Save a webp screenshot to a temp file. Returns the file path.
 
     Files are written to a per-session temp directory and cleaned up on server shutdown.
     This allows Claude Code CLI to load the image via its Read tool.
     """
-    global _session_dir, _screenshot_count
-    if _session_dir is None:
-        _session_dir = tempfile.mkdtemp(prefix="freecad_mcp_")
+    global _screenshot_count
     _screenshot_count += 1
-    path = os.path.join(_session_dir, f"screenshot_{_screenshot_count:04d}.webp")
+    path = _session_path(f"screenshot_{_screenshot_count:04d}.webp")
     with open(path, "wb") as f:
-        f.write(base64.b64decode(screenshot_b64))
+        f.write(screenshot)
     return path
 
 
+def _image_content(screenshot: bytes) -> ImageContent:
+    return ImageContent(
+        type="image", data=base64.b64encode(screenshot).decode("ascii"), mimeType="image/webp"
+    )
+
+
 # Helper function to safely add screenshot to response
 def add_screenshot_if_available(
     response: list[TextContent],
-    screenshot: str | None,
+    screenshot: bytes | None,
     ctx: Context,
     screenshot_attempted: bool = True,
 ) -> list[TextContent | ImageContent]:
@@ -235,9 +1103,7 @@ def add_screenshot_if_available(
             path = _save_screenshot_file(screenshot)
             result.append(TextContent(type="text", text=f"Screenshot: {path}"))
         else:
-            result.append(
-                ImageContent(type="image", data=screenshot, mimeType="image/webp")
-            )
+            result.append(_image_content(screenshot))
     elif screenshot_attempted and not _only_text_feedback:
         # Screenshot was requested but the view doesn't support it (e.g. TechDraw, Spreadsheet)
         result.append(
@@ -250,8 +1116,23 @@ def add_screenshot_if_available(
     return result
 
 
+async def _start_background_job(
+    freecad: AsyncFreeCADConnection, kind: str, params: dict[str, Any]
+) -> list[TextContent | ImageContent]:
+    res = await freecad.submit_job(kind, params)
+    if not res["success"]:
+        return [TextContent(type="text", text=f"Failed to start job: {res['error']}")]
+    return [
+        TextContent(
+            type="text",
+            text=f"Started background job '{res['job_id']}'. "
+            "Poll it with job_status() and fetch the outcome with job_result().",
+        )
+    ]
+
+
 def _call_gemini(
-    image_b64: str, question: str, before_analysis: str | None = None
+    image: bytes, question: str, before_analysis: str | None = None
 ) -> str | None:
     """Send a screenshot to Gemini CLI. Returns analysis text, or None if CLI unavailable."""
     gemini_path = shutil.which("gemini")
@@ -261,7 +1142,7 @@ def _call_gemini(
     img_path = f"/tmp/freecad_mcp_{uuid.uuid4().hex[:8]}.webp"
     try:
         with open(img_path, "wb") as f:
-            f.write(base64.b64decode(image_b64))
+            f.write(image)
 
         if before_analysis:
             prompt = (
@@ -287,7 +1168,7 @@ def _call_gemini(
 
 
 @mcp.tool()
-def create_document(ctx: Context, name: str) -> list[TextContent]:
+async def create_document(ctx: Context, name: str) -> list[TextContent]:
     """Create a new document in FreeCAD.
 
     Args:
@@ -304,9 +1185,9 @@ def create_document(ctx: Context, name: str) -> list[TextContent]:
         }
         ```
     """
-    freecad = get_freecad_connection()
+    freecad = await get_freecad_connection()
     try:
-        res = freecad.create_document(name)
+        res = await freecad.create_document(name)
         if res["success"]:
             return [
                 TextContent(
@@ -326,7 +1207,7 @@ def create_document(ctx: Context, name: str) -> list[TextContent]:
 
 
 @mcp.tool()
-def create_object(
+async def create_object(
     ctx: Context,
     doc_name: str,
     obj_type: str,
@@ -334,6 +1215,7 @@ def create_object(
     analysis_name: str | None = None,
     obj_properties: dict[str, Any] | None = None,
     capture_screenshot: bool = True,
+    background: bool = False,
 ) -> list[TextContent | ImageContent]:
     """Create a new object in FreeCAD.
     Object type is starts with "Part::" or "Draft::" or "PartDesign::" or "Fem::".
@@ -343,6 +1225,8 @@ def create_object(
         obj_type: The type of the object to create (e.g. 'Part::Box', 'Part::Cylinder', 'Draft::Circle', 'PartDesign::Body', etc.).
         obj_name: The name of the object to create.
         obj_properties: The properties of the object to create.
+        background: Run as a background job and return a job id immediately. Use for
+            slow operations such as FEM meshes; poll with job_status()/job_result().
 
     Returns:
         A message indicating the success or failure of the object creation and a screenshot of the object.
@@ -450,7 +1334,7 @@ def create_object(
         }
         ```
     """
-    freecad = get_freecad_connection()
+    freecad = await get_freecad_connection()
     try:
         obj_data = {
             "Name": obj_name,
@@ -458,11 +1342,14 @@ def create_object(
             "Properties": obj_properties or {},
             "Analysis": analysis_name,
         }
-        res = freecad.create_object(doc_name, obj_data)
-        screenshot = (
-            freecad.get_active_screenshot()
-            if (capture_screenshot and not _only_text_feedback)
-            else None
+        if background:
+            return await _start_background_job(
+                freecad, "create_object", {"doc_name": doc_name, "obj_data": obj_data}
+            )
+        res, screenshot = await _with_screenshot(
+            freecad,
+            freecad.create_object(doc_name, obj_data),
+            capture_screenshot and not _only_text_feedback,
         )
 
         if res["success"]:
@@ -486,7 +1373,7 @@ def create_object(
 
 
 @mcp.tool()
-def edit_object(
+async def edit_object(
     ctx: Context,
     doc_name: str,
     obj_name: str,
@@ -504,13 +1391,12 @@ def edit_object(
     Returns:
         A message indicating the success or failure of the object editing and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
+    freecad = await get_freecad_connection()
     try:
-        res = freecad.edit_object(doc_name, obj_name, {"Properties": obj_properties})
-        screenshot = (
-            freecad.get_active_screenshot()
-            if (capture_screenshot and not _only_text_feedback)
-            else None
+        res, screenshot = await _with_screenshot(
+            freecad,
+            freecad.edit_object(doc_name, obj_name, {"Properties": obj_properties}),
+            capture_screenshot and not _only_text_feedback,
         )
 
         if res["success"]:
@@ -532,7 +1418,7 @@ def edit_object(
 
 
 @mcp.tool()
-def delete_object(
+async def delete_object(
     ctx: Context,
     doc_name: str,
     obj_name: str,
@@ -547,13 +1433,12 @@ def delete_object(
     Returns:
         A message indicating the success or failure of the object deletion and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
+    freecad = await get_freecad_connection()
     try:
-        res = freecad.delete_object(doc_name, obj_name)
-        screenshot = (
-            freecad.get_active_screenshot()
-            if (capture_screenshot and not _only_text_feedback)
-            else None
+        res, screenshot = await _with_screenshot(
+            freecad,
+            freecad.delete_object(doc_name, obj_name),
+            capture_screenshot and not _only_text_feedback,
         )
 
         if res["success"]:
@@ -577,10 +1462,82 @@ def delete_object(
 
 
 @mcp.tool()
-def execute_code(
+async def batch_operations(
+    ctx: Context,
+    doc_name: str,
+    operations: list[dict[str, Any]],
+    on_error: Literal["rollback", "continue"] = "rollback",
+    capture_screenshot: bool = True,
+) -> list[TextContent | ImageContent]:
+    """Create, edit and delete many objects in one call with a single recompute.
+
+    Prefer this over repeated create_object/edit_object/delete_object calls when
+    building or changing several objects at once: all operations run in one
+    document transaction and the document is recomputed only once at the end.
+
+    Args:
+        doc_name: The name of the document to operate on.
+        operations: Ordered list of operations. Each has an "Op" of "create", "edit"
+            or "delete" and a "Name". Create operations take "Type", "Properties" and
+            optionally "Analysis" (as in create_object); edit operations take "Properties".
+        on_error: "rollback" stops at the first failing operation and undoes the whole
+            batch; "continue" applies every operation and reports failures individually.
+        capture_screenshot: Whether to return a screenshot after the batch.
+
+    Returns:
+        A per-operation result list and a screenshot of the document.
+
+    Examples:
+        Create two boxes and move an existing cylinder in one call.
+        ```json
+        {
+            "doc_name": "MyDocument",
+            "operations": [
+                {"Op": "create", "Name": "Box1", "Type": "Part::Box", "Properties": {"Length": 10}},
+                {"Op": "create", "Name": "Box2", "Type": "Part::Box", "Properties": {"Length": 20}},
+                {"Op": "edit", "Name": "Cylinder", "Properties": {"Placement": {"Base": {"x": 5, "y": 0, "z": 0}}}},
+                {"Op": "delete", "Name": "OldSketch"}
+            ]
+        }
+        ```
+    """
+    freecad = await get_freecad_connection()
+    try:
+        res, screenshot = await _with_screenshot(
+            freecad,
+            freecad.batch(doc_name, operations, on_error),
+            capture_screenshot and not _only_text_feedback,
+        )
+
+        if "results" not in res:
+            response = [
+                TextContent(type="text", text=f"Failed to apply batch: {res['error']}"),
+            ]
+            return add_screenshot_if_available(response, screenshot, ctx, screenshot_attempted=capture_screenshot)
+
+        succeeded = sum(1 for r in res["results"] if r["success"])
+        if res["success"]:
+            summary = f"Batch applied successfully: {succeeded}/{len(operations)} operations"
+        elif res.get("rolled_back"):
+            summary = f"Batch rolled back, no changes applied. {res['error']}"
+        else:
+            summary = f"Batch applied with failures: {succeeded}/{len(operations)} operations succeeded"
+        response = [
+            TextContent(type="text", text=summary),
+            TextContent(type="text", text=json.dumps(res["results"])),
+        ]
+        return add_screenshot_if_available(response, screenshot, ctx, screenshot_attempted=capture_screenshot)
+    except Exception as e:
+        logger.error(f"Failed to apply batch: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to apply batch: {str(e)}")]
+
+
+@mcp.tool()
+async def execute_code(
     ctx: Context,
     code: str,
     capture_screenshot: bool = True,
+    background: bool = False,
 ) -> list[TextContent | ImageContent]:
     """Execute arbitrary Python code in FreeCAD.
 
@@ -588,17 +1545,21 @@ def execute_code(
         code: The Python code to execute.
         capture_screenshot: Whether to capture and return a screenshot after execution.
             Set to False for diagnostic/read-only queries to save tokens. Defaults to True.
+        background: Run as a background job and return a job id immediately. Use for
+            scripts that may take longer than a minute (large exports, heavy booleans);
+            poll with job_status()/job_result().
 
     Returns:
         A message indicating the success or failure of the code execution, the output of the code execution, and optionally a screenshot.
     """
-    freecad = get_freecad_connection()
+    freecad = await get_freecad_connection()
     try:
-        res = freecad.execute_code(code)
-        screenshot = (
-            freecad.get_active_screenshot()
-            if (capture_screenshot and not _only_text_feedback)
-            else None
+        if background:
+            return await _start_background_job(freecad, "execute_code", {"code": code})
+        res, screenshot = await _with_screenshot(
+            freecad,
+            freecad.execute_code(code),
+            capture_screenshot and not _only_text_feedback,
         )
 
         if res["success"]:
@@ -621,7 +1582,100 @@ def execute_code(
 
 
 @mcp.tool()
-def get_view(
+async def job_status(ctx: Context, job_id: str) -> list[TextContent]:
+    """Get the state and progress of a background job.
+
+    Args:
+        job_id: The id returned when the job was started.
+
+    Returns:
+        The job's state ("queued", "running", "succeeded", "failed" or "cancelled"),
+        progress between 0 and 1 and the current step.
+    """
+    freecad = await get_freecad_connection()
+    try:
+        res = await freecad.job_status(job_id)
+        if not res["success"]:
+            return [TextContent(type="text", text=f"Error: {res['error']}")]
+        return [
+            TextContent(
+                type="text",
+                text=f"Job '{job_id}' {res['state']} ({res['progress']:.0%}): {res['message']}",
+            )
+        ]
+    except Exception as e:
+        logger.error(f"Failed to get job status: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to get job status: {str(e)}")]
+
+
+@mcp.tool()
+async def job_result(
+    ctx: Context, job_id: str, capture_screenshot: bool = False
+) -> list[TextContent | ImageContent]:
+    """Get the outcome of a background job.
+
+    Args:
+        job_id: The id returned when the job was started.
+        capture_screenshot: Whether to return a screenshot once the job has finished.
+
+    Returns:
+        The job's result or error if it has finished, otherwise its current progress.
+    """
+    freecad = await get_freecad_connection()
+    try:
+        res = await freecad.job_result(job_id)
+        if "state" not in res:
+            return [TextContent(type="text", text=f"Error: {res['error']}")]
+        if not res["done"]:
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Job '{job_id}' is still {res['state']} ({res['progress']:.0%}): {res['message']}",
+                )
+            ]
+        if res["success"]:
+            text = f"Job '{job_id}' {res['state']}: {json.dumps(res['result'])}"
+        else:
+            text = f"Job '{job_id}' {res['state']}: {res['error']}"
+        screenshot = (
+            await freecad.get_active_screenshot()
+            if (capture_screenshot and not _only_text_feedback)
+            else None
+        )
+        return add_screenshot_if_available(
+            [TextContent(type="text", text=text)],
+            screenshot,
+            ctx,
+            screenshot_attempted=capture_screenshot,
+        )
+    except Exception as e:
+        logger.error(f"Failed to get job result: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to get job result: {str(e)}")]
+
+
+@mcp.tool()
+async def cancel_job(ctx: Context, job_id: str) -> list[TextContent]:
+    """Cancel a background job.
+
+    A job waiting for FreeCAD stops before its next step; a step that is already
+    running (e.g. a Gmsh process) is allowed to finish first.
+
+    Args:
+        job_id: The id returned when the job was started.
+    """
+    freecad = await get_freecad_connection()
+    try:
+        res = await freecad.cancel_job(job_id)
+        if not res["success"]:
+            return [TextContent(type="text", text=f"Failed to cancel job: {res['error']}")]
+        return [TextContent(type="text", text=f"Cancellation requested for job '{job_id}'")]
+    except Exception as e:
+        logger.error(f"Failed to cancel job: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to cancel job: {str(e)}")]
+
+
+@mcp.tool()
+async def get_view(
     ctx: Context,
     view_name: Literal[
         "Isometric",
@@ -665,8 +1719,8 @@ def get_view(
         return [
             TextContent(type="text", text="Screenshot not available in text-only mode.")
         ]
-    freecad = get_freecad_connection()
-    screenshot = freecad.get_active_screenshot(
+    freecad = await get_freecad_connection()
+    screenshot = await freecad.get_active_screenshot(
         view_name, width, height, focus_object, background_color
     )
 
@@ -675,7 +1729,7 @@ def get_view(
             path = _save_screenshot_file(screenshot)
             return [TextContent(type="text", text=f"Screenshot: {path}")]
         else:
-            return [ImageContent(type="image", data=screenshot, mimeType="image/webp")]
+            return [_image_content(screenshot)]
     else:
         return [
             TextContent(
@@ -686,7 +1740,7 @@ def get_view(
 
 
 @mcp.tool()
-def snapshot_view(
+async def snapshot_view(
     ctx: Context,
     view_name: Literal[
         "Isometric",
@@ -721,8 +1775,8 @@ def snapshot_view(
             )
         ]
 
-    freecad = get_freecad_connection()
-    screenshot = freecad.get_active_screenshot(view_name, width, height, focus_object)
+    freecad = await get_freecad_connection()
+    screenshot = await freecad.get_active_screenshot(view_name, width, height, focus_object)
     if screenshot is None:
         return [
             TextContent(
@@ -732,7 +1786,8 @@ def snapshot_view(
         ]
 
     analysis = (
-        _call_gemini(
+        await asyncio.to_thread(
+            _call_gemini,
             screenshot,
             "Describe this FreeCAD 3D model in detail: structural elements visible, positions, colors, and spatial arrangement.",
         )
@@ -750,14 +1805,12 @@ def snapshot_view(
         path = _save_screenshot_file(screenshot)
         result.append(TextContent(type="text", text=f"Screenshot: {path}"))
     else:
-        result.append(
-            ImageContent(type="image", data=screenshot, mimeType="image/webp")
-        )
+        result.append(_image_content(screenshot))
     return result
 
 
 @mcp.tool()
-def analyze_view(
+async def analyze_view(
     ctx: Context,
     view_name: Literal[
         "Isometric",
@@ -799,8 +1852,8 @@ def analyze_view(
             )
         ]
 
-    freecad = get_freecad_connection()
-    screenshot = freecad.get_active_screenshot(view_name, width, height, focus_object)
+    freecad = await get_freecad_connection()
+    screenshot = await freecad.get_active_screenshot(view_name, width, height, focus_object)
     if screenshot is None:
         return [
             TextContent(
@@ -813,7 +1866,7 @@ def analyze_view(
     if compare_to_snapshot and view_name in _snapshots:
         _, before_analysis = _snapshots[view_name]
 
-    analysis = _call_gemini(screenshot, question, before_analysis)
+    analysis = await asyncio.to_thread(_call_gemini, screenshot, question, before_analysis)
 
     if _is_cli_client(ctx):
         path = _save_screenshot_file(screenshot)
@@ -821,7 +1874,7 @@ def analyze_view(
             TextContent(type="text", text=f"Screenshot: {path}")
         ]
     else:
-        result = [ImageContent(type="image", data=screenshot, mimeType="image/webp")]
+        result = [_image_content(screenshot)]
     if analysis:
         result.append(
             TextContent(type="text", text=f"**Gemini visual analysis:**\n\n{analysis}")
@@ -841,7 +1894,7 @@ def analyze_view(
 
 
 @mcp.tool()
-def insert_part_from_library(
+async def insert_part_from_library(
     ctx: Context,
     relative_path: str,
     capture_screenshot: bool = False,
@@ -854,13 +1907,12 @@ def insert_part_from_library(
     Returns:
         A message indicating the success or failure of the part insertion and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
+    freecad = await get_freecad_connection()
     try:
-        res = freecad.insert_part_from_library(relative_path)
-        screenshot = (
-            freecad.get_active_screenshot()
-            if (capture_screenshot and not _only_text_feedback)
-            else None
+        res, screenshot = await _with_screenshot(
+            freecad,
+            freecad.insert_part_from_library(relative_path),
+            capture_screenshot and not _only_text_feedback,
         )
 
         if res["success"]:
@@ -892,11 +1944,18 @@ def insert_part_from_library(
 
 
 @mcp.tool()
-def get_objects(
+async def get_objects(
     ctx: Context,
     doc_name: str,
     detailed: bool = False,
     capture_screenshot: bool = False,
+    since: str | None = None,
+    fields: list[str] | None = None,
+    type_filter: str | list[str] | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+    order_by: str | None = None,
+    table: bool = False,
 ) -> list[TextContent | ImageContent]:
     """Get all objects in a document.
     You can use this tool to get the objects in a document to see what you can check or edit.
@@ -906,30 +1965,109 @@ def get_objects(
     inspect specific property values across many objects, as it is significantly larger.
     For full details on a single object, prefer get_object() instead.
 
+    Every listing ends with a change token. Pass it back as since= to get only the objects
+    added, changed or removed after that listing, plus a new token. If the result says
+    "reset": true, the token was too old and "added" holds every object.
+
+    To read a few properties of many objects, pass fields (e.g. ["Placement", "Length"]):
+    each object then holds only Name and those fields, which is much cheaper than detailed=True.
+
+    For long listings pass table=True: objects come back as a tab-separated table (a header
+    of column names such as Placement.Base or Shape.Volume, then one line per object), a
+    fraction of the size of the JSON.
+
     Args:
         doc_name: The name of the document to get the objects from.
         detailed: When True, include all object properties. Defaults to False (summary only).
+        since: Change token from an earlier get_objects call.
+        fields: Property names to return per object instead of the summary or full dump.
+        type_filter: Only objects of this TypeId or list of TypeIds, including derived
+            types (e.g. "Part::Feature" matches every Part object).
+        offset: Skip this many matching objects (for paging).
+        limit: Return at most this many objects; the result says where the next page starts.
+        order_by: Property or dotted path to sort by (e.g. "Label", "Shape.Volume");
+            prefix with "-" for descending.
+        table: Return a dense table instead of JSON objects.
 
     Returns:
-        A list of objects in the document and a screenshot of the document.
+        A list of objects in the document (or the changes since the token) and a screenshot of the document.
     """
-    freecad = get_freecad_connection()
+    freecad = await get_freecad_connection()
+    capture = capture_screenshot and not _only_text_feedback
     try:
-        result = freecad.get_objects(doc_name, summary_only=not detailed)
+        # Listings are reused while the document is unchanged; detailed ones
+        # and ViewObject projections carry view data, which the fingerprint
+        # does not cover. The separate fingerprint probe is only sent when
+        # there is an entry to reuse.
+        cache_key: tuple[Any, ...] | None = None
+        if since is None and not detailed and not (fields and "ViewObject" in fields):
+            cache_key = (
+                "get_objects", doc_name, tuple(fields) if fields else None,
+                type_filter if isinstance(type_filter, str) or type_filter is None else tuple(type_filter),
+                offset, limit, order_by, table,
+            )
+        if cache_key is not None and cache_key in _response_cache:
+            fingerprint = await _document_fingerprint(freecad, doc_name)
+            texts = _cached_response(cache_key, fingerprint)
+            if texts is not None:
+                screenshot = None
+                if capture and await freecad.supports_screenshots():
+                    screenshot = await freecad.capture_screenshot()
+                return add_screenshot_if_available(
+                    [TextContent(type="text", text=text) for text in texts],
+                    screenshot, ctx, screenshot_attempted=capture_screenshot,
+                )
+        result, screenshot = await _with_screenshot(
+            freecad,
+            freecad.get_objects(
+                doc_name,
+                summary_only=not detailed,
+                since=since,
+                fields=fields,
+                type_filter=type_filter,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                columnar=table,
+            ),
+            capture,
+        )
         if not result.get("success", False):
             return [
                 TextContent(
                     type="text", text=f"Error: {result.get('error', 'Unknown error')}"
                 )
             ]
-        screenshot = (
-            freecad.get_active_screenshot()
-            if (capture_screenshot and not _only_text_feedback)
-            else None
-        )
-        response = [
-            TextContent(type="text", text=json.dumps(result["objects"])),
-        ]
+        if since is not None and table:
+            parts = [f"Change token: {result['token']}"]
+            if result.get("reset"):
+                parts.append("Token too old; every object is listed as added.")
+            for key in ("added", "changed"):
+                if result[key]["count"]:
+                    parts.append(f"{key.capitalize()}:\n{render_table(result[key])}")
+            if result["removed"]:
+                parts.append(f"Removed: {', '.join(result['removed'])}")
+            response = [TextContent(type="text", text="\n\n".join(parts))]
+        elif since is not None:
+            delta = {k: result[k] for k in ("token", "reset", "added", "changed", "removed") if k in result}
+            response = [TextContent(type="text", text=json.dumps(delta))]
+        else:
+            objects = result["objects"]
+            shown = objects["count"] if table else len(objects)
+            text = render_table(objects) if table else json.dumps(objects)
+            response = [TextContent(type="text", text=text)]
+            if "next_offset" in result:
+                response.append(
+                    TextContent(
+                        type="text",
+                        text=f"Showing {shown} of {result['total']} objects; "
+                        f"pass offset={result['next_offset']} for the next page.",
+                    )
+                )
+            if "token" in result:
+                response.append(TextContent(type="text", text=f"Change token: {result['token']}"))
+            if cache_key is not None:
+                _cache_response(cache_key, result.get("fingerprint"), [item.text for item in response])
         return add_screenshot_if_available(
             response, screenshot, ctx, screenshot_attempted=capture_screenshot
         )
@@ -939,38 +2077,50 @@ def get_objects(
 
 
 @mcp.tool()
-def get_object(
+async def get_object(
     ctx: Context,
     doc_name: str,
-    obj_name: str,
+    obj_name: str | list[str],
     capture_screenshot: bool = False,
+    fields: list[str] | None = None,
 ) -> list[TextContent | ImageContent]:
     """Get an object from a document.
     You can use this tool to get the properties of an object to see what you can check or edit.
 
     Args:
         doc_name: The name of the document to get the object from.
-        obj_name: The name of the object to get.
+        obj_name: The name of the object to get, or a list of names to fetch several
+            objects in one call.
+        fields: Only return these properties (plus Name), e.g. ["Placement", "Length"].
 
     Returns:
-        The object and a screenshot of the object.
+        The object (or a list of objects when a list of names is given) and a screenshot of the object.
     """
-    freecad = get_freecad_connection()
+    freecad = await get_freecad_connection()
     try:
-        result = freecad.get_object(doc_name, obj_name)
-        if not result.get("success", False):
-            return [
-                TextContent(
-                    type="text", text=f"Error: {result.get('error', 'Unknown error')}"
-                )
-            ]
-        screenshot = (
-            freecad.get_active_screenshot()
-            if (capture_screenshot and not _only_text_feedback)
-            else None
+        names = [obj_name] if isinstance(obj_name, str) else obj_name
+        results, screenshot = await _with_screenshot(
+            freecad,
+            asyncio.gather(*(freecad.get_object(doc_name, name, fields) for name in names)),
+            capture_screenshot and not _only_text_feedback,
         )
+        if isinstance(obj_name, str):
+            result = results[0]
+            if not result.get("success", False):
+                return [
+                    TextContent(
+                        type="text", text=f"Error: {result.get('error', 'Unknown error')}"
+                    )
+                ]
+            payload: Any = result["object"]
+        else:
+            payload = [
+                r["object"] if r.get("success", False)
+                else {"Name": name, "error": r.get("error", "Unknown error")}
+                for name, r in zip(names, results)
+            ]
         response = [
-            TextContent(type="text", text=json.dumps(result["object"])),
+            TextContent(type="text", text=json.dumps(payload)),
         ]
         return add_screenshot_if_available(
             response, screenshot, ctx, screenshot_attempted=capture_screenshot
@@ -981,10 +2131,263 @@ def get_object(
 
 
 @mcp.tool()
-def get_parts_list(ctx: Context) -> list[TextContent]:
+async def get_mesh(
+    ctx: Context,
+    doc_name: str,
+    object_names: list[str] | None = None,
+    tolerance: float | str = "medium",
+) -> list[TextContent]:
+    """Tessellate objects into triangle meshes and save them as a binary glTF (.glb) file.
+
+    Use this when a screenshot or the summary numbers are not enough: to measure clearances,
+    centroids or extents from the actual geometry with numpy or trimesh, or to open the model
+    in a 3D viewer. Each object becomes a named mesh with float32 vertices in millimetres
+    (FreeCAD coordinates) and uint32 triangle indices; the file's root node converts to
+    glTF's metres and Y-up axis. The file is kept until the MCP server stops.
+
+    Args:
+        doc_name: The name of the document.
+        object_names: Objects to mesh. Defaults to every visible object with a shape.
+        tolerance: Maximum deviation from the true surface in millimetres, or a level of
+            detail relative to each object's size: "coarse", "medium" (default) or "fine".
+
+    Returns:
+        Vertex and triangle counts, the tolerance used and the bounding box per object,
+        and the path of the .glb file.
+    """
+    global _mesh_count
+    freecad = await get_freecad_connection()
+    try:
+        # The same meshes are not fetched again while the document is unchanged
+        cache_key = ("get_mesh", doc_name, tuple(object_names) if object_names else None, tolerance)
+        if cache_key in _response_cache:
+            texts = _cached_response(cache_key, await _document_fingerprint(freecad, doc_name))
+            if texts is not None and all(
+                os.path.exists(text.removeprefix("Mesh file: ")) for text in texts[1:]
+            ):
+                return [TextContent(type="text", text=text) for text in texts]
+        result = await freecad.get_mesh(doc_name, object_names, tolerance)
+        if not result.get("success", False):
+            return [
+                TextContent(
+                    type="text", text=f"Error: {result.get('error', 'Unknown error')}"
+                )
+            ]
+        meshes = result["meshes"]
+        summary = [
+            {k: v for k, v in mesh.items() if k not in ("vertices", "triangles")}
+            for mesh in meshes
+        ]
+        response = [TextContent(type="text", text=json.dumps(summary))]
+        if any(mesh.get("triangle_count") for mesh in meshes):
+            _mesh_count += 1
+            path = _session_path(f"mesh_{_mesh_count:04d}.glb")
+            with open(path, "wb") as f:
+                f.write(to_glb(meshes))
+            response.append(TextContent(type="text", text=f"Mesh file: {path}"))
+        _cache_response(cache_key, result.get("fingerprint"), [item.text for item in response])
+        return response
+    except Exception as e:
+        logger.error(f"Failed to get mesh: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to get mesh: {str(e)}")]
+
+
+@mcp.tool()
+async def find_objects_in_region(
+    ctx: Context,
+    doc_name: str,
+    box_min: list[float | None],
+    box_max: list[float | None],
+    contained: bool = False,
+) -> list[TextContent]:
+    """Find the objects whose bounding box overlaps a region, without listing the whole document.
+
+    Use this for questions like "what overlaps this volume" or "is anything above z=100".
+
+    Args:
+        doc_name: The name of the document.
+        box_min: [x, y, z] lower corner in millimetres. Use null for an unbounded side,
+            e.g. box_min=[null, null, 100] with box_max=[null, null, null] finds
+            everything reaching above z=100.
+        box_max: [x, y, z] upper corner in millimetres, null for unbounded.
+        contained: Only return objects whose bounding box lies entirely inside the region.
+
+    Returns:
+        Names and bounding boxes ([xmin, ymin, zmin, xmax, ymax, zmax]) of the matching objects.
+    """
+    freecad = await get_freecad_connection()
+    try:
+        result = await freecad.query_region(doc_name, box_min, box_max, contained)
+        if not result.get("success", False):
+            return [
+                TextContent(
+                    type="text", text=f"Error: {result.get('error', 'Unknown error')}"
+                )
+            ]
+        return [TextContent(type="text", text=json.dumps(result["objects"]))]
+    except Exception as e:
+        logger.error(f"Failed to query region: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to query region: {str(e)}")]
+
+
+@mcp.tool()
+async def find_nearby_objects(
+    ctx: Context,
+    doc_name: str,
+    near: str | list[float],
+    radius: float | None = None,
+    k: int | None = None,
+) -> list[TextContent]:
+    """Find the objects closest to an object or point, nearest first.
+
+    Use this for questions like "what is near X" or "what is within 5 mm of this point".
+    Distances are between bounding boxes (0 when they overlap), so they never exceed the
+    true gap between the shapes.
+
+    Args:
+        doc_name: The name of the document.
+        near: An object name, or an [x, y, z] point in millimetres.
+        radius: Only objects within this distance in millimetres.
+        k: At most this many objects. Defaults to 10 when radius is not given.
+
+    Returns:
+        Names, distances and bounding boxes of the nearby objects.
+    """
+    freecad = await get_freecad_connection()
+    try:
+        result = await freecad.query_nearby(doc_name, near, radius, k)
+        if not result.get("success", False):
+            return [
+                TextContent(
+                    type="text", text=f"Error: {result.get('error', 'Unknown error')}"
+                )
+            ]
+        return [TextContent(type="text", text=json.dumps(result["objects"]))]
+    except Exception as e:
+        logger.error(f"Failed to query nearby objects: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to query nearby objects: {str(e)}")]
+
+
+@mcp.tool()
+async def get_dependency_graph(
+    ctx: Context,
+    doc_name: str,
+    root: str | None = None,
+    depth: int | None = None,
+) -> list[TextContent]:
+    """Get which objects depend on which, in one call instead of one get_object per object.
+
+    The graph is returned compactly: "names" lists the objects, and the objects that
+    names[i] depends on (its OutList: base features, sketches, tools) are
+    names[j] for each j in targets[offsets[i]:offsets[i+1]].
+
+    Args:
+        doc_name: The name of the document.
+        root: Only return this object and what it is built from.
+        depth: With root, follow at most this many links.
+
+    Returns:
+        {"names": [...], "offsets": [...], "targets": [...]}
+    """
+    freecad = await get_freecad_connection()
+    try:
+        result = await freecad.get_dependency_graph(doc_name, root, depth)
+        if not result.get("success", False):
+            return [
+                TextContent(
+                    type="text", text=f"Error: {result.get('error', 'Unknown error')}"
+                )
+            ]
+        graph = {k: result[k] for k in ("names", "offsets", "targets")}
+        return [TextContent(type="text", text=json.dumps(graph, separators=(",", ":")))]
+    except Exception as e:
+        logger.error(f"Failed to get dependency graph: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to get dependency graph: {str(e)}")]
+
+
+@mcp.tool()
+async def get_downstream_impact(
+    ctx: Context,
+    doc_name: str,
+    object_names: str | list[str],
+    depth: int | None = None,
+) -> list[TextContent]:
+    """List the objects that a change to the given objects will invalidate.
+
+    Use this before editing a sketch or base feature to know which objects to re-read
+    or check afterwards, instead of re-reading the whole document.
+
+    Args:
+        doc_name: The name of the document.
+        object_names: The object (or list of objects) about to change.
+        depth: Follow at most this many links.
+
+    Returns:
+        The given objects and everything depending on them, in recompute order (each
+        object after the ones it depends on), with each one's link distance.
+    """
+    freecad = await get_freecad_connection()
+    try:
+        result = await freecad.get_downstream_impact(doc_name, object_names, depth)
+        if not result.get("success", False):
+            return [
+                TextContent(
+                    type="text", text=f"Error: {result.get('error', 'Unknown error')}"
+                )
+            ]
+        impact = [
+            {"name": name, "distance": distance}
+            for name, distance in zip(result["names"], result["distance"])
+        ]
+        return [TextContent(type="text", text=json.dumps(impact))]
+    except Exception as e:
+        logger.error(f"Failed to get downstream impact: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to get downstream impact: {str(e)}")]
+
+
+@mcp.tool()
+async def get_document_fingerprint(
+    ctx: Context,
+    doc_name: str,
+    object_names: bool | list[str] = False,
+) -> list[TextContent]:
+    """Get a short hash of a document's state, to check whether anything changed.
+
+    Call this after an edit, or before re-reading objects or taking a screenshot: if the
+    fingerprint equals the one you saw last, no object was created, changed, deleted or
+    recomputed since, and what you read then is still current. Much cheaper than
+    get_objects. View-only changes (colors, camera) do not change it.
+
+    Args:
+        doc_name: The name of the document.
+        object_names: True to also get a fingerprint per object, or a list of object names
+            to get only theirs; compare them to see which objects changed.
+
+    Returns:
+        The fingerprint and the change token to pass to get_objects(since=...), plus the
+        per-object fingerprints when asked.
+    """
+    freecad = await get_freecad_connection()
+    try:
+        result = await freecad.get_document_fingerprint(doc_name, object_names or None)
+        if not result.get("success", False):
+            return [
+                TextContent(
+                    type="text", text=f"Error: {result.get('error', 'Unknown error')}"
+                )
+            ]
+        fingerprint = {k: result[k] for k in ("fingerprint", "token", "objects") if k in result}
+        return [TextContent(type="text", text=json.dumps(fingerprint))]
+    except Exception as e:
+        logger.error(f"Failed to get document fingerprint: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to get document fingerprint: {str(e)}")]
+
+
+@mcp.tool()
+async def get_parts_list(ctx: Context) -> list[TextContent]:
     """Get the list of parts in the parts library addon."""
-    freecad = get_freecad_connection()
-    parts = freecad.get_parts_list()
+    freecad = await get_freecad_connection()
+    parts = await freecad.get_parts_list()
     if parts:
         return [TextContent(type="text", text=json.dumps(parts))]
     else:
@@ -997,17 +2400,40 @@ def get_parts_list(ctx: Context) -> list[TextContent]:
 
 
 @mcp.tool()
-def list_documents(ctx: Context) -> list[TextContent]:
+async def list_documents(ctx: Context) -> list[TextContent]:
     """Get the list of open documents in FreeCAD.
 
     Returns:
         A list of document names.
     """
-    freecad = get_freecad_connection()
-    docs = freecad.list_documents()
+    freecad = await get_freecad_connection()
+    docs = await freecad.list_documents()
     return [TextContent(type="text", text=json.dumps(docs))]
 
 
+@mcp.tool()
+async def get_metrics(ctx: Context, reset: bool = False) -> list[TextContent]:
+    """Get latency metrics from the FreeCAD RPC server and this MCP server.
+
+    Use this to diagnose slow calls. For each RPC method, the addon reports
+    time spent per phase in milliseconds: decode, admission, queue_wait,
+    gui, recompute, serialize, tessellate, screenshot, encode and call (end
+    to end). It also reports GUI-thread utilization and GUI queue depth. The
+    client section adds round-trip times measured from this MCP server.
+
+    Args:
+        reset: Clear all counters after reading them, to measure a fresh window.
+    """
+    freecad = await get_freecad_connection()
+    try:
+        res = await freecad.get_metrics(reset)
+        res["client"] = freecad.round_trip_stats(reset)
+        return [TextContent(type="text", text=json.dumps(res))]
+    except Exception as e:
+        logger.error(f"Failed to get metrics: {str(e)}")
+        return [TextContent(type="text", text=f"Failed to get metrics: {str(e)}")]
+
+
 @mcp.prompt()
 def asset_creation_strategy() -> str:
     return """
@@ -1015,7 +2441,7 @@ Asset Creation Strategy for FreeCAD MCP
 
 When creating content in FreeCAD, always follow these steps:
 
-0. Before starting any task, always use get_objects() to confirm the current state of the document.
+0. Before starting any task, always use get_objects() to confirm the current state of the document. If you already listed it, pass the change token from that listing as since= to fetch only what changed.
 
 1. Utilize the parts library:
    - Check available parts using get_parts_list().
@@ -1024,6 +2450,7 @@ When creating content in FreeCAD, always follow these steps:
 2. If the appropriate asset is not available in the parts library:
    - Create basic shapes (e.g., cubes, cylinders, spheres) using create_object().
    - Adjust and define detailed properties of the shapes as necessary using edit_object().
+   - When creating or editing several objects at once, use batch_operations() to apply them in one call.
 
 3. Always assign clear and descriptive names to objects when adding them to the document.
 
@@ -1059,7 +2486,9 @@ def _validate_host(value: str) -> str:
 
 def main() -> None:
     """Run the MCP server"""
-    global _only_text_feedback, _rpc_host
+    global _only_text_feedback, _rpc_host, _rpc_transport, _rpc_timeout, _rpc_pool_size
+    global _rpc_compression_threshold
+    global _worker_count, _worker_cmd, _worker_base_port
     import argparse
 
     parser = argparse.ArgumentParser()
@@ -1072,9 +2501,75 @@ def main() -> None:
         default="localhost",
         help="Host address of the FreeCAD RPC server to connect to (default: localhost)",
     )
+    parser.add_argument(
+        "--rpc-timeout",
+        type=float,
+        default=60.0,
+        help="Seconds to wait for a single FreeCAD RPC call (default: 60)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=4,
+        help="Max concurrent RPC connections to FreeCAD (default: 4)",
+    )
+    parser.add_argument(
+        "--compression-threshold",
+        type=int,
+        default=1024,
+        help="Compress RPC requests and responses larger than this many bytes "
+        "with gzip or zstd, as the addon supports; 0 disables (default: 1024)",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["auto", "xmlrpc", "framed"],
+        default="auto",
+        help="RPC transport: 'auto' uses the addon's framed binary transport when "
+        "available and falls back to XML-RPC (default: auto)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Run this many headless FreeCAD worker processes and spread documents "
+        "across them, instead of connecting to a running FreeCAD (default: 0)",
+    )
+    parser.add_argument(
+        "--freecad-cmd",
+        default=_worker_cmd,
+        help="Command that starts a headless FreeCAD for --workers "
+        "(default: $FREECAD_CMD or FreeCADCmd)",
+    )
+    parser.add_argument(
+        "--worker-base-port",
+        type=int,
+        default=9900,
+        help="First port for --workers; each worker uses two consecutive ports (default: 9900)",
+    )
+    parser.add_argument(
+        "--trace-file",
+        default=None,
+        help="Append OTLP-shaped JSON-lines trace spans for every tool call to this file",
+    )
     args = parser.parse_args()
     _only_text_feedback = args.only_text_feedback
     _rpc_host = args.host
+    _rpc_transport = args.transport
+    _rpc_timeout = args.rpc_timeout
+    _rpc_compression_threshold = max(0, args.compression_threshold)
+    _rpc_pool_size = max(1, args.pool_size)
+    _worker_count = max(0, args.workers)
+    _worker_cmd = args.freecad_cmd
+    _worker_base_port = args.worker_base_port
+    if args.trace_file:
+        try:
+            tracing.configure(args.trace_file)
+            logger.info(f"Writing trace spans to: {args.trace_file}")
+        except OSError as e:
+            logger.error(f"Tracing disabled, cannot open {args.trace_file}: {e}")
     logger.info(f"Only text feedback: {_only_text_feedback}")
-    logger.info(f"Connecting to FreeCAD RPC server at: {_rpc_host}")
+    if _worker_count:
+        logger.info(f"Running {_worker_count} headless FreeCAD workers via: {_worker_cmd}")
+    else:
+        logger.info(f"Connecting to FreeCAD RPC server at: {_rpc_host}")
     mcp.run()
@@ -0,0 +1,171 @@
+"""Lightweight tracing with W3C trace context propagation.
+
+Spans are written as JSON lines, one OTLP ``ResourceSpans`` object per line
+(the shape of the OpenTelemetry collector's file exporter), so a trace file
+can be loaded into any OTLP-aware tool. The current span lives in a
+``ContextVar``; ``asyncio.to_thread`` copies it, so the blocking RPC call
+sees the span of the tool that made it and sends it to the addon as a
+``traceparent`` (HTTP header on XML-RPC, request field on the framed
+transport). The addon writes its spans with the same trace ids.
+
+Tracing is off until :func:`configure` is given a file path.
+"""
+
+import contextlib
+import contextvars
+import json
+import queue
+import random
+import threading
+import time
+from typing import Any, Iterator
+
+SERVICE_NAME = "freecad-mcp"
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "freecad_mcp_span", default=None
+)
+_exporter: "_JsonLinesExporter | None" = None
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "start_ns", "attributes")
+
+    trace_id: str
+    span_id: str
+    parent_id: str
+    name: str
+    kind: int
+    start_ns: int
+    attributes: dict[str, Any]
+
+    def __init__(self, name: str, kind: int, parent: "Span | None", attributes: dict[str, Any]):
+        self.trace_id = parent.trace_id if parent else _new_id(128)
+        self.span_id = _new_id(64)
+        self.parent_id = parent.span_id if parent else ""
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.attributes = attributes
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        typed: dict[str, Any] = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+class _JsonLinesExporter:
+    """Appends finished spans to *path* from a background thread."""
+
+    def __init__(self, path: str):
+        # Opened here so a bad path fails configure() rather than the writer thread
+        self._file = open(path, "a", encoding="utf-8")
+        self._queue: queue.SimpleQueue[dict[str, Any] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span, end_ns: int, error: str | None) -> None:
+        otlp_span: dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "parentSpanId": span.parent_id,
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": [_attribute(k, v) for k, v in span.attributes.items()],
+            "status": {"code": _STATUS_ERROR, "message": error} if error else {"code": _STATUS_OK},
+        }
+        self._queue.put(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+                        "scopeSpans": [{"scope": {"name": __name__}, "spans": [otlp_span]}],
+                    }
+                ]
+            }
+        )
+
+    def _run(self) -> None:
+        with self._file as f:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    return
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                if self._queue.empty():
+                    f.flush()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+
+def configure(path: str | None) -> None:
+    """Start writing spans to *path*; ``None`` turns tracing off.
+
+    Raises OSError if *path* cannot be opened, leaving tracing off.
+    """
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+        _exporter = None
+    if path:
+        _exporter = _JsonLinesExporter(path)
+
+
+def enabled() -> bool:
+    return _exporter is not None
+
+
+def current_traceparent() -> str | None:
+    span = _current_span.get()
+    return span.traceparent if span is not None else None
+
+
+@contextlib.contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Span | None]:
+    """Record a span around the block, as a child of the current span."""
+    if _exporter is None:
+        yield None
+        return
+    current = Span(name, kind, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export(current, time.time_ns(), error)